@@ -3,7 +3,10 @@ from m4.ApplicationConfiguration import ApplicationConfiguration
 from m4.util.LogHandler import LogHandler
 from m4.dao.DataSourceError import DataSourceError
 from m4.process.ProcessException import ProcessException
-from m4.dao.OracleDataSource import OracleDataSource
+from m4.dao.AbstractDataSource import AbstractDataSource
+from m4.dao.CachedDataSource import CachedDataSource
+from m4.dao.FileDataSource import FileDataSource
+from m4.dao.SQLiteDataSource import SQLiteDataSource
 from m4.FactorySimulator import FactorySimulator
 
 """
@@ -33,9 +36,30 @@ if __name__ == '__main__':
         logger.error("생산 시뮬레이션 정보가 초기화되지 않았습니다.")
         sys.exit(1)
 
+    # Data Source 종류 (oracle / file / sqlite)
+    data_source_type: str = config.find('DatabaseSource', 'ds.type', 'oracle').lower()
+
+    # 기준 정보 snapshot 사용 여부 (offline 일 경우 Oracle 에 접속하지 않고 snapshot 만으로 실행)
+    use_cache: bool = str(config.find('Cache', 'cache.enabled', 'False')).lower() == 'true'
+    use_offline: bool = use_cache and str(config.find('Cache', 'cache.offline', 'False')).lower() == 'true'
+
     try:
-        data_source: OracleDataSource = OracleDataSource.instance()
-        data_source.init(config)
+        data_source: AbstractDataSource = None
+        if data_source_type == 'file':
+            data_source = FileDataSource.instance()
+            data_source.init(config)
+        elif data_source_type == 'sqlite':
+            data_source = SQLiteDataSource.instance()
+            data_source.init(config)
+        elif not use_offline:
+            # cx_Oracle 이 없는 환경에서도 File Data Source 로 실행할 수 있도록 사용 시에만 import
+            from m4.dao.OracleDataSource import OracleDataSource
+            data_source = OracleDataSource.instance()
+            data_source.init(config)
+        if use_cache:
+            cached_data_source: CachedDataSource = CachedDataSource.instance()
+            cached_data_source.init(config, plan_version_id, simulation_id, data_source)
+            data_source = cached_data_source
         config.init_code(data_source)
 
         simulator: FactorySimulator = FactorySimulator.instance()
@@ -47,6 +71,14 @@ if __name__ == '__main__':
         # Run Forward Simulation
         simulator.forward(data_source)
 
+        # 시뮬레이션이 정상 종료된 경우에만 새로 조회된 기준 정보를 snapshot 에 저장
+        if use_cache:
+            data_source.save()
+
+        # File Data Source 의 경우 저장(INSERT)된 결과 테이블을 CSV 파일로 저장
+        if data_source_type == 'file':
+            data_source.close()
+
     except DataSourceError as e:
         logger.error(e)
     except ProcessException as e:
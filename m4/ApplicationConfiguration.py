@@ -33,15 +33,26 @@ class ApplicationConfiguration(SingletonInstance):
         """
         self._config.read(os.path.join(self.PROPERTIES_FILE_PATH, properties_file))
 
-    def find(self, section, name):
+    def find(self, section, name, default=None):
         """
         섹션명, 설정명으로 설정 검색
         :param section: 섹션명(그룹)
         :param name: 설정명(코드명)
+        :param default: 설정이 없을 경우 반환할 기본값, None 이면 설정이 없을 때 KeyError
         :return: 설정값(코드값)
         """
+        if default is not None:
+            return self._config.get(section, name, fallback=default)
         return self._config[section][name]
 
+    def has_section(self, section):
+        """
+        섹션 존재 여부
+        :param section: 섹션명(그룹)
+        :return: bool
+        """
+        return self._config.has_section(section)
+
     def find_section(self, section):
         """
          섹션명으로 설정 검색
@@ -10,6 +10,7 @@ from m4.dao.PlanVersionDAO import PlanVersionDAO
 from m4.dao.SimulationDAO import SimulationDAO
 from m4.dao.WorkOrderDAO import WorkOrderDAO
 from m4.process.WorkOrder import WorkOrder
+from m4.process.ItemEventLog import ItemEventLog
 from m4.manager.FactoryBuilder import FactoryBuilder
 from m4.manager.FactoryManager import FactoryManager
 from m4.manager.ScheduleManager import ScheduleManager
@@ -34,6 +35,14 @@ class FactorySimulator(SingletonInstance):
         self._factory_manager: FactoryManager = FactoryManager.instance()  # Simulator 전체 runTime 범위 관리하는 ScheduleManager 객체
         # Backward Planner
         self._backward_planner: BackwardPlanner = BackwardPlanner()
+        # Forward 진행 방식 : tick (매 시점 실행) / event (상태 변경이 없는 시점들은 건너뛰며 실행)
+        self._forward_engine: str = 'tick'
+        # snapshot 저장 여부, 기록 간격 (0 이면 상태 변경 시에만 기록) 및 한 번에 저장할 snapshot 행 수
+        self._snapshot_enabled: bool = False
+        self._snapshot_interval: int = 0
+        self._snapshot_batch_size: int = 1000
+        # Resource Work History 저장 시 한 번에 저장할 행 수
+        self._history_batch_size: int = 1000
 
         self.backward_step_plan_result: list = []
         self.backward_step_plan_by_loc: dict = {}
@@ -42,6 +51,15 @@ class FactorySimulator(SingletonInstance):
     def init(self, plan_version_id: str, simulation_id: str, config: ApplicationConfiguration, data_source: AbstractDataSource):
         session: AbstractSession = data_source.get_session()
 
+        self._forward_engine = config.find('Forward', 'forward.engine', 'tick')
+        self._snapshot_enabled = str(config.find('Monitor', 'monitor.snapshot.enabled', 'False')).lower() == 'true'
+        self._snapshot_interval = int(config.find('Monitor', 'monitor.snapshot.interval', '0'))
+        self._snapshot_batch_size = int(config.find('Monitor', 'monitor.snapshot.batch', '1000'))
+        self._history_batch_size = int(config.find('Monitor', 'monitor.history.batch', '1000'))
+
+        # Item 이력 저장소 초기화 (이전 시뮬레이션에서 쌓인 이력 제거) 및 이력 기록 수준(none / resource / full) 설정
+        ItemEventLog.instance().init(config.find('Forward', 'forward.trace.level', ItemEventLog.TRACE_FULL))
+
         plan_version_dao = PlanVersionDAO.instance()
         self._plan_version_dict = plan_version_dao.map(plan_version_dao.instance().select_one(session, plan_version_id=plan_version_id))[0]
         simulation_dao = SimulationDAO.instance()
@@ -54,17 +72,24 @@ class FactorySimulator(SingletonInstance):
         self._factory_manager.init(FactoryBuilder.build(plan_version_dict=self._plan_version_dict,
                                                         simulation_dict=self._simulation_dict,
                                                         config=config,
-                                                        session=session))
+                                                        session=session,
+                                                        data_source=data_source))
 
         # Factory 인스턴스에 세팅된 기준 정보(DB)로부터 파생되는 정보 계산 및 반영
         self._factory_manager.init_derivative_information()
 
+        # 공장 및 Resource 일정 제약을 시뮬레이션 기간에 대한 비가용 구간 timeline 으로 compile
+        # (종료 시점은 time sequence 마지막 시점까지 포함되도록 한 스텝 뒤로)
+        self._factory_manager.init_schedule_timeline(
+            self._schedule_manager.get_start_date(),
+            self._schedule_manager.get(self._schedule_manager.length())['date'])
+
         # Backward Planner
         self._backward_planner.init(self._factory_manager.get_factory(), config)
 
         work_orders = []
         work_order_dao = WorkOrderDAO.instance()
-        work_order_data = work_order_dao.map(work_order_dao.select(session, plan_version_id=plan_version_id))
+        work_order_data = work_order_dao.map_iter(work_order_dao.select(session, plan_version_id=plan_version_id, stream=True))
         for info in work_order_data:
             order: WorkOrder = WorkOrder()
             order.init(info)
@@ -73,6 +98,91 @@ class FactorySimulator(SingletonInstance):
 
         session.close()
 
+    def _forward_tick(self, factory_manager: FactoryManager, monitor: SimulationMonitor):
+        """
+        tick 방식 Forward : time sequence 의 모든 시점에 대해 차례로 run, transfer 실행
+        :param factory_manager: FactoryManager 인스턴스
+        :param monitor: SimulationMonitor 인스턴스
+        :return: void
+        """
+
+        # number_of_digits = 콘솔 출력용 자릿수 값
+        # 예를 들어 calendar 갯수가 86400 개라고 하면,
+        # number_of_digits 값은 5 가 됨.
+        # 콘솔에 출력 시 00000 ~ 86400 으로 캘린더 번호의 자릿수를 맞추기 위한 변수
+        horizon: int = self._schedule_manager.length()
+        number_of_digits: int = math.floor(math.log(horizon, 10)) + 1
+
+        # 다음 시간 정보가 있는 한 계속 시간을 앞으로 보내도록 설계
+        while self._schedule_manager.has_next():
+            time: dict = self._schedule_manager.next()
+            self._logger.debug(time)
+
+            # 현재 캘린더의 리스트 내 위치 index 를 문자열 Formatting     ex: 00000 ~ 86400
+            # idx_string: str = "%0{}d".format(number_of_digits) % time["index"]
+
+            # 현재 RunTime 정보를 Console 에 출력
+            # self._logger.debug(f"[{idx_string}] {time['date']}")
+
+            # FactoryManager 인스턴스를 통해 Factory 내 각 operator 들의 시간 진행 상태를 1 tick
+            # Todo: 공장 달력 상 Off Day 일 경우 기존에 진행 중이던 작업들을
+            #   Work Divisibility 옵션에 따라 작업 진행도를 tick 할지 말지 판단
+            factory_manager.run(run_time=time)
+
+            # available, fetch, put
+            # - 공장 달력 상 Off Day 가 아닐 경우에만 Route 간 Item 이동 및 할당이 이루어지도록
+            # - Item 의 이동 및 할당은 곧 다음 Route 에 대한 새 작업 할당인 셈인데,
+            #   Work Divisibility 가 어떻게 설정 되어있든 간에 현재 시각이 Off Day 이면 새 작업을 시작할 수 없기 때문
+            # Todo: 다만 지금이 Off Day 는 아니지만 Off Day 가 곧 다가오는 경우는
+            #   Work Divisibility 옵션에 따라 작업 transfer 및 할당 동작이 실행되도록 설계 필요
+            factory_manager.transfer(run_time=time)
+
+            # 현재 RunTime 에서의 시뮬레이션 상황 snapshot 저장
+            monitor.snapshot(time)
+
+    def _forward_event(self, factory_manager: FactoryManager, monitor: SimulationMonitor):
+        """
+        event 방식 Forward : 상태 변경이 일어날 수 있는 시점들만 run, transfer 실행
+        - 직전 시점에 상태 변경(put, fetch, 도착, 작업 시작/완료)이 있었으면 바로 다음 시점 실행
+        - 상태 변경이 없었으면 진행 중인 Runtime 의 완료 시점 / 일정 상태 경계 시점 중 가장 이른 시점으로 이동
+        - 건너뛴 시점들의 Runtime 진행은 fast_forward 로 한 번에 반영
+        tick 방식과 동일한 결과를 만들도록 설계
+        :param factory_manager: FactoryManager 인스턴스
+        :param monitor: SimulationMonitor 인스턴스
+        :return: void
+        """
+
+        self._schedule_manager.goto_first()
+
+        next_index: int = 0 if self._schedule_manager.has_next() else None
+        while next_index is not None:
+            time: dict = self._schedule_manager.jump(next_index)
+            self._logger.debug(time)
+
+            # 공장 달력 / 공장 일정 제약 / Resource 일정 제약 상태가 바뀌는 다음 시점은 항상 실행 대상
+            self._schedule_manager.push_event(self._schedule_manager.get_next_off_day_boundary(time['index']))
+            schedule_boundary = factory_manager.get_next_schedule_boundary(time['date'])
+            if schedule_boundary is not None:
+                self._schedule_manager.push_event(self._schedule_manager.get_index(schedule_boundary))
+
+            event_count: int = factory_manager.get_event_count()
+            factory_manager.run(run_time=time)
+            factory_manager.transfer(run_time=time)
+
+            # 현재 RunTime 에서의 시뮬레이션 상황 snapshot 저장
+            monitor.snapshot(time)
+
+            if factory_manager.get_event_count() != event_count:
+                # 상태 변경이 있었으면 다음 시점에 새 할당이 가능할 수 있으므로 바로 다음 시점 실행
+                next_index = time['index'] + 1 if self._schedule_manager.has_next() else None
+            else:
+                # 상태 변경이 없었으면 가장 먼저 완료될 Runtime 의 시점 등록 후 가장 이른 event 시점으로 이동
+                self._schedule_manager.push_event(factory_manager.get_next_event_index(time['index']))
+                next_index = self._schedule_manager.pop_event()
+
+            if next_index is not None:
+                factory_manager.fast_forward(next_index - time['index'] - 1)
+
     def backward(self):
         """
 
@@ -105,7 +215,9 @@ class FactorySimulator(SingletonInstance):
         work_order_list, route_list, inventory_list, inventory_item_list, wip_list, bor_list = \
             BackwardBuilder.build(plan_version_dict=self._plan_version_dict,
                                   simulation_dict=self._simulation_dict,
-                                  session=session)
+                                  session=session,
+                                  data_source=data_source,
+                                  max_workers=int(config.find('DatabaseSource', 'ds.load.workers', '1')))
 
         setup_time_dict, proc_time_dict, move_time_dict = \
             BackwardBuilder.create_time_dict(route_list=route_list, bor_list=bor_list)
@@ -149,46 +261,23 @@ class FactorySimulator(SingletonInstance):
 
         # 싱글톤 SimulationMonitor 인스턴스 가져오기
         monitor: SimulationMonitor = SimulationMonitor.instance()
-        monitor.init(factory_manager=self._factory_manager, data_source=data_source)
+        monitor.init(factory_manager=self._factory_manager, data_source=data_source,
+                     plan_version_dict=self._plan_version_dict, simulation_dict=self._simulation_dict,
+                     interval=self._snapshot_interval, batch_size=self._snapshot_batch_size,
+                     history_batch_size=self._history_batch_size, enabled=self._snapshot_enabled)
 
         # 시뮬레이션 시작 전 상황 snapshot
         monitor.snapshot()
 
-        # number_of_digits = 콘솔 출력용 자릿수 값
-        # 예를 들어 calendar 갯수가 86400 개라고 하면,
-        # number_of_digits 값은 5 가 됨.
-        # 콘솔에 출력 시 00000 ~ 86400 으로 캘린더 번호의 자릿수를 맞추기 위한 변수
-        horizon: int = self._schedule_manager.length()
-        number_of_digits: int = math.floor(math.log(horizon, 10)) + 1
+        if self._forward_engine == 'event':
+            self._forward_event(factory_manager, monitor)
+        else:
+            self._forward_tick(factory_manager, monitor)
 
-        # 다음 시간 정보가 있는 한 계속 시간을 앞으로 보내도록 설계
-        while self._schedule_manager.has_next():
-            time: dict = self._schedule_manager.next()
-            self._logger.debug(time)
-
-            # 현재 캘린더의 리스트 내 위치 index 를 문자열 Formatting     ex: 00000 ~ 86400
-            # idx_string: str = "%0{}d".format(number_of_digits) % time["index"]
-
-            # 현재 RunTime 정보를 Console 에 출력
-            # self._logger.debug(f"[{idx_string}] {time['date']}")
-
-            # FactoryManager 인스턴스를 통해 Factory 내 각 operator 들의 시간 진행 상태를 1 tick
-            # Todo: 공장 달력 상 Off Day 일 경우 기존에 진행 중이던 작업들을
-            #   Work Divisibility 옵션에 따라 작업 진행도를 tick 할지 말지 판단
-            factory_manager.run(run_time=time)
-
-            # available, fetch, put
-            # - 공장 달력 상 Off Day 가 아닐 경우에만 Route 간 Item 이동 및 할당이 이루어지도록
-            # - Item 의 이동 및 할당은 곧 다음 Route 에 대한 새 작업 할당인 셈인데,
-            #   Work Divisibility 가 어떻게 설정 되어있든 간에 현재 시각이 Off Day 이면 새 작업을 시작할 수 없기 때문
-            # Todo: 다만 지금이 Off Day 는 아니지만 Off Day 가 곧 다가오는 경우는
-            #   Work Divisibility 옵션에 따라 작업 transfer 및 할당 동작이 실행되도록 설계 필요
-            factory_manager.transfer(run_time=time)
-
-            # 현재 RunTime 에서의 시뮬레이션 상황 snapshot 저장
-            monitor.snapshot()
+        # buffer 에 남은 snapshot 저장 및 writer thread 종료 (snapshot 저장 오류는 로그로만 남김)
+        monitor.close()
 
         # Gantt Chart 표현을 위한 Resource 별 Work History 데이터
-        res_history: list = monitor.send_res_history(self._plan_version_dict, self._simulation_dict)
+        res_history_count: int = monitor.send_res_history(self._plan_version_dict, self._simulation_dict)
 
-        print("debug point")
+        self._logger.debug(f"[FactorySimulator] forward finished : {res_history_count} resource history rows")
@@ -1,6 +1,8 @@
 from statistics import mean
 
+from m4.dao.AbstractDataSource import AbstractDataSource
 from m4.dao.AbstractSession import AbstractSession
+from m4.dao.DataLoader import DataLoader
 from m4.dao.DemandDAO import DemandDAO
 from m4.dao.RouteDAO import RouteDAO
 from m4.dao.InventoryDAO import InventoryDAO
@@ -12,8 +14,10 @@ from m4.dao.ProcessDAO import ProcessDAO
 class BackwardBuilder:
 
     @classmethod
-    def build(cls, plan_version_dict: dict, simulation_dict: dict, session: AbstractSession):
-        return cls._get_dao_data(simulation_dict=simulation_dict, session=session)
+    def build(cls, plan_version_dict: dict, simulation_dict: dict, session: AbstractSession,
+              data_source: AbstractDataSource = None, max_workers: int = 1):
+        return cls._get_dao_data(simulation_dict=simulation_dict, session=session,
+                                 data_source=data_source, max_workers=max_workers)
 
     @classmethod
     def create_time_dict(cls, route_list: list, bor_list: list):
@@ -24,35 +28,36 @@ class BackwardBuilder:
         return setup_time_dict, proc_time_dict, move_time_dict
 
     @classmethod
-    def _get_dao_data(cls, simulation_dict: dict, session: AbstractSession):
+    def _get_dao_data(cls, simulation_dict: dict, session: AbstractSession,
+                      data_source: AbstractDataSource = None, max_workers: int = 1):
         simulation_id = simulation_dict['SIM_ID']
 
-        # DemandDAO로 부터 정보 받아오기
         demand_dao: DemandDAO = DemandDAO.instance()
-        work_order_master = demand_dao.map(demand_dao.select_master(session=session))
-
-        # RouteDAO로 부터 정보 받아오기
         route_dao: RouteDAO = RouteDAO.instance()
-        route_master = route_dao.map(route_dao.select_master(session=session))
-
-        # IntenvotryDAO로 부터 정보 받아오기
         inventory_dao: InventoryDAO = InventoryDAO.instance()
-        inventory_master = inventory_dao.map(inventory_dao.select(session=session))
-
-        # InventoryItemDAO로 부터 정보 받아오기
         inventory_item_dao: InventoryItemDAO = InventoryItemDAO()
-        inventory_item_master = inventory_item_dao.map(inventory_item_dao.select_master(session=session))
-
-        # WorkInProgressDAO로 부터 정보 받아오기
         wip_dao: WorkInProgressDAO = WorkInProgressDAO()
-        wip_master = wip_dao.map(wip_dao.select_master(simulation_id=simulation_id, session=session))
-
-        # ProcessDAO로 부터 정보 받아오기
         bor_dao: ProcessDAO = ProcessDAO()
-        # bor_master = bor_dao.map(bor_dao.select_route_bor(session=session))
-        bor_master = bor_dao.map(bor_dao.select(session=session))
 
-        return work_order_master, route_master, inventory_master, inventory_item_master, wip_master, bor_master
+        # 각 DAO 조회는 서로 독립적이므로 DataLoader 로 나누어 조회
+        loaded: dict = DataLoader.load({
+            # DemandDAO로 부터 정보 받아오기
+            'work_order': lambda s: demand_dao.map(demand_dao.select_master(session=s)),
+            # RouteDAO로 부터 정보 받아오기
+            'route': lambda s: route_dao.map(route_dao.select_master(session=s)),
+            # IntenvotryDAO로 부터 정보 받아오기
+            'inventory': lambda s: inventory_dao.map(inventory_dao.select(session=s)),
+            # InventoryItemDAO로 부터 정보 받아오기
+            'inventory_item': lambda s: inventory_item_dao.map(inventory_item_dao.select_master(session=s)),
+            # WorkInProgressDAO로 부터 정보 받아오기
+            'wip': lambda s: wip_dao.map(wip_dao.select_master(simulation_id=simulation_id, session=s)),
+            # ProcessDAO로 부터 정보 받아오기
+            # 'bor': lambda s: bor_dao.map(bor_dao.select_route_bor(session=s)),
+            'bor': lambda s: bor_dao.map(bor_dao.select(session=s)),
+        }, session=session, data_source=data_source, max_workers=max_workers)
+
+        return loaded['work_order'], loaded['route'], loaded['inventory'], loaded['inventory_item'], \
+            loaded['wip'], loaded['bor']
 
     @classmethod
     def _create_setup_time_dict(cls, bor_list: list):
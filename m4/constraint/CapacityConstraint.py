@@ -24,19 +24,22 @@ class CapacityConstraint(AbstractConstraint):
             item_constraint.init(const)
             self.item_constraints[const['ITEM_ID']] = item_constraint
 
-    def check(self, item_id: str, stock: dict, quantity: float):
-        total_quantity: float = 0
-        for item_list in stock.values():
-            for item in item_list:
-                total_quantity = total_quantity + item.get_quantity()
-
+    def check(self, item_id: str, total_quantity: float, item_quantity: float, quantity: float):
+        """
+        Inventory 가 유지하는 수량 합계(재고 + 이동 중)에 quantity 를 더했을 때 Capacity 초과 여부 확인
+        :param item_id: 추가할 Item ID
+        :param total_quantity: Inventory 전체 수량 합계
+        :param item_quantity: item_id 에 해당하는 수량 합계
+        :param quantity: 추가할 수량
+        :return: 제약에 걸릴 경우 해당 Constraint, 아닐 경우 None
+        """
         if total_quantity + quantity > self.max_quantity:
             return self
 
         item_constraint: ItemConstraint = self.item_constraints.get(item_id)
         # item constraint가 있는 경우
         if item_constraint is not None:
-            return item_constraint.check(item_id, stock.get(item_id, []), quantity)
+            return item_constraint.check(item_id, item_quantity, quantity)
 
         return None
 
@@ -1,5 +1,4 @@
 from m4.constraint.AbstractConstraint import AbstractConstraint
-from m4.process.Item import Item
 
 
 class ItemConstraint(AbstractConstraint):
@@ -23,14 +22,18 @@ class ItemConstraint(AbstractConstraint):
         self._max_quantity: float = info['MAX_QTY']
         self._load_rate: float = info['LOAD_RATE']
 
-    def check(self, item_id: str, stock: list, quantity: float):
+    def check(self, item_id: str, item_quantity: float, quantity: float):
+        """
+        item_id 의 수량 합계(재고 + 이동 중)에 quantity 를 더했을 때 적재 가능 수량 초과 여부 확인
+        :param item_id: 추가할 Item ID
+        :param item_quantity: item_id 에 해당하는 수량 합계
+        :param quantity: 추가할 수량
+        :return: 제약에 걸릴 경우 self, 아닐 경우 None
+        """
         if item_id != self._item_id:
             return None
 
-        total_quantity: float = 0
-        for item in stock:
-            total_quantity = total_quantity + item.get_quantity()
-        if total_quantity + quantity > self._max_quantity * self._load_rate:
+        if item_quantity + quantity > self._max_quantity * self._load_rate:
             return self
 
         return None
@@ -1,4 +1,6 @@
+import bisect
 import datetime
+import heapq
 
 from m4.constraint.AbstractConstraint import AbstractConstraint
 from m4.constraint.TimeConstraintDay import TimeConstraintDay
@@ -29,6 +31,15 @@ class ScheduleConstraint(AbstractConstraint):
         # time constraints - priority 별로 저장
         self._time_constraints: list = []
 
+        # 비가용 구간 timeline [(lower, upper, time constraint), ...] - compile() 시 생성, 서로 겹치지 않도록 정렬
+        self._timeline: list = None
+        self._timeline_lowers: list = []        # 구간 시작 일시 목록 - bisect 조회용
+        self._timeline_bounds: list = []        # 구간 시작 / 종료 일시 목록 - 다음 경계 조회용
+        self._timeline_start: datetime.datetime = None
+        self._timeline_end: datetime.datetime = None
+        self._cursor: int = 0                   # 직전 check() 시점의 구간 위치 - 시간 순 조회 시 앞으로만 이동
+        self._cursor_date: datetime.datetime = None
+
     def init(self, schedule_data: list, max_priority: int):
         if max_priority > 0:
             # schedule constraint 배열에 priority별로 설정
@@ -43,11 +54,120 @@ class ScheduleConstraint(AbstractConstraint):
         constraint.init(info)
         return constraint
 
+    def compile(self, start_date: datetime.datetime = None, end_date: datetime.datetime = None):
+        """
+        [start_date, end_date) 기간의 비가용 구간 timeline 생성
+        여러 time constraint 가 겹치는 구간은 priority 순(같은 priority 내에서는 등록 순)으로 앞선 constraint 를 따름
+        기간을 주지 않으면 time constraint 들의 유효 기간 전체를 대상으로 함
+        :param start_date: timeline 시작 일시
+        :param end_date: timeline 종료 일시
+        :return: void
+        """
+        constraints: list = [const for time_constraints in self._time_constraints for const in time_constraints]
+        if constraints:
+            start_date = start_date or min(const.get_period()[0] for const in constraints)
+            end_date = end_date or max(const.get_period()[1] for const in constraints)
+
+        entries: list = sorted(((lower, upper, order, const)
+                                for order, const in enumerate(constraints)
+                                for lower, upper in const.get_intervals(start_date, end_date)),
+                               key=lambda x: x[0])
+        bounds: list = sorted(set(bound for entry in entries for bound in entry[:2]))
+
+        # 구간 경계로 나눈 기본 구간마다 가장 앞선 constraint 를 heap 으로 찾아 인접 구간끼리 병합
+        timeline: list = []
+        active: list = []
+        position: int = 0
+        for lower, upper in zip(bounds, bounds[1:]):
+            while position < len(entries) and entries[position][0] <= lower:
+                entry: tuple = entries[position]
+                heapq.heappush(active, (entry[2], entry[1], entry[3]))
+                position += 1
+            while active and active[0][1] <= lower:
+                heapq.heappop(active)
+            if not active:
+                continue
+            const: AbstractConstraint = active[0][2]
+            if timeline and timeline[-1][1] == lower and timeline[-1][2] is const:
+                timeline[-1] = (timeline[-1][0], upper, const)
+            else:
+                timeline.append((lower, upper, const))
+
+        self._timeline = timeline
+        self._timeline_lowers = [interval[0] for interval in timeline]
+        self._timeline_bounds = sorted(set(bound for interval in timeline for bound in interval[:2]))
+        self._timeline_start = start_date
+        self._timeline_end = end_date
+        self._cursor = 0
+        self._cursor_date = None
+
+    def _in_timeline(self, date: datetime.datetime):
+        """
+        date 가 compile 된 timeline 기간 안에 있는지 여부, compile 전이면 전체 유효 기간으로 compile
+        :param date: 조회 일시
+        :return: bool
+        """
+        if self._timeline is None:
+            self.compile()
+        if self._timeline_start is None:    # time constraint 가 없는 경우
+            return True
+        return self._timeline_start <= date < self._timeline_end
+
+    def _locate(self, date: datetime.datetime):
+        """
+        date 를 포함하거나 date 이후 가장 가까운 timeline 구간 위치
+        직전 조회 시점보다 이후 시점이면 cursor 를 앞으로만 이동 (amortized O(1)), 이전 시점이면 bisect
+        :param date: 조회 일시
+        :return: int
+        """
+        if self._cursor_date is None or date < self._cursor_date:
+            self._cursor = max(bisect.bisect_right(self._timeline_lowers, date) - 1, 0)
+        while self._cursor < len(self._timeline) and self._timeline[self._cursor][1] <= date:
+            self._cursor += 1
+        self._cursor_date = date
+        return self._cursor
+
     def check(self, date: datetime.datetime):
 
+        if self._in_timeline(date):
+            position: int = self._locate(date)
+            if position < len(self._timeline) and self._timeline[position][0] <= date:
+                return self._timeline[position][2]
+            return None
+
         for time_constraints in self._time_constraints:
             for const in time_constraints:
                 ret: AbstractConstraint = const.check(date)
                 if ret is not None:
                     return ret
         return None
+
+    def get_next_available(self, date: datetime.datetime):
+        """
+        date 시점 이후(포함) 비가용 구간에 걸리지 않는 가장 이른 일시
+        :param date: 조회 일시
+        :return: datetime.datetime
+        """
+        if not self._in_timeline(date):
+            return date if self.check(date) is None else None
+
+        position: int = self._locate(date)
+        if position == len(self._timeline) or date < self._timeline[position][0]:
+            return date
+        while position + 1 < len(self._timeline) and \
+                self._timeline[position + 1][0] == self._timeline[position][1]:
+            position += 1
+        return self._timeline[position][1]
+
+    def get_next_boundary(self, date: datetime.datetime):
+        """
+        date 시점 이후 check() 결과가 바뀔 수 있는 가장 이른 일시
+        :param date: 조회 일시
+        :return: datetime.datetime, 이후 경계가 없을 경우 None
+        """
+        if self._timeline is None:
+            self.compile()
+        position: int = bisect.bisect_right(self._timeline_bounds, date)
+        if position == len(self._timeline_bounds):
+            return None
+        return self._timeline_bounds[position]
@@ -45,6 +45,33 @@ class TimeConstraintDaily(AbstractConstraint):
                 return self
         return None
 
+    def get_intervals(self, start_date: datetime.datetime, end_date: datetime.datetime):
+        """
+        [start_date, end_date) 기간 내 비가용 구간 목록 - 매일 [LOWER_BOUND, UPPER_BOUND) 시각
+        :param start_date: 조회 시작 일시
+        :param end_date: 조회 종료 일시
+        :return: list [(lower, upper), ...]
+        """
+        start_date = max(start_date, self._start_date)
+        end_date = min(end_date, self._end_date)
+
+        intervals: list = []
+        day: datetime.datetime = datetime.datetime(start_date.year, start_date.month, start_date.day)
+        while day < end_date:
+            lower: datetime.datetime = max(start_date, day + self._lower_bound)
+            upper: datetime.datetime = min(end_date, day + self._upper_bound)
+            if lower < upper:
+                intervals.append((lower, upper))
+            day += datetime.timedelta(days=1)
+        return intervals
+
+    def get_period(self):
+        """
+        constraint 유효 기간 [START_DATE, END_DATE)
+        :return: tuple (start_date, end_date)
+        """
+        return self._start_date, self._end_date
+
     def get_factory_schedule_id(self):
         return self._factory_schedule_id
 
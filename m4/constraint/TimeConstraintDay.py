@@ -44,6 +44,24 @@ class TimeConstraintDay(AbstractConstraint):
                 return self
         return None
 
+    def get_intervals(self, start_date: datetime.datetime, end_date: datetime.datetime):
+        """
+        [start_date, end_date) 기간 내 비가용 구간 목록
+        :param start_date: 조회 시작 일시
+        :param end_date: 조회 종료 일시
+        :return: list [(lower, upper), ...]
+        """
+        lower: datetime.datetime = max(start_date, self._start_date, self._lower_bound)
+        upper: datetime.datetime = min(end_date, self._end_date, self._upper_bound)
+        return [(lower, upper)] if lower < upper else []
+
+    def get_period(self):
+        """
+        constraint 유효 기간 [START_DATE, END_DATE)
+        :return: tuple (start_date, end_date)
+        """
+        return self._start_date, self._end_date
+
     def get_factory_schedule_id(self):
         return self._factory_schedule_id
 
@@ -25,8 +25,8 @@ class TimeConstraintMonthly(AbstractConstraint):
         self._upper_bound: datetime.timedelta = None
 
     def init(self, info: dict):
-        super()._id: str = info['TM_CONST_ID']
-        super()._name: str = info['TM_CONST_NM']
+        self.id: str = info['TM_CONST_ID']
+        self.name: str = info['TM_CONST_NM']
 
         self._start_date: datetime.datetime = info['START_DATE']
         self._end_date: datetime.datetime = info['END_DATE']
@@ -46,6 +46,36 @@ class TimeConstraintMonthly(AbstractConstraint):
                 return self
         return None
 
+    def get_intervals(self, start_date: datetime.datetime, end_date: datetime.datetime):
+        """
+        [start_date, end_date) 기간 내 비가용 구간 목록 - 매월 [LOWER_BOUND, UPPER_BOUND) 일시
+        check() 의 timedelta 가 1일부터 시작하므로 월 시작 시점에서 하루를 빼서 계산
+        :param start_date: 조회 시작 일시
+        :param end_date: 조회 종료 일시
+        :return: list [(lower, upper), ...]
+        """
+        start_date = max(start_date, self._start_date)
+        end_date = min(end_date, self._end_date)
+
+        intervals: list = []
+        month: datetime.datetime = datetime.datetime(start_date.year, start_date.month, 1)
+        one_day: datetime.timedelta = datetime.timedelta(days=1)
+        while month < end_date:
+            next_month: datetime.datetime = datetime.datetime(month.year + month.month // 12, month.month % 12 + 1, 1)
+            lower: datetime.datetime = max(start_date, month, month + self._lower_bound - one_day)
+            upper: datetime.datetime = min(end_date, next_month, month + self._upper_bound - one_day)
+            if lower < upper:
+                intervals.append((lower, upper))
+            month = next_month
+        return intervals
+
+    def get_period(self):
+        """
+        constraint 유효 기간 [START_DATE, END_DATE)
+        :return: tuple (start_date, end_date)
+        """
+        return self._start_date, self._end_date
+
     def get_factory_schedule_id(self):
         return self._factory_schedule_id
 
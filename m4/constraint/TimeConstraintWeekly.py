@@ -47,6 +47,34 @@ class TimeConstraintWeekly(AbstractConstraint):
                 return self
         return None
 
+    def get_intervals(self, start_date: datetime.datetime, end_date: datetime.datetime):
+        """
+        [start_date, end_date) 기간 내 비가용 구간 목록 - 매주 (월요일 0시 기준) [LOWER_BOUND, UPPER_BOUND) 시점
+        :param start_date: 조회 시작 일시
+        :param end_date: 조회 종료 일시
+        :return: list [(lower, upper), ...]
+        """
+        start_date = max(start_date, self._start_date)
+        end_date = min(end_date, self._end_date)
+
+        intervals: list = []
+        week: datetime.datetime = datetime.datetime(start_date.year, start_date.month, start_date.day) - \
+            datetime.timedelta(days=start_date.weekday())
+        while week < end_date:
+            lower: datetime.datetime = max(start_date, week + self._lower_bound)
+            upper: datetime.datetime = min(end_date, week + self._upper_bound)
+            if lower < upper:
+                intervals.append((lower, upper))
+            week += datetime.timedelta(weeks=1)
+        return intervals
+
+    def get_period(self):
+        """
+        constraint 유효 기간 [START_DATE, END_DATE)
+        :return: tuple (start_date, end_date)
+        """
+        return self._start_date, self._end_date
+
     def get_factory_schedule_id(self):
         return self._factory_schedule_id
 
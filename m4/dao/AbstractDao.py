@@ -9,6 +9,51 @@ class AbstractDAO(metaclass=ABCMeta):
     Data Access Object 추상 클래스
     """
 
+    # DAO 클래스명 별 조회 cursor 설정 { DAO 클래스명: {"arraysize": int, "prefetchrows": int} }
+    _fetch_options: dict = {}
+
+    @classmethod
+    def init_fetch_options(cls, fetch_section: list):
+        """
+        m4.properties [Fetch] 섹션의 DAO 별 조회 cursor 설정 초기화
+        ex) RouteDAO.arraysize=5000, RouteDAO.prefetchrows=5000
+        :param fetch_section: [(설정명, 설정값), ...]
+        :return: void
+        """
+        fetch_options: dict = {}
+        for name, value in fetch_section:
+            dao_name, option = name.rsplit('.', 1)
+            fetch_options.setdefault(dao_name, {})[option] = int(value)
+        AbstractDAO._fetch_options = fetch_options
+
+    def _select(self, session: AbstractSession, sql: str, params: dict):
+        """
+        DAO 별 조회 cursor 설정(arraysize, prefetchrows)을 적용하여 세션으로 조회
+        params 에 stream=True 가 있을 경우 조회 결과 data 를 한 번에 가져오지 않고 iterator 로 반환 (select_iter)
+        :param session: AbstractSession 인스턴스
+        :param sql: sql string
+        :param params: sql 파라미터 데이터
+        :return: {"columns" : columns, "data" : list 또는 iterator}
+        """
+        params = dict(params or {})
+        stream: bool = params.pop('stream', False)
+        options: dict = self._fetch_options.get(self.__class__.__name__, {})
+        if stream:
+            return session.select_iter(sql, params, **options)
+        return session.select(sql, params, **options)
+
+    @classmethod
+    def map_iter(cls, inp: dict):
+        """
+         Data Source의 조회 결과를 한 행씩 dict 형식으로 변환하여 반환
+         조회 결과 data 가 iterator (select_iter) 일 경우에도 전체를 list 로 만들지 않고 변환
+         :param inp : 조회 결과({"columns" : columns, "data" : list 또는 iterator})
+         :return generator of dict
+        """
+        columns: list = inp["columns"]
+        for data in inp["data"]:
+            yield dict(zip(columns, data))
+
     @classmethod
     def map(cls, inp: dict) -> list:
         """
@@ -19,10 +64,7 @@ class AbstractDAO(metaclass=ABCMeta):
          :param inp : 조회 결과({"columns" : columns, "data" : list})
          :return dict array
         """
-        arr = []
-        for data in inp["data"]:
-            arr.append(dict(zip(inp["columns"], data)))
-        return arr
+        return list(cls.map_iter(inp))
 
     @classmethod
     def hash_map(cls, inp: dict, key_column: str) -> dict:
@@ -37,9 +79,8 @@ class AbstractDAO(metaclass=ABCMeta):
          :param key_column : hash key column
          :return dict
         """
-        arr: list = cls.map(inp)
         res: dict = {}
-        for row in arr:
+        for row in cls.map_iter(inp):
             values: list = res.get(row[key_column])
             if values is None:
                 values = []
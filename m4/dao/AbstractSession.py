@@ -36,6 +36,18 @@ class AbstractSession(metaclass=ABCMeta):
         :return: {"columns" : columns, "data" : list}
         """
 
+    def select_iter(self, sql: str, params: dict, arraysize: int = None, prefetchrows: int = None):
+        """
+        Data Source로부터 Query문 결과를 batch 단위로 나누어 가져오는 처리
+        기본 구현은 select( ) 결과를 그대로 반환, Data Source 에 따라 재정의
+        :param sql: sql string
+        :param params: sql 파라미터
+        :param arraysize: 한 번에 가져올 행 수
+        :param prefetchrows: 조회 실행 시 미리 가져올 행 수
+        :return: {"columns" : columns, "data" : iterator}
+        """
+        return self.select(sql, params)
+
     @abstractmethod
     def execute(self, sql_template: str, data_list: list):
         """
@@ -45,6 +57,30 @@ class AbstractSession(metaclass=ABCMeta):
         :return: True/False : 성공 여부
         """
 
+    def execute_chunks(self, sql_template: str, data_iter, chunk_size: int, input_sizes: list = None):
+        """
+        CUD 대상 데이터를 chunk_size 행 단위로 나누어 실행하는 처리
+        data_iter 는 generator 등 iterable 도 가능하며, 한 번에 chunk_size 행만 메모리에 유지
+        기본 구현은 chunk 마다 execute( ) 호출, Data Source 에 따라 재정의
+        :param sql_template: sql template
+        :param data_iter: CUD 대상 데이터 iterable
+        :param chunk_size: 한 번에 실행할 행 수
+        :param input_sizes: bind 변수 별 크기/타입 정보 (지원하는 Data Source 에서만 사용)
+        :return: int : 실행한 행 수
+        """
+        count: int = 0
+        chunk: list = []
+        for row in data_iter:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                self.execute(sql_template, chunk)
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            self.execute(sql_template, chunk)
+            count += len(chunk)
+        return count
+
     @abstractmethod
     def execute_procedure(self, procedure_name: str, params):
         """
@@ -27,7 +27,7 @@ class BomDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("select * from MF_BOM_ROUTING", params)
+        return self._select(session, "select * from MF_BOM_ROUTING", params)
 
     def execute(self, session: AbstractSession, sql_template: str, data_list: list):
         """
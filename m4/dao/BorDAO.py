@@ -27,7 +27,7 @@ class BorDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("select * from FS_BOR", params)
+        return self._select(session, "select * from FS_BOR", params)
 
     def execute(self, session: AbstractSession, sql_template: str, data_list: list):
         """
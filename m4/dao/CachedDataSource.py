@@ -0,0 +1,279 @@
+import glob
+import hashlib
+import os
+import pickle
+import threading
+
+from m4.common.SingletonInstance import SingletonInstance
+from m4.dao.AbstractDataSource import AbstractDataSource
+from m4.dao.CachedSession import CachedSession
+from m4.dao.DataSourceError import DataSourceError
+from m4.dao.PlanVersionDAO import PlanVersionDAO
+from m4.dao.SimulationDAO import SimulationDAO
+from m4.util.LogHandler import LogHandler
+from m4.ApplicationConfiguration import ApplicationConfiguration
+
+
+class CachedDataSource(AbstractDataSource, SingletonInstance):
+    """
+    Cached Data Source 클래스
+    원본 Data Source 의 조회 결과(기준 정보)를 (sql, 파라미터) 별로 모아 로컬 파일(pickle)에 snapshot 으로 저장하고,
+    다음 실행부터는 원본 Data Source 를 조회하지 않고 snapshot 에서 읽어 반환
+    snapshot 파일은 생산 일정 계획 버전 / 시뮬레이션 ID / 데이터 fingerprint 별로 구분
+        fingerprint : 원본 Data Source 의 계획 버전(FS_PLAN_VER), 시뮬레이션(FS_SIM) 정보와
+                      Builder 들이 조회하는 기준 정보 테이블(MASTER_TABLES) 별 행 수의 hash
+                      -> 계획 버전/시뮬레이션 정보가 변경되거나 기준 정보 행이 추가/삭제되면 새 snapshot 을 만듦
+        행 수가 바뀌지 않는 기준 정보 수정(값 변경)은 감지하지 못하므로 m4.properties [Cache] cache.refresh=True 로 다시 조회
+    원본 Data Source 없이(offline) 실행할 경우 가장 최근 snapshot 만으로 조회
+    """
+
+    # snapshot 파일 형식
+    PICKLE_PROTOCOL: int = 5
+    FILE_VERSION: int = 1
+
+    # fingerprint 에 행 수를 반영할 기준 정보 테이블 (FactoryBuilder / BackwardBuilder / ScheduleManager 조회 대상)
+    MASTER_TABLES: tuple = ('CM_CALNDR', 'CM_COMN_CD', 'CM_COMN_GRP_CD', 'CM_PLANT', 'MF_BOM_ROUTING',
+                            'FS_BOR', 'FS_FACTORY', 'FS_FACTRY_SCHDL', 'FS_FACTRY_SCHDL_CONST',
+                            'FS_INV', 'FS_INV_ITEM', 'FS_INV_ITEM_CONST', 'FS_PROC', 'FS_RESC',
+                            'FS_RESC_SCHDL', 'FS_RESC_SCHDL_CONST', 'FS_ROUTE', 'FS_TM_CONST',
+                            'FS_WIP', 'FS_WORK_ORDER')
+
+    def __init__(self):
+        """
+        생성자 : CachedDataSource 클래스 멤버 변수들
+        """
+        super(__class__, self).__init__()
+
+        # logger
+        self._logger = LogHandler.instance().get_logger()
+
+        self._data_source: AbstractDataSource = None    # 원본 Data Source (offline 일 경우 None)
+        self._directory: str = None
+        self._plan_version_id: str = None
+        self._simulation_id: str = None
+        self._fingerprint: str = None
+
+        # 조회 결과 snapshot { (sql, 파라미터): (columns, data) }
+        self._results: dict = {}
+        self._is_changed: bool = False
+        self._lock: threading.Lock = threading.Lock()
+
+    # Public 메서드
+    def init(self, config: ApplicationConfiguration, plan_version_id: str, simulation_id: str,
+             data_source: AbstractDataSource = None):
+        """
+        snapshot 파일 위치 및 fingerprint 결정, 기존 snapshot 이 있으면 불러오기
+        m4.properties [Cache] 섹션
+            cache.directory : snapshot 파일 디렉토리
+            cache.refresh   : True 이면 기존 snapshot 을 사용하지 않고 원본 Data Source 로 다시 조회하여 저장
+        :param config: Application Configuration
+        :param plan_version_id: 생산 일정 계획 버전 ID
+        :param simulation_id: 시뮬레이션 ID
+        :param data_source: 원본 AbstractDataSource 인스턴스 (None 이면 offline - snapshot 만으로 조회)
+        :return: void
+        """
+        self._data_source = data_source
+        self._directory = config.find('Cache', 'cache.directory', './cache')
+        self._plan_version_id = plan_version_id
+        self._simulation_id = simulation_id
+        self._results = {}
+        self._is_changed = False
+
+        refresh: bool = str(config.find('Cache', 'cache.refresh', 'False')).lower() == 'true'
+
+        if data_source is None:
+            path: str = self._find_latest_path()
+            if path is None:
+                raise DataSourceError(f"Master data snapshot not found : {plan_version_id} / {simulation_id} "
+                                      f"in {self._directory}")
+            self._load(path)
+            return
+
+        self._fingerprint = self._get_fingerprint()
+        path: str = self.get_path()
+        if refresh:
+            self._logger.info(f"[CachedDataSource] refresh master data snapshot : {path}")
+        elif os.path.exists(path):
+            self._load(path)
+
+    def get_path(self) -> str:
+        """
+        현재 계획 버전 / 시뮬레이션 ID / fingerprint 의 snapshot 파일 경로
+        :return: str
+        """
+        return os.path.join(self._directory,
+                            f"{self._plan_version_id}_{self._simulation_id}_{self._fingerprint}.pkl")
+
+    def get_session(self):
+        """
+        snapshot 을 우선 조회하는 세션 인스턴스를 반환
+        원본 Data Source 가 있을 경우 원본 세션을 함께 획득
+        :return: CachedSession 인스턴스
+        """
+        session: CachedSession = CachedSession()
+        session.init(self, None if self._data_source is None else self._data_source.get_session())
+        return session
+
+    def release_session(self, session: CachedSession):
+        """
+        생성된 세션을 반환, 원본 세션이 있을 경우 원본 Data Source 로 반환
+        :param session: CachedSession 인스턴스
+        :return: void
+        """
+        if session is None or session.get_session() is None:
+            return
+        session.get_session().close()
+
+    def close(self):
+        """
+        DataSource 비 사용 상태로 전환 (snapshot 을 저장하지는 않음)
+        :return: void
+        """
+        if self._data_source is not None:
+            self._data_source.close()
+
+    def get_result(self, sql: str, params: dict):
+        """
+        snapshot 에서 조회 결과 가져오기
+        :param sql: sql string
+        :param params: sql 파라미터
+        :return: {"columns" : columns, "data" : list}, 없을 경우 None
+        """
+        result: tuple = self._results.get(self._get_key(sql, params))
+        if result is None:
+            return None
+        columns, data = result
+        return {"columns": columns, "data": data}
+
+    def put_result(self, sql: str, params: dict, result: dict):
+        """
+        원본 Data Source 의 조회 결과를 snapshot 에 기록
+        :param sql: sql string
+        :param params: sql 파라미터
+        :param result: {"columns" : columns, "data" : list 또는 iterator}
+        :return: {"columns" : columns, "data" : list}
+        """
+        columns: list = list(result["columns"])
+        data: list = list(result["data"])
+        with self._lock:
+            self._results[self._get_key(sql, params)] = (columns, data)
+            self._is_changed = True
+        return {"columns": columns, "data": data}
+
+    def save(self):
+        """
+        새로 조회된 결과가 있을 경우 snapshot 파일 저장 (임시 파일에 쓴 후 교체)
+        :return: str : 저장한 파일 경로, 저장하지 않았을 경우 None
+        """
+        if not self._is_changed or self._fingerprint is None:
+            return None
+
+        os.makedirs(self._directory, exist_ok=True)
+        path: str = self.get_path()
+        temp_path: str = f"{path}.{os.getpid()}.tmp"
+        with self._lock:
+            snapshot: dict = {
+                'version': self.FILE_VERSION,
+                'plan_version_id': self._plan_version_id,
+                'simulation_id': self._simulation_id,
+                'fingerprint': self._fingerprint,
+                'results': dict(self._results)
+            }
+            self._is_changed = False
+        with open(temp_path, 'wb') as file:
+            pickle.dump(snapshot, file, protocol=self.PICKLE_PROTOCOL)
+        os.replace(temp_path, path)
+
+        self._logger.info(f"[CachedDataSource] master data snapshot saved : {path} ({len(snapshot['results'])} queries)")
+        return path
+
+    def invalidate(self):
+        """
+        현재 계획 버전 / 시뮬레이션 ID 의 snapshot 파일(모든 fingerprint) 및 메모리의 조회 결과 삭제
+        :return: int : 삭제한 파일 수
+        """
+        paths: list = glob.glob(self._get_path_pattern())
+        for path in paths:
+            os.remove(path)
+        with self._lock:
+            self._results = {}
+            self._is_changed = False
+        return len(paths)
+
+    # Private 메서드
+    @staticmethod
+    def _get_key(sql: str, params: dict) -> tuple:
+        """
+        snapshot key : (sql, 파라미터명 순으로 정렬한 파라미터)
+        """
+        return sql, tuple(sorted((params or {}).items()))
+
+    def _get_path_pattern(self) -> str:
+        return os.path.join(glob.escape(self._directory),
+                            f"{glob.escape(self._plan_version_id)}_{glob.escape(self._simulation_id)}_*.pkl")
+
+    def _find_latest_path(self):
+        """
+        현재 계획 버전 / 시뮬레이션 ID 의 가장 최근 snapshot 파일 경로
+        :return: str, 없을 경우 None
+        """
+        paths: list = glob.glob(self._get_path_pattern())
+        return max(paths, key=os.path.getmtime) if paths else None
+
+    def _get_fingerprint(self) -> str:
+        """
+        원본 Data Source 의 계획 버전(FS_PLAN_VER), 시뮬레이션(FS_SIM) 정보 및 기준 정보 테이블 별 행 수로 fingerprint 생성
+        :return: str
+        """
+        session = self._data_source.get_session()
+        try:
+            plan_version: dict = PlanVersionDAO.instance().select_one(session, plan_version_id=self._plan_version_id)
+            simulation: dict = SimulationDAO.instance().select_one(session, simulation_id=self._simulation_id)
+            table_counts: list = self._get_table_counts(session)
+        finally:
+            session.close()
+
+        digest = hashlib.sha1()
+        for result in (plan_version, simulation):
+            digest.update(repr((list(result["columns"]), list(result["data"]))).encode('utf-8'))
+        digest.update(repr(table_counts).encode('utf-8'))
+        return digest.hexdigest()[:16]
+
+    def _get_table_counts(self, session) -> list:
+        """
+        기준 정보 테이블 별 행 수 - 한 번의 조회(UNION ALL)로 가져오고,
+        실패할 경우(ex. FileDataSource 에 없는 테이블) 테이블 별로 조회하여 없는 테이블은 None
+        :param session: 원본 Data Source 세션
+        :return: [..., (테이블명, 행 수), ...]
+        """
+        sql: str = " union all ".join(f"select '{table}' as table_name, count(*) as row_count from {table}"
+                                      for table in self.MASTER_TABLES)
+        try:
+            return [tuple(row) for row in session.select(sql, {})["data"]]
+        except DataSourceError:
+            pass
+
+        table_counts: list = []
+        for table in self.MASTER_TABLES:
+            try:
+                data: list = session.select(f"select count(*) from {table}", {})["data"]
+                table_counts.append((table, data[0][0]))
+            except DataSourceError:
+                table_counts.append((table, None))
+        return table_counts
+
+    def _load(self, path: str):
+        """
+        snapshot 파일 불러오기
+        :param path: snapshot 파일 경로
+        :return: void
+        """
+        with open(path, 'rb') as file:
+            snapshot: dict = pickle.load(file)
+        if snapshot.get('version') != self.FILE_VERSION:
+            raise DataSourceError(f"Unsupported master data snapshot version : {snapshot.get('version')} ({path})")
+
+        self._fingerprint = snapshot['fingerprint']
+        self._results = snapshot['results']
+        self._is_changed = False
+        self._logger.info(f"[CachedDataSource] master data snapshot loaded : {path} ({len(self._results)} queries)")
@@ -0,0 +1,132 @@
+from ..dao.AbstractDataSource import AbstractDataSource
+from ..dao.AbstractSession import AbstractSession
+from ..dao.DataSourceError import DataSourceError
+
+
+class CachedSession(AbstractSession):
+    """
+    Cached Session 클래스
+    조회는 CachedDataSource 의 기준 정보 snapshot 에서 먼저 찾고,
+    없을 경우 원본 세션으로 조회한 결과를 snapshot 에 기록 후 반환
+    원본 세션이 없을 경우(offline) snapshot 에 없는 조회는 DataSourceError, CUD 는 실행하지 않음
+    """
+
+    def __init__(self):
+        """
+        생성자 : CachedSession
+        """
+        self._data_source: AbstractDataSource = None
+        self._session: AbstractSession = None
+
+    def init(self, data_source: AbstractDataSource, session: AbstractSession = None):
+        """
+        CachedDataSource 와 원본 세션 초기화
+        :param data_source: CachedDataSource 인스턴스
+        :param session: 원본 Data Source 의 AbstractSession 인스턴스 (offline 일 경우 None)
+        """
+        self._data_source = data_source
+        self._session = session
+
+    def get_session(self) -> AbstractSession:
+        """
+        원본 세션 인스턴스를 반환 (offline 일 경우 None)
+        """
+        return self._session
+
+    def get_connection(self):
+        """
+        원본 세션의 Data Source Connection 객체를 반환 (offline 일 경우 None)
+        """
+        return None if self._session is None else self._session.get_connection()
+
+    def commit(self):
+        """
+        commit
+        """
+        if self._session is not None:
+            self._session.commit()
+
+    def rollback(self):
+        """
+        rollback
+        """
+        if self._session is not None:
+            self._session.rollback()
+
+    def close(self):
+        """
+        생성된 세션을 반환, 원본 세션이 있을 경우 함께 반환
+        :return: void
+        """
+        self._data_source.release_session(self)
+
+    def select(self, sql: str, params: dict, arraysize: int = None, prefetchrows: int = None):
+        """
+        기준 정보 snapshot 에서 조회 결과를 가져오는 처리, 없을 경우 원본 세션으로 조회 후 snapshot 에 기록
+        :param sql: sql string
+        :param params: sql 파라미터
+        :param arraysize: 한 번에 가져올 행 수 (원본 세션 조회 시에만 사용)
+        :param prefetchrows: 조회 실행 시 미리 가져올 행 수 (원본 세션 조회 시에만 사용)
+        :return: {"columns" : columns, "data" : list}
+        """
+        result: dict = self._data_source.get_result(sql, params)
+        if result is not None:
+            return result
+
+        if self._session is None:
+            raise DataSourceError(f"Master data snapshot has no result for query : {sql.strip()} {params or {}}")
+
+        options: dict = {}
+        if arraysize:
+            options['arraysize'] = arraysize
+        if prefetchrows:
+            options['prefetchrows'] = prefetchrows
+        result = self._session.select(sql, params, **options)
+        return self._data_source.put_result(sql, params, result)
+
+    def select_iter(self, sql: str, params: dict, arraysize: int = None, prefetchrows: int = None):
+        """
+        snapshot 에 기록하기 위해 조회 결과 전체가 필요하므로 select( ) 와 동일하게 처리
+        :param sql: sql string
+        :param params: sql 파라미터
+        :param arraysize: 한 번에 가져올 행 수
+        :param prefetchrows: 조회 실행 시 미리 가져올 행 수
+        :return: {"columns" : columns, "data" : list}
+        """
+        return self.select(sql, params, arraysize, prefetchrows)
+
+    def execute(self, sql_template: str, data_list: list):
+        """
+        CRUD 쿼리문을 원본 세션으로 실행하는 처리 (offline 일 경우 실행하지 않음)
+        :param sql_template: sql template
+        :param data_list:  CUD 대상 데이터
+        :return: True/False : 성공 여부
+        """
+        if self._session is None:
+            return True
+        return self._session.execute(sql_template, data_list)
+
+    def execute_chunks(self, sql_template: str, data_iter, chunk_size: int, input_sizes: list = None):
+        """
+        CUD 대상 데이터를 원본 세션으로 chunk_size 행 단위로 나누어 실행하는 처리
+        offline 일 경우 실행하지 않고 대상 데이터 행 수만 반환
+        :param sql_template: sql template
+        :param data_iter: CUD 대상 데이터 iterable
+        :param chunk_size: 한 번에 실행할 행 수
+        :param input_sizes: bind 변수 별 크기/타입 정보
+        :return: int : 실행한 행 수
+        """
+        if self._session is None:
+            return sum(1 for _ in data_iter)
+        return self._session.execute_chunks(sql_template, data_iter, chunk_size, input_sizes)
+
+    def execute_procedure(self, procedure_name: str, params):
+        """
+        DB 에 저장된 프로시져를 원본 세션으로 호출하는 처리 (offline 일 경우 실행하지 않음)
+        :param procedure_name: procedure name
+        :param params: procedure 파라미터
+        :return: True/False : 성공 여부
+        """
+        if self._session is None:
+            return True
+        return self._session.execute_procedure(procedure_name, params)
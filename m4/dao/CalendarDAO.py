@@ -15,7 +15,7 @@ class CalendarDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터 Keyword Arguments
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("select * from CM_CALNDR", params)
+        return self._select(session, "select * from CM_CALNDR", params)
 
     def select_one(self, session: AbstractSession, **params):
         """
@@ -24,7 +24,7 @@ class CalendarDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("select * from CM_CALNDR", params)
+        return self._select(session, "select * from CM_CALNDR", params)
 
     def select_calendar_constraint(self, session: AbstractSession, **params):
         """
@@ -33,7 +33,7 @@ class CalendarDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select(
+        return self._select(session,
             """
                 SELECT
                     to_date(:start_date, 'YYYYMMDDHH24MISS') START_DATE,
@@ -24,7 +24,7 @@ class CommonCodeDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("SELECT * FROM CM_COMN_CD WHERE use_yn = :use_yn", params)
+        return self._select(session, "SELECT * FROM CM_COMN_CD WHERE use_yn = :use_yn", params)
 
     def select_group_code(self, session: AbstractSession, **params):
         """
@@ -33,7 +33,7 @@ class CommonCodeDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("SELECT * FROM CM_COMN_GRP_CD WHERE use_yn = :use_yn", params)
+        return self._select(session, "SELECT * FROM CM_COMN_GRP_CD WHERE use_yn = :use_yn", params)
 
     def execute(self, session: AbstractSession, sql_template: str, data_list: list):
         """
@@ -0,0 +1,47 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from m4.dao.AbstractDataSource import AbstractDataSource
+from m4.dao.AbstractSession import AbstractSession
+
+
+class DataLoader:
+    """
+    Data Loader
+    서로 독립적인 기준 정보 조회 작업들을 thread pool 로 나누어 동시에 실행하는 클래스
+    각 작업은 Data Source 로부터 자신만의 세션을 받아 실행하고, 끝나면 세션을 반환
+    Data Source 가 없거나 worker 수가 1 이하이면 주어진 세션 하나로 차례로 실행
+    """
+
+    @classmethod
+    def load(cls, tasks: dict, session: AbstractSession,
+             data_source: AbstractDataSource = None, max_workers: int = 1) -> dict:
+        """
+        조회 작업 실행
+        :param tasks: { 작업명: callable(session) }
+        :param session: 차례로 실행할 경우 사용할 AbstractSession 인스턴스
+        :param data_source: 동시에 실행할 경우 작업마다 세션을 받아올 AbstractDataSource 인스턴스
+        :param max_workers: 동시에 실행할 작업 수
+        :return: { 작업명: 작업 결과 }
+        """
+        if data_source is None or max_workers <= 1 or len(tasks) <= 1:
+            return {name: task(session) for name, task in tasks.items()}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks)),
+                                thread_name_prefix='DataLoader') as executor:
+            futures: dict = {name: executor.submit(cls._run, task, data_source) for name, task in tasks.items()}
+            # 작업 중 오류가 있을 경우 result( ) 에서 다시 raise
+            return {name: future.result() for name, future in futures.items()}
+
+    @staticmethod
+    def _run(task, data_source: AbstractDataSource):
+        """
+        Data Source 로부터 세션을 받아 작업 실행 후 세션 반환
+        :param task: callable(session)
+        :param data_source: AbstractDataSource 인스턴스
+        :return: 작업 결과
+        """
+        session: AbstractSession = data_source.get_session()
+        try:
+            return task(session)
+        finally:
+            session.close()
@@ -27,7 +27,7 @@ class DemandDAO(AbstractDAO, SingletonInstance):
         :param params: SQL Parameter Data
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("""
+        return self._select(session, """
             SELECT PLAN_VER_ID
                  , WORK_ORDER_ID
                  , ORDER_ITEM_ID
@@ -46,7 +46,7 @@ class DemandDAO(AbstractDAO, SingletonInstance):
         :param params: SQL Parameter Data
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("SELECT * FROM CM_COMN_CD WHERE use_yn = :use_yn", params)
+        return self._select(session, "SELECT * FROM CM_COMN_CD WHERE use_yn = :use_yn", params)
 
     def select_code_group(self, session: AbstractSession, **params):
         """
@@ -55,7 +55,7 @@ class DemandDAO(AbstractDAO, SingletonInstance):
         :param params: SQL Parameter Data
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("SELECT * FROM CM_COMN_GRP_CD WHERE use_yn = :use_yn", params)
+        return self._select(session, "SELECT * FROM CM_COMN_GRP_CD WHERE use_yn = :use_yn", params)
 
     def execute(self, session: AbstractSession, sql_template: str, data_list: list):
         """
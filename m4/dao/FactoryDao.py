@@ -18,7 +18,7 @@ class FactoryDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("select * from CM_PLANT", params)
+        return self._select(session, "select * from CM_PLANT", params)
 
     def select_list(self, session: AbstractSession, params: tuple = ()):
         """
@@ -18,7 +18,7 @@ class FactoryScheduleDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("select * from FS_FACTRY_SCHDL", params)
+        return self._select(session, "select * from FS_FACTRY_SCHDL", params)
 
     def select_constraint(self, session: AbstractSession, **params):
         """
@@ -27,7 +27,7 @@ class FactoryScheduleDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select(
+        return self._select(session,
             """
             SELECT TO_DATE(T1.START_DT_HMS, 'YYYYMMDDHH24MISS') START_DATE, 
                    TO_DATE(T1.END_DT_HMS, 'YYYYMMDDHH24MISS') END_DATE,
@@ -48,7 +48,7 @@ class FactoryScheduleDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select(
+        return self._select(session,
             """
             SELECT MAX(T1.PRIORITY) AS MAX_PRIORITY
               FROM FS_FACTRY_SCHDL_CONST T1
@@ -1,17 +1,32 @@
+import csv
+import glob
+import os
+import re
+import sqlite3
+import threading
+
+from m4.common.SingletonInstance import SingletonInstance
 from m4.dao.AbstractDataSource import AbstractDataSource
+from m4.dao.DataSourceError import DataSourceError
+from m4.dao.FileSession import FileSession
+from m4.dao.OracleSqlTranslator import OracleSqlTranslator
+from m4.ApplicationConfiguration import ApplicationConfiguration
 
 
-class FileDataSource(AbstractDataSource):
+class FileDataSource(AbstractDataSource, SingletonInstance):
     """
     File Data Source
     File System Connection 담당 클래스
+    file.directory 의 CSV 파일(FS_*.csv, CM_*.csv - 파일명이 테이블명, 첫 행이 column 명)을
+    메모리 sqlite3 database 의 테이블로 불러와서 DAO 들의 SQL 을 그대로(OracleSqlTranslator 변환) 실행
+    CUD 로 변경된 테이블은 close( ) 시 file.output.directory 에 CSV 파일로 저장
     """
 
-    # Static Variables
-    staticVar2: object = None               # Comment
+    # CSV 값 형 변환에서 제외할 (항상 문자열로 유지할) column 명 접미어 - ID, 일자/시각 문자열 등
+    TEXT_COLUMN_SUFFIXES: tuple = ('_ID', '_CD', '_NM', '_TYP', '_YN', '_DT', '_HMS', 'YYYYMMDD', 'DESCR')
 
-    # Static Constants
-    CONSTANT_VARIABLE2: object = None       # Comment
+    _NUMBER_PATTERN = re.compile(r'-?(0|[1-9]\d*)(\.\d+)?')
+    _INSERT_PATTERN = re.compile(r'INSERT\s+INTO\s+(\w+)\s*\(([^)]*)\)', re.IGNORECASE)
 
     def __init__(self):
         """
@@ -22,45 +37,175 @@ class FileDataSource(AbstractDataSource):
         super().__init__()
 
         # 2-1. Public
-        self.connectionConfig: dict = self._get_connection_config()     # 접속 관련 설정 값들을 보관하기 위한 Dictionary
+        self.connectionConfig: dict = {}           # 접속 관련 설정 값들을 보관하기 위한 Dictionary
 
         # 2-2. Private
-        self._privateVar: object = None     # Comment
+        self._connection: sqlite3.Connection = None
+        self._lock: threading.RLock = threading.RLock()     # 세션들이 하나의 connection 을 공유하므로 실행 시 lock
+        self._tables: dict = {}                     # { 테이블명: [column 명, ...] }
+        self._changed_tables: set = set()           # CUD 로 변경된 테이블명
 
-    def get_io_buffer_data(self):
+    # Public 메서드
+    def init(self, config: ApplicationConfiguration):
         """
-        File IO Buffer 로부터 Contents Array 를 가져오는 처리.
-        :return: Array-like Object  ex: pandas.DataFrame / list<list> / ...
+        file.directory 의 CSV 파일들을 메모리 database 로 불러오기
+        :param: config - Application Configuration
         """
-        pass
+        self.connectionConfig = self._get_connection_config(config)
+        directory: str = self.connectionConfig['directory']
+        if not os.path.isdir(directory):
+            raise DataSourceError(f"File data source directory not found : {directory}")
+
+        self._connection = self._get_connection()
+        self._tables = {}
+        self._changed_tables = set()
+        for path in sorted(glob.glob(os.path.join(glob.escape(directory), '*.csv'))):
+            table: str = os.path.splitext(os.path.basename(path))[0].upper()
+            self._create_table(table, self.get_io_buffer_data(path))
 
-    def write_io_buffer_data(self, out_file: str = ""):
+    def get_session(self):
         """
-        Write Out the Data to File on Local Disk
-        :param out_file: Output File Path
+        Data Source로부터 가용 세션을 획득하고 Data IO를 위한 세션 인스턴스를 반환
+        :return: FileSession 인스턴스
+        """
+        if self._connection is None:
+            return None
+
+        session: FileSession = FileSession()
+        session.init(self, self._connection, self._lock)
+        return session
+
+    def release_session(self, session: FileSession):
+        """
+        생성된 세션을 반환 (세션들이 connection 을 공유하므로 connection 은 유지)
+        :param session: FileSession 인스턴스
         :return: void
         """
         pass
 
-    def _get_connection_config(self):
+    def close(self):
+        """
+        CUD 로 변경된 테이블을 CSV 파일로 저장 후 DataSource 비 사용 상태로 전환
+        :return: void
+        """
+        if self._connection is None:
+            return
+        for table in sorted(self._changed_tables):
+            self.write_io_buffer_data(table)
+        self._release_connection(self._connection)
+        self._connection = None
+
+    def get_io_buffer_data(self, path: str):
+        """
+        CSV 파일로부터 Contents Array 를 가져오는 처리.
+        :param path: CSV 파일 경로
+        :return: {"columns" : columns, "data" : list}
+        """
+        return self.read_csv(path, self.connectionConfig['encoding'])
+
+    @classmethod
+    def read_csv(cls, path: str, encoding: str = 'utf-8-sig'):
+        """
+        CSV 파일(첫 행이 column 명) 읽기
+        숫자 형식 값만 있는 column 은 숫자로 변환 (TEXT_COLUMN_SUFFIXES 로 끝나는 column 제외), 빈 값은 None
+        :param path: CSV 파일 경로
+        :param encoding: 파일 encoding
+        :return: {"columns" : columns, "data" : list}
+        """
+        with open(path, newline='', encoding=encoding) as file:
+            reader = csv.reader(file)
+            columns: list = [column.strip().upper() for column in next(reader, [])]
+            rows: list = [row for row in reader if row]
+
+        data: list = [[value if value != '' else None for value in row] for row in rows]
+        for index, column in enumerate(columns):
+            values: list = [row[index] for row in data if index < len(row) and row[index] is not None]
+            if column.endswith(cls.TEXT_COLUMN_SUFFIXES) or \
+                    not all(cls._NUMBER_PATTERN.fullmatch(value) for value in values):
+                continue
+            is_float: bool = any('.' in value for value in values)
+            for row in data:
+                if index < len(row) and row[index] is not None:
+                    row[index] = float(row[index]) if is_float else int(row[index])
+
+        return {"columns": columns, "data": data}
+
+    def write_io_buffer_data(self, table: str, out_file: str = ""):
+        """
+        Write Out the Table Data to File on Local Disk
+        :param table: 테이블명
+        :param out_file: Output File Path (없을 경우 file.output.directory/테이블명.csv)
+        :return: void
+        """
+        if not out_file:
+            os.makedirs(self.connectionConfig['output_directory'], exist_ok=True)
+            out_file = os.path.join(self.connectionConfig['output_directory'], f"{table}.csv")
+
+        with self._lock:
+            rows: list = self._connection.execute(f'SELECT * FROM "{table}"').fetchall()
+        with open(out_file, 'w', newline='', encoding=self.connectionConfig['encoding']) as file:
+            writer = csv.writer(file)
+            writer.writerow(self._tables[table])
+            writer.writerows(rows)
+
+    def prepare_execute(self, sql: str):
+        """
+        CUD 실행 전 처리 : INSERT 대상 테이블이 없을 경우 INSERT 문의 column 목록으로 생성, 변경 테이블 기록
+        :param sql: sqlite3 SQL (OracleSqlTranslator 변환 후)
+        :return: void
+        """
+        match = self._INSERT_PATTERN.search(sql)
+        if match is None:
+            return
+        table: str = match.group(1).upper()
+        if table not in self._tables:
+            self._create_table(table, {"columns": [column.strip().upper() for column in match.group(2).split(',')],
+                                       "data": []})
+        self._changed_tables.add(table)
+
+    # Private 메서드
+    def _create_table(self, table: str, contents: dict):
+        """
+        메모리 database 에 테이블 생성 및 데이터 입력 (column 형 지정 없이 값의 형 그대로 저장)
+        :param table: 테이블명
+        :param contents: {"columns" : columns, "data" : list}
+        :return: void
+        """
+        columns: list = contents["columns"]
+        column_list: str = ', '.join(f'"{column}"' for column in columns)
+        with self._lock:
+            self._connection.execute(f'DROP TABLE IF EXISTS "{table}"')
+            self._connection.execute(f'CREATE TABLE "{table}" ({column_list})')
+            self._connection.executemany(f'INSERT INTO "{table}" VALUES ({", ".join("?" * len(columns))})',
+                                         [row + [None] * (len(columns) - len(row)) for row in contents["data"]])
+        self._tables[table] = columns
+
+    @staticmethod
+    def _get_connection_config(config: ApplicationConfiguration):
         """
         m4.properties 파일로부터 FileSystem 접속 관련 설정 값들 받아오는 처리
-        Question 생성자에서 한 번만 호출되도록 ??
-        :return: dict ?
+        :return: dict
         """
-        return super()._get_connection_config()
+        directory: str = config.find('FileSource', 'file.directory')
+        return {
+            'directory': directory,
+            'output_directory': config.find('FileSource', 'file.output.directory', directory),
+            'encoding': config.find('FileSource', 'file.encoding', 'utf-8-sig')
+        }
 
-    def _get_connection(self):
+    @staticmethod
+    def _get_connection():
         """
-        File Connection 체결 처리   : _io.open()
-        :return: _io._IOBase
+        File Connection 체결 처리   : 메모리 sqlite3 database
+        :return: sqlite3.Connection
         """
-        pass
+        return OracleSqlTranslator.connect()
 
-    def _release_connection(self, connection: object):
+    @staticmethod
+    def _release_connection(connection: sqlite3.Connection):
         """
-        File Connection Close 처리    : _io._IOBase.close()
-        :param connection: _io._IOBase
+        File Connection Close 처리
+        :param connection: sqlite3.Connection
         :return:
         """
-        pass
+        connection.close()
@@ -0,0 +1,17 @@
+from ..dao.SQLiteSession import SQLiteSession
+
+
+class FileSession(SQLiteSession):
+    """
+    File Session 클래스
+    FileDataSource 가 CSV 파일들로 만든 메모리 database 에 대해 DAO 의 SQL 을 실행
+    (세션들이 FileDataSource 의 connection 하나를 lock 으로 공유)
+    """
+
+    def _prepare_execute(self, sql: str):
+        """
+        CUD 실행 전 처리 : INSERT 대상 테이블 생성 및 변경 테이블 기록 (FileDataSource.prepare_execute)
+        :param sql: sqlite3 SQL (OracleSqlTranslator 변환 후)
+        :return: void
+        """
+        self._data_source.prepare_execute(sql)
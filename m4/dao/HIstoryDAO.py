@@ -8,6 +8,11 @@ class HistoryDAO(AbstractDAO, SingletonInstance):
     Route Data Access Object
     """
 
+    # INSERT bind 변수 별 크기/타입 (문자열은 최대 길이, 숫자는 float)
+    # PLAN_VER_ID, SIM_ID, CURR_LOC_ID, CURR_RES_ID, NEXT_LOC_ID, LOT_ID, WORK_ORDER_ID, ORDER_ITEM_ID, ITEM_ID,
+    # PROD_QTY, EVENT_ID, START_DT_HMS, END_DT_HMS, DUR
+    INPUT_SIZES: list = [100, 100, 100, 100, 100, 100, 100, 100, 100, float, 100, 14, 14, float]
+
     def select(self, session: AbstractSession, **params):
         pass
 
@@ -27,19 +32,20 @@ class HistoryDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select(
+        return self._select(session,
             """
             SELECT *
             FROM FS_ROUTE
             """, params)
 
-    def execute(self, session: AbstractSession, data_list: list):
+    def execute(self, session: AbstractSession, data_list, chunk_size: int = 1000):
         """
         세션 인스턴스를 통해 Data Source에 대한 CUD를 실행
+        data_list 는 generator 등 iterable 도 가능하며 chunk_size 행 단위로 나누어 실행
         :param session: AbstractSession 인스턴스
-        :param sql_template: sql template string
         :param data_list: CUD 대상 데이터
-        :return: True/False
+        :param chunk_size: 한 번에 실행할 행 수
+        :return: int : 실행한 행 수
         """
 
         sql_template = """
@@ -52,4 +58,7 @@ class HistoryDAO(AbstractDAO, SingletonInstance):
         #                                                     LOT_ID, ITEM_ID, PROD_QTY, START_DT_HMS, END_DT_HMS, DUR
         #                                                    )values(:1, :2, :3, :4, :6, :7, :5, :8, :9, :11, :12, :13)"""
 
-        session.execute(sql_template=sql_template, data_list=list(map(tuple, data_list)))
+        return session.execute_chunks(sql_template=sql_template,
+                                      data_iter=map(tuple, data_list),
+                                      chunk_size=chunk_size,
+                                      input_sizes=self.INPUT_SIZES)
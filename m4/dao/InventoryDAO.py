@@ -15,7 +15,7 @@ class InventoryDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("select * from FS_INV", params)
+        return self._select(session, "select * from FS_INV", params)
 
     def select(self, session: AbstractSession, **params):
         """
@@ -24,7 +24,7 @@ class InventoryDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터 Keyword Arguments
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("select * from FS_INV", params)
+        return self._select(session, "select * from FS_INV", params)
 
     def select_route_inventory(self, session: AbstractSession, **params):
         """
@@ -33,7 +33,7 @@ class InventoryDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select(
+        return self._select(session,
             """
                 select *
                 from FS_INV
@@ -48,7 +48,7 @@ class InventoryDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select(
+        return self._select(session,
             """
                 select NULL AS WORK_ORDER_ID, NULL AS ORDER_ITEM_ID, T1.ITEM_ID, T1.INV_ID, T1.INV_ID AS LOC_ID,
                        T1.STOCK_QTY QTY
@@ -65,7 +65,7 @@ class InventoryDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select(
+        return self._select(session,
             """
                 select *
                 from FS_INV_ITEM_CONST
@@ -18,7 +18,7 @@ class InventoryItemDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("select * from FS_INV_ITEM where STOCK_QTY <> 0", params)
+        return self._select(session, "select * from FS_INV_ITEM where STOCK_QTY <> 0", params)
 
     def select_master(self, session: AbstractSession, **params):
         """
@@ -27,7 +27,7 @@ class InventoryItemDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("select * from FS_INV_ITEM where STOCK_QTY <> 0", params)
+        return self._select(session, "select * from FS_INV_ITEM where STOCK_QTY <> 0", params)
 
     def execute(self, session: AbstractSession, data_list: list):
         """
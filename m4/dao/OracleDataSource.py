@@ -3,6 +3,7 @@ import os
 import cx_Oracle
 
 from m4.common.SingletonInstance import SingletonInstance
+from m4.dao.AbstractDAO import AbstractDAO
 from m4.dao.AbstractDataSource import AbstractDataSource
 from m4.dao.OracleSqlSession import OracleSqlSession
 from m4.ApplicationConfiguration import ApplicationConfiguration
@@ -16,6 +17,10 @@ class OracleDataSource(AbstractDataSource, SingletonInstance):
     # Oracle Session Pool
     _pool: cx_Oracle.SessionPool = None
 
+    # 조회 cursor 기본 설정 (None 이면 driver 기본값)
+    _arraysize: int = None
+    _prefetchrows: int = None
+
     def __init__(self):
         """
         생성자 : DbDataSource 클래스 멤버 변수들
@@ -45,6 +50,14 @@ class OracleDataSource(AbstractDataSource, SingletonInstance):
             min=1, max=20, increment=1, threaded=True
         )
 
+        # 조회 cursor 기본 설정 및 DAO 별 설정
+        if uri_map.get("ds.fetch.arraysize"):
+            self._arraysize = int(uri_map["ds.fetch.arraysize"])
+        if uri_map.get("ds.fetch.prefetchrows"):
+            self._prefetchrows = int(uri_map["ds.fetch.prefetchrows"])
+        if config.has_section("Fetch"):
+            AbstractDAO.init_fetch_options(config.find_section("Fetch"))
+
     def get_session(self):
         """
         Data Source로부터 가용 세션을 획득하고 Data IO를 위한 세션 인스턴스를 반환
@@ -56,7 +69,7 @@ class OracleDataSource(AbstractDataSource, SingletonInstance):
             return None
 
         session: OracleSqlSession = OracleSqlSession()
-        session.init(self, self._pool.acquire())
+        session.init(self, self._pool.acquire(), self._arraysize, self._prefetchrows)
         return session
 
     def release_session(self, session: OracleSqlSession):
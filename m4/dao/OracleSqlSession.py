@@ -16,18 +16,44 @@ class OracleSqlSession(AbstractSession):
     # Oracle Session Pool
     _connection: cx_Oracle.Connection = None
 
+    # 조회 cursor 기본 설정 (None 이면 driver 기본값)
+    _arraysize: int = None
+    _prefetchrows: int = None
+
     def __init__(self):
         """
         생성자 : SqlSession
         """
 
     # Public 메서드
-    def init(self, data_source: AbstractDataSource, connection: cx_Oracle.Connection):
+    def init(self, data_source: AbstractDataSource, connection: cx_Oracle.Connection,
+             arraysize: int = None, prefetchrows: int = None):
         """
-        Data Source와 Connection 객체를 초기화
+        Data Source와 Connection 객체, 조회 cursor 기본 설정을 초기화
         """
         self._data_source = data_source
         self._connection = connection
+        self._arraysize = arraysize
+        self._prefetchrows = prefetchrows
+
+    def _open_cursor(self, arraysize: int = None, prefetchrows: int = None):
+        """
+        조회 cursor 생성 - arraysize(fetch 1회 당 행 수), prefetchrows(실행 시 미리 가져올 행 수) 설정
+        :param arraysize: None 이면 세션 기본 설정 사용
+        :param prefetchrows: None 이면 세션 기본 설정 사용
+        :return: cx_Oracle.Cursor
+        """
+        if self._connection is None:
+            raise DataSourceError('Data Source session is not initialized')
+
+        cursor = self._connection.cursor()
+        arraysize = arraysize or self._arraysize
+        prefetchrows = prefetchrows or self._prefetchrows
+        if arraysize:
+            cursor.arraysize = arraysize
+        if prefetchrows:
+            cursor.prefetchrows = prefetchrows
+        return cursor
 
     def get_connection(self):
         """
@@ -54,18 +80,17 @@ class OracleSqlSession(AbstractSession):
         """
         self._data_source.release_session(self)
 
-    def select(self, sql: str, params: dict):
+    def select(self, sql: str, params: dict, arraysize: int = None, prefetchrows: int = None):
         """
         Data Source로부터 Query문 결과 Array를 가져오는 처리
         :param sql: sql string
         :param params: sql 파라미터
+        :param arraysize: 한 번에 가져올 행 수
+        :param prefetchrows: 조회 실행 시 미리 가져올 행 수
         :return: {"columns" : columns, "data" : list}
         """
-        if self._connection is None:
-            raise DataSourceError('Data Source session is not initialized')
-
+        cursor = self._open_cursor(arraysize, prefetchrows)
         try:
-            cursor = self._connection.cursor()
             cursor.execute(sql, params or {})
             columns = [d[0] for d in cursor.description]
             result = cursor.fetchall()
@@ -76,6 +101,48 @@ class OracleSqlSession(AbstractSession):
             error_code = error.code
             raise DataSourceError("Oracle database select Error", e, error_code)
 
+    def select_iter(self, sql: str, params: dict, arraysize: int = None, prefetchrows: int = None):
+        """
+        Data Source로부터 Query문 결과를 arraysize 행 단위(fetchmany)로 나누어 가져오는 처리
+        조회 결과 전체를 list 로 만들지 않으므로 map_iter / hash_map 과 함께 사용 시 결과가 두 번 복사되지 않음
+        :param sql: sql string
+        :param params: sql 파라미터
+        :param arraysize: 한 번에 가져올 행 수
+        :param prefetchrows: 조회 실행 시 미리 가져올 행 수
+        :return: {"columns" : columns, "data" : iterator}
+        """
+        cursor = self._open_cursor(arraysize, prefetchrows)
+        try:
+            cursor.execute(sql, params or {})
+            columns = [d[0] for d in cursor.description]
+        except cx_Oracle.DatabaseError as e:
+            cursor.close()
+            error, = e.args
+            error_code = error.code
+            raise DataSourceError("Oracle database select Error", e, error_code)
+
+        return {"columns": columns, "data": self._iter_rows(cursor)}
+
+    @staticmethod
+    def _iter_rows(cursor):
+        """
+        cursor 의 조회 결과를 arraysize 행 단위로 가져오면서 한 행씩 반환, 모두 가져오면 cursor 를 닫음
+        :param cursor: 조회 실행된 cx_Oracle.Cursor
+        :return: generator of row
+        """
+        try:
+            while True:
+                rows: list = cursor.fetchmany()
+                if not rows:
+                    break
+                yield from rows
+        except cx_Oracle.DatabaseError as e:
+            error, = e.args
+            error_code = error.code
+            raise DataSourceError("Oracle database select Error", e, error_code)
+        finally:
+            cursor.close()
+
     def execute(self, sql_template: str, data_list: list):
         """
         CRUD 쿼리문을 실행하는 처리
@@ -97,6 +164,48 @@ class OracleSqlSession(AbstractSession):
             print("Row", cursor.rowcount, "has error", error.message)
             raise DataSourceError("Oracle database execute Error", error_code)
 
+    def execute_chunks(self, sql_template: str, data_iter, chunk_size: int, input_sizes: list = None):
+        """
+        CUD 대상 데이터를 chunk_size 행 단위로 나누어 실행하는 처리
+        하나의 cursor 를 재사용하고, input_sizes 가 주어지면 setinputsizes 로 bind 버퍼 크기를 고정하여
+        chunk 마다 bind 변수를 다시 할당하지 않도록 함 (모든 chunk 실행 후 한 번에 commit)
+        :param sql_template: sql template
+        :param data_iter: CUD 대상 데이터 iterable
+        :param chunk_size: 한 번에 실행할 행 수
+        :param input_sizes: bind 변수 별 크기/타입 정보 - cursor.setinputsizes( ) 인자
+        :return: int : 실행한 행 수
+        """
+        if self._connection is None:
+            raise DataSourceError('Data Source session is not initialized')
+
+        cursor = self._connection.cursor()
+        if input_sizes:
+            cursor.setinputsizes(*input_sizes)
+        cursor.prepare(sql_template)
+
+        count: int = 0
+        chunk: list = []
+        try:
+            for row in data_iter:
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    cursor.executemany(None, chunk)
+                    count += len(chunk)
+                    chunk = []
+            if chunk:
+                cursor.executemany(None, chunk)
+                count += len(chunk)
+            self._connection.commit()
+            return count
+        except cx_Oracle.DatabaseError as e:
+            error, = e.args
+            error_code = error.code
+            self._connection.rollback()
+            print("Row", count + cursor.rowcount, "has error", error.message)
+            raise DataSourceError("Oracle database execute Error", error_code)
+        finally:
+            cursor.close()
+
     def execute_procedure(self, procedure_name: str, params):
         """
         DB 에 저장된 프로시져를 호출하는 처리
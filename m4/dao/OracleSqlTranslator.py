@@ -0,0 +1,111 @@
+import datetime
+import re
+import sqlite3
+
+from m4.util.DateTimeUtility import DateTimeUtility
+
+
+class OracleSqlTranslator:
+    """
+    Oracle Sql Translator
+    DAO 들이 사용하는 Oracle SQL 을 sqlite3 에서 실행할 수 있도록 변환하는 클래스
+        - schema 접두어(SCMV2.) 제거
+        - SELECT UNIQUE -> SELECT DISTINCT
+        - 순번 bind 변수(:1, :2, ...) -> ?1, ?2, ...
+        - TO_DATE( ), DECODE( ) 함수는 sqlite3 사용자 함수로 등록
+    TO_DATE( ) 는 EPOCH 로부터의 일(day) 수 실수를 반환하므로 +1 등 날짜 연산이 Oracle 과 같이 동작하며,
+    조회 결과의 TO_DATE( ) column 은 datetime.datetime 으로 변환
+    """
+
+    # TO_DATE( ) 결과 기준 시각
+    EPOCH: datetime.datetime = datetime.datetime(1970, 1, 1)
+
+    # TO_DATE( ) 결과 column 을 datetime 으로 변환하는 sqlite3 converter 이름
+    DATE_TYPE: str = 'ORADATE'
+
+    # Oracle 날짜 format -> strptime format (긴 것부터 변환)
+    DATE_FORMATS: tuple = (('YYYY', '%Y'), ('HH24', '%H'), ('MM', '%m'), ('DD', '%d'), ('MI', '%M'), ('SS', '%S'))
+
+    # 변환 pattern
+    _SCHEMA_PATTERN = re.compile(r'\bSCMV2\.', re.IGNORECASE)
+    _UNIQUE_PATTERN = re.compile(r'\bSELECT\s+UNIQUE\b', re.IGNORECASE)
+    _POSITION_BIND_PATTERN = re.compile(r'(?<![\w:]):(\d+)\b')
+    _DATE_COLUMN_PATTERN = re.compile(
+        r'(TO_DATE\s*\((?:[^()]|\([^()]*\))*\)(?:\s*[+-]\s*\d+(?:\.\d+)?)?)'
+        r'\s+(?:AS\s+)?(?!(?:AND|OR|FROM|WHERE|ORDER|GROUP|THEN|ELSE|END)\b)([A-Z_]\w*)',
+        re.IGNORECASE)
+
+    # 변환된 SQL cache { Oracle SQL: sqlite3 SQL }
+    _translated: dict = {}
+
+    @classmethod
+    def translate(cls, sql: str) -> str:
+        """
+        Oracle SQL 을 sqlite3 SQL 로 변환
+        :param sql: Oracle SQL
+        :return: sqlite3 SQL
+        """
+        translated: str = cls._translated.get(sql)
+        if translated is None:
+            translated = cls._SCHEMA_PATTERN.sub('', sql)
+            translated = cls._UNIQUE_PATTERN.sub('SELECT DISTINCT', translated)
+            translated = cls._POSITION_BIND_PATTERN.sub(r'?\1', translated)
+            translated = cls._DATE_COLUMN_PATTERN.sub(rf'\1 AS "\2 [{cls.DATE_TYPE}]"', translated)
+            cls._translated[sql] = translated
+        return translated
+
+    @classmethod
+    def connect(cls, database: str = ':memory:') -> sqlite3.Connection:
+        """
+        Oracle 함수가 등록된 sqlite3 Connection 생성 (여러 thread 의 세션이 공유)
+        :param database: sqlite3 database 파일 경로
+        :return: sqlite3.Connection
+        """
+        connection: sqlite3.Connection = sqlite3.connect(database, detect_types=sqlite3.PARSE_COLNAMES,
+                                                         check_same_thread=False)
+        connection.create_function('TO_DATE', 2, cls._to_date, deterministic=True)
+        connection.create_function('DECODE', -1, cls._decode, deterministic=True)
+        return connection
+
+    @classmethod
+    def convert_row(cls, row) -> tuple:
+        """
+        CUD 대상 행의 값을 sqlite3 에 저장할 수 있는 값으로 변환 (datetime -> 문자열)
+        :param row: CUD 대상 행
+        :return: tuple
+        """
+        return tuple(DateTimeUtility.convert_date_to_str(value) if isinstance(value, datetime.datetime) else value
+                     for value in row)
+
+    @classmethod
+    def _to_date(cls, value, fmt: str):
+        """
+        TO_DATE(value, fmt) : EPOCH 로부터의 일(day) 수
+        """
+        if value is None or fmt is None:
+            return None
+        fmt = fmt.upper()
+        for oracle_format, python_format in cls.DATE_FORMATS:
+            fmt = fmt.replace(oracle_format, python_format)
+        date: datetime.datetime = datetime.datetime.strptime(str(value), fmt)
+        return (date - cls.EPOCH).total_seconds() / 86400
+
+    @classmethod
+    def _from_date(cls, value: bytes) -> datetime.datetime:
+        """
+        TO_DATE( ) 결과(EPOCH 로부터의 일 수)를 초 단위 datetime 으로 변환
+        """
+        return cls.EPOCH + datetime.timedelta(seconds=round(float(value) * 86400))
+
+    @staticmethod
+    def _decode(value, *args):
+        """
+        DECODE(value, search1, result1, search2, result2, ..., default)
+        """
+        for index in range(0, len(args) - 1, 2):
+            if value == args[index]:
+                return args[index + 1]
+        return args[-1] if len(args) % 2 == 1 else None
+
+
+sqlite3.register_converter(OracleSqlTranslator.DATE_TYPE, OracleSqlTranslator._from_date)
@@ -16,7 +16,7 @@ class PlanVersionDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("select * from FS_PLAN_VER where plan_ver_id = :plan_version_id", params)
+        return self._select(session, "select * from FS_PLAN_VER where plan_ver_id = :plan_version_id", params)
 
     def select(self, session: AbstractSession, **params):
         pass
@@ -15,7 +15,7 @@ class ProcessDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("select * from FS_BOR", params)
+        return self._select(session, "select * from FS_BOR", params)
 
     def select_one(self, session: AbstractSession, **params):
         """
@@ -24,7 +24,7 @@ class ProcessDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("select * from CM_PLANT", params)
+        return self._select(session, "select * from CM_PLANT", params)
 
     def select_route_process(self, session: AbstractSession, **params):
         """
@@ -33,7 +33,7 @@ class ProcessDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select(
+        return self._select(session,
             """
                SELECT *
                FROM FS_PROC
@@ -49,7 +49,7 @@ class ProcessDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select(
+        return self._select(session,
             """
                SELECT *
                FROM FS_BOR
@@ -22,7 +22,7 @@ class ResourceCalendarDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("select * from FS_FACTORY", params)
+        return self._select(session, "select * from FS_FACTORY", params)
 
     def select_list(self, session: AbstractSession, **params):
         """
@@ -31,7 +31,7 @@ class ResourceCalendarDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select(
+        return self._select(session,
             """
                 SELECT MST.FACTRY_SCHDL_ID   AS CAL_ID
                      , MST.FACTRY_SCHDL_NM   AS CAL_NAME
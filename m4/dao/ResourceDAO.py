@@ -18,7 +18,7 @@ class ResourceDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("select * from FS_RESC", params)
+        return self._select(session, "select * from FS_RESC", params)
 
     def select_route_resource(self, session: AbstractSession, **params):
         """
@@ -27,7 +27,7 @@ class ResourceDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select(
+        return self._select(session,
             """
                 SELECT T1.*
                   FROM FS_RESC T1
@@ -47,7 +47,7 @@ class ResourceDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select(
+        return self._select(session,
             """
             SELECT /*+ LEADING(R1) */
                    TO_DATE(T1.START_DT_HMS, 'YYYYMMDDHH24MISS') START_DATE, 
@@ -77,7 +77,7 @@ class ResourceDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select(
+        return self._select(session,
             """
             SELECT /*+ LEADING(R1) */
                    R1.RESC_ID, MAX(T1.PRIORITY) AS PRIORITY
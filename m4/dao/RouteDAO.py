@@ -27,7 +27,7 @@ class RouteDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select(
+        return self._select(session,
             """
             SELECT *
             FROM FS_ROUTE
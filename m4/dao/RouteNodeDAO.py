@@ -24,7 +24,7 @@ class RouteDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select(
+        return self._select(session,
             """
             SELECT *
               FROM FS_ROUTE
@@ -38,7 +38,7 @@ class RouteDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select(
+        return self._select(session,
             """
             SELECT CURR_LOC_ID, MAX(CURR_LOC_TYP) AS CURR_LOC_TYP
               FROM  
@@ -60,7 +60,7 @@ class RouteDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select(
+        return self._select(session,
             """
             SELECT CURR_LOC_ID, MAX(CURR_LOC_TYP) AS CURR_LOC_TYP, NEXT_LOC_ID, MAX(NEXT_LOC_TYP) AS NEXT_LOC_TYP
               FROM FS_ROUTE
@@ -0,0 +1,88 @@
+import os
+import sqlite3
+
+from m4.common.SingletonInstance import SingletonInstance
+from m4.dao.AbstractDataSource import AbstractDataSource
+from m4.dao.DataSourceError import DataSourceError
+from m4.dao.OracleSqlTranslator import OracleSqlTranslator
+from m4.dao.SQLiteSession import SQLiteSession
+from m4.ApplicationConfiguration import ApplicationConfiguration
+
+
+class SQLiteDataSource(AbstractDataSource, SingletonInstance):
+    """
+    SQLite Data Source 클래스
+    로컬 sqlite3 database 파일을 Oracle 대신 사용하는 Data Source
+    테이블 구조는 resources/m4_sqlite_schema.sql, 데이터는 SQLiteLoader 로 불러옴
+    세션마다 별도의 connection 을 사용하므로 DataLoader 등에서 여러 thread 가 동시에 조회 가능
+    """
+
+    # schema bootstrap script
+    SCHEMA_FILE: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                    'resources', 'm4_sqlite_schema.sql')
+
+    def __init__(self):
+        """
+        생성자 : SQLiteDataSource 클래스 멤버 변수들
+        """
+        super(__class__, self).__init__()
+        self._database: str = None
+
+    # Public 메서드
+    def init(self, config: ApplicationConfiguration, database: str = None):
+        """
+        sqlite3 database 파일 초기화 - 테이블이 없을 경우 schema bootstrap script 실행
+        :param: config - Application Configuration
+        :param: database - database 파일 경로 (없을 경우 m4.properties [SQLiteSource] sqlite.database)
+        """
+        self._database = database or config.find('SQLiteSource', 'sqlite.database', './m4.db')
+
+        try:
+            connection: sqlite3.Connection = OracleSqlTranslator.connect(self._database)
+            try:
+                # 조회 세션과 결과 저장 세션이 동시에 사용할 수 있도록 WAL 모드 사용
+                connection.execute('PRAGMA journal_mode=WAL')
+                self.create_schema(connection)
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            raise DataSourceError(f"SQLite data source init Error : {self._database}", e)
+
+    def get_session(self):
+        """
+        Data Source로부터 가용 세션을 획득하고 Data IO를 위한 세션 인스턴스를 반환
+        :return: SQLiteSession 인스턴스
+        """
+        if self._database is None:
+            return None
+
+        session: SQLiteSession = SQLiteSession()
+        session.init(self, OracleSqlTranslator.connect(self._database))
+        return session
+
+    def release_session(self, session: SQLiteSession):
+        """
+        생성된 세션을 반환 - 세션의 connection 종료
+        :param session: SQLiteSession 인스턴스
+        :return: void
+        """
+        if session is None:
+            return
+        session.get_connection().close()
+
+    def close(self):
+        """
+        DataSource 비 사용 상태로 전환
+        :return: void
+        """
+        self._database = None
+
+    @classmethod
+    def create_schema(cls, connection: sqlite3.Connection):
+        """
+        schema bootstrap script 실행 (이미 있는 테이블은 유지)
+        :param connection: sqlite3.Connection
+        :return: void
+        """
+        with open(cls.SCHEMA_FILE, encoding='utf-8') as file:
+            connection.executescript(file.read())
@@ -0,0 +1,119 @@
+import glob
+import os
+import sqlite3
+import sys
+
+from m4.dao.AbstractSession import AbstractSession
+from m4.dao.FileDataSource import FileDataSource
+from m4.dao.OracleSqlTranslator import OracleSqlTranslator
+from m4.dao.SQLiteDataSource import SQLiteDataSource
+
+
+class SQLiteLoader:
+    """
+    SQLite Loader
+    내보낸(export) 생산 일정 계획 버전 데이터를 SQLiteDataSource 의 database 로 불러오는 클래스
+        - CSV 디렉토리 (테이블명.csv, 첫 행이 column 명)
+        - 다른 Data Source 의 세션 (ex. OracleSqlSession - schema 의 테이블을 그대로 복사)
+    시뮬레이션(SIM_ID) 또는 계획 버전(PLAN_VER_ID) column 이 있는 테이블은 불러오는 버전/시뮬레이션의 행만 교체하고,
+    그 외 기준 정보 테이블은 전체를 교체
+    """
+
+    # 시뮬레이션 결과 테이블 (불러오지 않음)
+    RESULT_TABLES: tuple = ('FS_SCHDL_RSLT_TEST', 'FS_SIM_SNAPSHOT')
+
+    # 행 교체 범위 column (앞에 있는 column 우선)
+    SCOPE_COLUMNS: tuple = ('SIM_ID', 'PLAN_VER_ID')
+
+    @classmethod
+    def load_csv_directory(cls, session: AbstractSession, directory: str, encoding: str = 'utf-8-sig') -> dict:
+        """
+        CSV 디렉토리의 테이블들을 불러오기
+        :param session: SQLiteSession 인스턴스
+        :param directory: CSV 디렉토리
+        :param encoding: CSV 파일 encoding
+        :return: { 테이블명: 불러온 행 수 }
+        """
+        counts: dict = {}
+        connection: sqlite3.Connection = session.get_connection()
+        with connection:
+            for path in sorted(glob.glob(os.path.join(glob.escape(directory), '*.csv'))):
+                table: str = os.path.splitext(os.path.basename(path))[0].upper()
+                counts[table] = cls._load_table(connection, table, FileDataSource.read_csv(path, encoding))
+        return counts
+
+    @classmethod
+    def load_session(cls, session: AbstractSession, source_session: AbstractSession, tables: list = None) -> dict:
+        """
+        다른 Data Source 의 테이블들을 그대로 불러오기
+        :param session: SQLiteSession 인스턴스
+        :param source_session: 원본 Data Source 의 AbstractSession 인스턴스
+        :param tables: 불러올 테이블명 목록 (없을 경우 결과 테이블을 제외한 schema 의 모든 테이블)
+        :return: { 테이블명: 불러온 행 수 }
+        """
+        connection: sqlite3.Connection = session.get_connection()
+        if tables is None:
+            tables = [table for table, in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name")
+                      if table not in cls.RESULT_TABLES]
+
+        counts: dict = {}
+        with connection:
+            for table in tables:
+                result: dict = source_session.select(f"SELECT * FROM {table}", {})
+                counts[table] = cls._load_table(connection, table, {
+                    "columns": [column.upper() for column in result["columns"]],
+                    "data": [list(OracleSqlTranslator.convert_row(row)) for row in result["data"]]
+                })
+        return counts
+
+    @classmethod
+    def _load_table(cls, connection: sqlite3.Connection, table: str, contents: dict) -> int:
+        """
+        테이블 한 개 불러오기 - 테이블/column 이 없을 경우 추가, 교체 범위의 기존 행 삭제 후 입력
+        :param connection: sqlite3.Connection
+        :param table: 테이블명
+        :param contents: {"columns" : columns, "data" : list}
+        :return: 불러온 행 수
+        """
+        columns: list = contents["columns"]
+        data: list = contents["data"]
+
+        table_columns: list = [row[1].upper() for row in connection.execute(f'PRAGMA table_info("{table}")')]
+        if not table_columns:
+            column_list: str = ', '.join(f'"{column}"' for column in columns)
+            connection.execute(f'CREATE TABLE "{table}" ({column_list})')
+        else:
+            for column in columns:
+                if column not in table_columns:
+                    connection.execute(f'ALTER TABLE "{table}" ADD COLUMN "{column}"')
+
+        scope_column: str = next((column for column in cls.SCOPE_COLUMNS if column in columns), None)
+        if scope_column is None:
+            connection.execute(f'DELETE FROM "{table}"')
+        else:
+            index: int = columns.index(scope_column)
+            for value in {row[index] for row in data if index < len(row)}:
+                connection.execute(f'DELETE FROM "{table}" WHERE "{scope_column}" = ?', (value,))
+
+        column_list: str = ', '.join(f'"{column}"' for column in columns)
+        connection.executemany(f'INSERT INTO "{table}" ({column_list}) VALUES ({", ".join("?" * len(columns))})',
+                               [row + [None] * (len(columns) - len(row)) for row in data])
+        return len(data)
+
+
+if __name__ == '__main__':
+    # python -m m4.dao.SQLiteLoader <CSV 디렉토리> [database 파일]
+    from m4.ApplicationConfiguration import ApplicationConfiguration
+
+    config: ApplicationConfiguration = ApplicationConfiguration.instance()
+    config.init('m4.properties')
+
+    data_source: SQLiteDataSource = SQLiteDataSource.instance()
+    data_source.init(config, database=sys.argv[2] if len(sys.argv) > 2 else None)
+    loader_session = data_source.get_session()
+    try:
+        for loaded_table, count in SQLiteLoader.load_csv_directory(loader_session, sys.argv[1]).items():
+            print(f"{loaded_table} : {count} rows")
+    finally:
+        loader_session.close()
@@ -0,0 +1,143 @@
+import sqlite3
+import threading
+
+from ..dao.AbstractDataSource import AbstractDataSource
+from ..dao.AbstractSession import AbstractSession
+from ..dao.DataSourceError import DataSourceError
+from ..dao.OracleSqlTranslator import OracleSqlTranslator
+
+
+class SQLiteSession(AbstractSession):
+    """
+    SQLite Session 클래스
+    DAO 의 Oracle SQL 을 OracleSqlTranslator 로 변환하여 sqlite3 Connection 으로 실행
+    """
+
+    def __init__(self):
+        """
+        생성자 : SQLiteSession
+        """
+        self._data_source: AbstractDataSource = None
+        self._connection: sqlite3.Connection = None
+        self._lock: threading.RLock = None
+
+    # Public 메서드
+    def init(self, data_source: AbstractDataSource, connection: sqlite3.Connection, lock: threading.RLock = None):
+        """
+        Data Source와 Connection 객체 초기화
+        :param data_source: 세션을 생성한 Data Source
+        :param connection: sqlite3.Connection
+        :param lock: 여러 세션이 connection 을 공유할 경우 실행 시 사용할 lock (없을 경우 세션 전용 lock)
+        """
+        self._data_source = data_source
+        self._connection = connection
+        self._lock = threading.RLock() if lock is None else lock
+
+    def get_connection(self):
+        """
+        Data Source Connection 객체를 반환
+        """
+        return self._connection
+
+    def commit(self):
+        """
+        commit
+        """
+        with self._lock:
+            self._connection.commit()
+
+    def rollback(self):
+        """
+        rollback
+        """
+        with self._lock:
+            self._connection.rollback()
+
+    def close(self):
+        """
+        생성된 세션을 반환
+        :return: void
+        """
+        self._data_source.release_session(self)
+
+    def select(self, sql: str, params: dict, arraysize: int = None, prefetchrows: int = None):
+        """
+        Data Source로부터 Query문 결과 Array를 가져오는 처리
+        :param sql: sql string (Oracle SQL)
+        :param params: sql 파라미터
+        :param arraysize: 사용하지 않음
+        :param prefetchrows: 사용하지 않음
+        :return: {"columns" : columns, "data" : list}
+        """
+        if self._connection is None:
+            raise DataSourceError('Data Source session is not initialized')
+
+        try:
+            with self._lock:
+                cursor = self._connection.execute(OracleSqlTranslator.translate(sql), params or {})
+                columns = [d[0].upper() for d in cursor.description]
+                result = cursor.fetchall()
+            return {"columns": columns, "data": result}
+        except (sqlite3.Error, ValueError) as e:
+            raise DataSourceError("SQLite data source select Error", e)
+
+    def execute(self, sql_template: str, data_list: list):
+        """
+        CRUD 쿼리문을 실행하는 처리
+        :param sql_template: sql template (Oracle SQL)
+        :param data_list:  CUD 대상 데이터
+        :return: True/False : 성공 여부
+        """
+        self.execute_chunks(sql_template, data_list, chunk_size=0)
+        return True
+
+    def execute_chunks(self, sql_template: str, data_iter, chunk_size: int, input_sizes: list = None):
+        """
+        CUD 대상 데이터를 chunk_size 행 단위로 나누어 실행하는 처리 (모든 chunk 실행 후 한 번에 commit)
+        :param sql_template: sql template (Oracle SQL)
+        :param data_iter: CUD 대상 데이터 iterable
+        :param chunk_size: 한 번에 실행할 행 수 (0 이하일 경우 한 번에 실행)
+        :param input_sizes: 사용하지 않음
+        :return: int : 실행한 행 수
+        """
+        if self._connection is None:
+            raise DataSourceError('Data Source session is not initialized')
+
+        sql: str = OracleSqlTranslator.translate(sql_template)
+        count: int = 0
+        chunk: list = []
+        try:
+            with self._lock:
+                self._prepare_execute(sql)
+                for row in data_iter:
+                    chunk.append(OracleSqlTranslator.convert_row(row))
+                    if 0 < chunk_size <= len(chunk):
+                        self._connection.executemany(sql, chunk)
+                        count += len(chunk)
+                        chunk = []
+                if chunk:
+                    self._connection.executemany(sql, chunk)
+                    count += len(chunk)
+                self._connection.commit()
+            return count
+        except sqlite3.Error as e:
+            with self._lock:
+                self._connection.rollback()
+            raise DataSourceError("SQLite data source execute Error", e)
+
+    def execute_procedure(self, procedure_name: str, params):
+        """
+        DB 에 저장된 프로시져를 호출하는 처리 - SQLite 는 지원하지 않음
+        :param procedure_name: procedure name
+        :param params: procedure 파라미터
+        :return: True/False : 성공 여부
+        """
+        raise DataSourceError(f"SQLite data source does not support procedure : {procedure_name}")
+
+    def _prepare_execute(self, sql: str):
+        """
+        CUD 실행 전 처리 (Data Source 에 따라 재정의)
+        :param sql: sqlite3 SQL (OracleSqlTranslator 변환 후)
+        :return: void
+        """
+        pass
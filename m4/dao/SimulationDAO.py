@@ -16,7 +16,7 @@ class SimulationDAO(AbstractDAO, SingletonInstance):
         :param params: sql 파라미터 데이터
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("select * from FS_SIM where sim_id = :simulation_id", params)
+        return self._select(session, "select * from FS_SIM where sim_id = :simulation_id", params)
 
     def select(self, session: AbstractSession, **params):
         pass
@@ -0,0 +1,30 @@
+from m4.common.SingletonInstance import SingletonInstance
+from m4.dao.AbstractDAO import AbstractDAO
+from m4.dao.AbstractSession import AbstractSession
+
+
+class SnapshotDAO(AbstractDAO, SingletonInstance):
+    """
+    Simulation Snapshot Data Access Object
+    """
+
+    def select(self, session: AbstractSession, **params):
+        pass
+
+    def select_one(self, session: AbstractSession, **params):
+        pass
+
+    def execute(self, session: AbstractSession, data_list: list):
+        """
+        세션 인스턴스를 통해 Data Source에 snapshot 행들을 한 번에(executemany) 저장
+        :param session: AbstractSession 인스턴스
+        :param data_list: [(PLAN_VER_ID, SIM_ID, TIME_INDEX, SNAPSHOT_DT_HMS, EVENT_CNT), ...]
+        :return: True/False
+        """
+
+        sql_template = """
+        INSERT INTO SCMV2.FS_SIM_SNAPSHOT(
+            PLAN_VER_ID, SIM_ID, TIME_INDEX, SNAPSHOT_DT_HMS, EVENT_CNT
+        )values(:1, :2, :3, :4, :5)"""
+
+        return session.execute(sql_template=sql_template, data_list=data_list)
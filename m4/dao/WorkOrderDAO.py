@@ -24,7 +24,7 @@ class WorkOrderDAO(AbstractDAO, SingletonInstance):
         :param params: SQL Parameter Data
         :return: {"columns" : columns, "data" : list}
         """
-        return session.select("""
+        return self._select(session, """
             SELECT T1.PLAN_VER_ID
                  , T1.WORK_ORDER_ID
                  , T1.ORDER_ITEM_ID
@@ -1,7 +1,9 @@
 from typing import List, Dict
 from collections import defaultdict
 
+from m4.dao.AbstractDataSource import AbstractDataSource
 from m4.dao.AbstractSession import AbstractSession
+from m4.dao.DataLoader import DataLoader
 from m4.dao.FactoryDAO import FactoryDAO
 from m4.dao.FactoryScheduleDAO import FactoryScheduleDAO
 from m4.dao.BomDAO import BomDAO
@@ -39,26 +41,45 @@ class FactoryBuilder:
     _end_location: str = ''
 
     @classmethod
-    def build(cls, plan_version_dict: dict, simulation_dict: dict, config: ApplicationConfiguration, session: AbstractSession):
+    def build(cls, plan_version_dict: dict, simulation_dict: dict, config: ApplicationConfiguration,
+              session: AbstractSession, data_source: AbstractDataSource = None):
+        """
+        기준 정보로부터 Factory 인스턴스 구성
+        서로 독립적인 기준 정보 조회는 data_source 가 주어질 경우 DataLoader 로 동시에 실행한 뒤 조립
+        :param plan_version_dict: 생산 일정 계획 버전 정보
+        :param simulation_dict: 시뮬레이션 정보
+        :param config: ApplicationConfiguration 인스턴스
+        :param session: Abstract Session
+        :param data_source: 조회 작업마다 세션을 받아올 Data Source (None 이면 session 하나로 차례로 조회)
+        :return: Factory
+        """
 
         # config 객체로부터 설정 정보 받아오기
         use_backward_size: bool = bool(config.find('Backward', 'backward.res.size'))
+        load_workers: int = int(config.find('DatabaseSource', 'ds.load.workers', '1'))
 
         instance: Factory = Factory()
 
-        factory_info, bom, work_order_master = cls._get_dao_data(session)
-
-        schedule_constraint = cls._init_schedule_constraint(simulation_dict, session)
+        # 서로 독립적인 기준 정보 조회 (및 조회 결과만으로 만들 수 있는 인스턴스 생성)
+        loaded: dict = DataLoader.load({
+            'dao_data': cls._get_dao_data,
+            'schedule_constraint': lambda s: cls._init_schedule_constraint(simulation_dict, s),
+            'inventories': lambda s: cls._init_inventories(plan_version_dict, simulation_dict, s),
+            'inv_start_end_location': lambda s: cls._init_inv_start_end_location(simulation_dict, s),    # 임시
+            'resources': lambda s: cls._init_resources(simulation_dict, s),
+            'process_data': lambda s: cls._load_processes(simulation_dict, s),
+            'route_data': lambda s: cls._load_routes(simulation_dict, s),
+        }, session=session, data_source=data_source, max_workers=load_workers)
 
-        inventories = cls._init_inventories(plan_version_dict, simulation_dict, session)
+        factory_info, bom, work_order_master = loaded['dao_data']
+        schedule_constraint = loaded['schedule_constraint']
+        inventories = loaded['inventories']
+        resources = loaded['resources']
 
-        cls._init_inv_start_end_location(simulation_dict, session)    # 임시
+        # 앞서 생성된 인스턴스들을 이용하는 조립 단계
+        processes = cls._init_processes(resources, loaded['process_data'], use_backward_size)
 
-        resources = cls._init_resources(simulation_dict, session)
-
-        processes = cls._init_processes(resources, simulation_dict, use_backward_size, session)
-
-        routes = cls._init_routes(inventories, processes, work_order_master, simulation_dict, use_backward_size, session)
+        routes = cls._init_routes(inventories, processes, work_order_master, loaded['route_data'], use_backward_size)
 
         # 공장 내 Route 객체들을 초기화
         # _next_to_curr_item_dict = cls._create_next_to_curr_item_dict(route_master=route_master)
@@ -114,9 +135,10 @@ class FactoryBuilder:
         simulation_id = simulation_dict['SIM_ID']
         plan_start_date = DateTimeUtility.convert_str_to_date(plan_version_dict['START_DT_HMS'])
         dao: InventoryDAO = InventoryDAO.instance()
-        inventory_data = dao.map(dao.select_route_inventory(session=session, simulation_id=simulation_id))
-        item_dict: dict = dao.hash_map(dao.select_route_item(session, simulation_id=simulation_id), "INV_ID")
-        item_constraint_dict: dict = dao.hash_map(dao.select_route_item_constraint(session, simulation_id=simulation_id), "INV_ID")
+        # 한 번씩만 순회하는 조회 결과는 stream 으로 받아 list 로 한 번 더 복사하지 않도록
+        item_dict: dict = dao.hash_map(dao.select_route_item(session, simulation_id=simulation_id, stream=True), "INV_ID")
+        item_constraint_dict: dict = dao.hash_map(dao.select_route_item_constraint(session, simulation_id=simulation_id, stream=True), "INV_ID")
+        inventory_data = dao.map_iter(dao.select_route_inventory(session=session, simulation_id=simulation_id, stream=True))
 
         inventories: dict = {}
         for inv in inventory_data:
@@ -167,9 +189,9 @@ class FactoryBuilder:
         # ResourceDAO로 부터 기준 정보 받아오기
         simulation_id = simulation_dict['SIM_ID']
         dao: ResourceDAO = ResourceDAO.instance()
-        resource_data = dao.map(dao.select_route_resource(session, simulation_id=simulation_id))
-        constraint_dict: dict = dao.hash_map(dao.select_route_constraint(session, simulation_id=simulation_id), "RESC_ID")
-        constraint_max_priority_dict = dao.hash_map(dao.select_route_constraint_max_priority(session, simulation_id=simulation_id), "RESC_ID")
+        constraint_dict: dict = dao.hash_map(dao.select_route_constraint(session, simulation_id=simulation_id, stream=True), "RESC_ID")
+        constraint_max_priority_dict = dao.hash_map(dao.select_route_constraint_max_priority(session, simulation_id=simulation_id, stream=True), "RESC_ID")
+        resource_data = dao.map_iter(dao.select_route_resource(session, simulation_id=simulation_id, stream=True))
 
         resources: dict = {}
         for res in resource_data:
@@ -185,19 +207,29 @@ class FactoryBuilder:
         return resources
 
     @classmethod
-    def _init_processes(cls, resources: dict, simulation_dict, use_backward_size: bool, session: AbstractSession):
+    def _load_processes(cls, simulation_dict, session: AbstractSession):
         """
-        :param resources: resources 객체
         :param simulation_dict: simulation_dict 정보
         :param session: Abstract Session
-        :return: dict
+        :return: (process_data, bor_dict)
         """
 
         # ProcessDAO로 부터 기준 정보 받아오기
         simulation_id = simulation_dict['SIM_ID']
         dao: ProcessDAO = ProcessDAO.instance()
-        process_data = dao.map(dao.select_route_process(session, simulation_id=simulation_id))
-        bor_dict: dict = dao.hash_map(dao.select_route_bor(session, simulation_id=simulation_id), "PROC_ID")
+        bor_dict: dict = dao.hash_map(dao.select_route_bor(session, simulation_id=simulation_id, stream=True), "PROC_ID")
+        process_data: list = dao.map(dao.select_route_process(session, simulation_id=simulation_id, stream=True))
+
+        return process_data, bor_dict
+
+    @classmethod
+    def _init_processes(cls, resources: dict, process_load: tuple, use_backward_size: bool):
+        """
+        :param resources: resources 객체
+        :param process_load: _load_processes( ) 조회 결과
+        :return: dict
+        """
+        process_data, bor_dict = process_load
 
         processes: dict = {}
         for proc in process_data:
@@ -306,16 +338,13 @@ class FactoryBuilder:
         return item_to_end_item_dict
 
     @classmethod
-    def _init_routes(cls, inventories: dict, processes: dict, work_order_master: list,
-                     simulation_dict, use_backward_size: bool, session: AbstractSession) -> dict:
+    def _load_routes(cls, simulation_dict, session: AbstractSession):
         """
 
-        :param inventories:
-        :param processes:
-        :param work_order_master:
         :param simulation_dict:
         :param session:
-        :return:
+        :return: (route_master, route_node_list, previous_loc_dict, next_loc_dict,
+                  previous_route_dict, next_route_dict)
         """
 
         # Simulation ID
@@ -340,6 +369,22 @@ class FactoryBuilder:
         previous_route_dict = dao.hash_map(route_data, 'NEXT_LOC_ID')   # hash map - Key(NEXT_LOC_ID) 이전 Route Item 정보
         next_route_dict = dao.hash_map(route_data, 'CURR_LOC_ID')       # hash map - Key(NEXT_LOC_ID) 다음 Route Item 정보
 
+        return route_master, route_node_list, previous_loc_dict, next_loc_dict, previous_route_dict, next_route_dict
+
+    @classmethod
+    def _init_routes(cls, inventories: dict, processes: dict, work_order_master: list,
+                     route_load: tuple, use_backward_size: bool) -> dict:
+        """
+
+        :param inventories:
+        :param processes:
+        :param work_order_master:
+        :param route_load: _load_routes( ) 조회 결과
+        :return:
+        """
+        route_master, route_node_list, previous_loc_dict, next_loc_dict, previous_route_dict, next_route_dict = \
+            route_load
+
         # Work Order 정보 초기화
         work_order_item_list = cls._create_work_order_item_list(work_order_master=work_order_master)
 
@@ -1,6 +1,7 @@
 import datetime
-from typing import List, Dict
-from collections import defaultdict
+import heapq
+from typing import List, Dict, Tuple
+from collections import defaultdict, deque
 
 from m4.common.SingletonInstance import SingletonInstance
 from ..backward.BackwardStepPlan import BackwardStepPlan
@@ -10,6 +11,7 @@ from ..operator.AbstractNode import AbstractNode
 from ..operator.Inventory import Inventory
 from ..operator.Route import Route
 from ..operator.RouteAttribute import RouteAttribute
+from ..operator.RouteException import RouteException
 from ..operator.Process import Process
 from ..operator.process.ProcessLot import ProcessLot
 from ..operator.process.ProcessResource import ProcessResource
@@ -31,8 +33,18 @@ class FactoryManager(SingletonInstance):
         self._starting_routes: List[Route] = []  # FactoryManager.run() 시에
         self._last_routes: List[Route] = []  # FactoryManager.run() 시에 마지막 Router 부터 이전 Router 로 타고가는 로직의 출발점
         self._route_graph: Dict[Route, List[Route]] = dict()  # Route 네트워크 그래프
+        self._execution_routes: Tuple[Route, ...] = ()  # run() / transfer() 실행 순서 : 마지막 Route 부터 역방향 위상 정렬
         # self._route_paths: List[List[Route]] = []       # Route 네트워크 그래프 역방향 transfer 순서 Path
 
+        # transfer 대상(dirty) Route 관리 - Route 는 _execution_routes 내 위치(index)로 표시
+        # Node 상태 변경(put, fetch, 도착, 작업 시작/완료) 시 해당 Node 의 Route 및 이전 Route 들을 표시
+        self._dirty_routes: set = set()                 # 표시된 Route 위치 (중복 표시 방지)
+        self._dirty_heap: List[int] = []                # 이번 transfer 에서 처리할 Route 위치 heap
+        self._next_dirty_heap: List[int] = []           # 이번 transfer 에서 이미 지나간 위치 - 다음 transfer 에서 처리
+        self._transfer_position: int = -1               # transfer 중인 Route 위치, transfer 중이 아니면 -1
+        self._schedule_routes: Tuple[int, ...] = ()     # 다음 Node 가 Process 인 Route 위치 - 일정 제약 경계마다 표시
+        self._schedule_boundary: datetime.datetime = datetime.datetime.min  # 다음 일정 제약 경계 일시
+
         self._entire_min: int = 0
         self._entire_max: int = 0
 
@@ -111,26 +123,12 @@ class FactoryManager(SingletonInstance):
 
         schedule_const = self._factory.get_time_constraints(run_time)
 
-        # 이미 run 을 수행한 Route 오브젝트들을 기억하기 위한 빈 리스트 초기화 : run() 의 이중 호출 방지
-        already_executed: List[Route] = []
-        previous_routes: List[Route] = []
-
-        # 이전 Route 가 없을 때까지 do-while 패턴 실행 (Python 에 do-while 없음)
-        current_routes: List[Route] = self._last_routes  # 마지막 단계 Route 부터 시작
-        while True:
-            for obj in current_routes:  # 현재 Depth Route 각각에 대해
-                route: Route = obj
-                if route in already_executed:  # .run() 이 호출된 적이 있다면 .run() 하지 않고
-                    continue
-                route.run(run_time, schedule_const)  # .run() 이 호출된 적이 없다면 호출 : 이중 호출 방지
-                already_executed.append(route)  # .run() 이 호출되었으므로 리스트에 추가
-                previous_routes.extend(route.get_previous_routes().values())
-
-            if previous_routes:  # 처리할 이전 Route 가 남아있을 경우 -> 진행
-                current_routes = previous_routes  # 다음 Loop 에서는 이전 Route 들이 .run() 대상
-                previous_routes = []
-                continue
-            break  # 이전 Route 가 없으면 break
+        # 현재 시점에 도착하는 Inventory 이동 입고 처리 (Inventory 의 run() 은 이동을 진행시키지 않음)
+        self._factory.run_moves(run_time['index'], run_time['date'])
+
+        # 초기화 시 계산된 역방향 위상 정렬 순서대로 실행 : 각 Route 는 다음 Route 들이 모두 실행된 후에 실행됨
+        for route in self._execution_routes:
+            route.run(run_time, schedule_const)
 
     def transfer(self, run_time: dict):
         """
@@ -143,6 +141,11 @@ class FactoryManager(SingletonInstance):
         :return:
         """
 
+        # 일정 제약 경계를 지나면 다음 Node 가 Process 인 Route 들의 할당 가능 여부가 바뀔 수 있음
+        if run_time['date'] >= self._schedule_boundary:
+            self._mark_dirty(self._schedule_routes)
+            self._schedule_boundary = self.get_next_schedule_boundary(run_time['date']) or datetime.datetime.max
+
         # 현재 시점이 Off Day 구간 내에 있는 경우, fetch 및 put 작업 할당 할 수 없음
         is_off_day: bool = run_time.get('is_off_day', False)
         if is_off_day:
@@ -150,32 +153,112 @@ class FactoryManager(SingletonInstance):
 
         # Todo: is_off_day 가 False 일 경우, Divisible (Y/N/I) 타입에 따라 실행 가능한 지 아닌 지 판단
 
-        # 이미 동작을 을 수행한 Route 오브젝트들을 기억하기 위한 빈 리스트 초기화 : run() 의 이중 호출 방지
-        already_executed: List[Route] = []
-        previous_routes: List[Route] = []
-
-        # 이전 Route 가 없을 때까지 do-while 패턴 실행 (Python 에 do-while 없음)
-        current_routes: List[Route] = self._last_routes  # 마지막 단계 Route 부터 시작
-        while True:
-            for obj in current_routes:  # 현재 Depth Route 각각에 대해
-                route: Route = obj
-                if route in already_executed:  # 수행된 적이 있다면 수행하지 않고 다음 Route 로
-                    continue
-                route.transfer(run_time)  # 수행된 적이 없다면 호출 : 이중 호출 방지
-                already_executed.append(route)  # 수행되었으므로 리스트에 추가
-                previous_routes.extend(route.get_previous_routes().values())
-
-            if previous_routes:  # 처리할 이전 Route 가 남아있을 경우 -> 진행
-                current_routes = previous_routes  # 다음 Loop 에서는 이전 Route 들이 .run() 대상
-                previous_routes = []
+        # 초기화 시 계산된 역방향 위상 정렬 순서대로 dirty Route 만 실행
+        # transfer 도중 표시되는 Route 는 아직 지나지 않은 위치면 이번에, 지나간 위치면 다음 transfer 에서 실행
+        while self._dirty_heap:
+            self._transfer_position = heapq.heappop(self._dirty_heap)
+            self._execution_routes[self._transfer_position].transfer(run_time)
+            # 자신의 transfer 로 인한 상태 변경은 다시 표시하지 않음
+            self._dirty_routes.discard(self._transfer_position)
+        self._dirty_heap, self._next_dirty_heap = self._next_dirty_heap, []
+        self._transfer_position = -1
+
+    def _mark_dirty(self, positions):
+        """
+        _execution_routes 내 위치의 Route 들을 transfer 대상으로 표시
+        :param positions: Route 위치 목록
+        :return: void
+        """
+        for position in positions:
+            if position in self._dirty_routes:
                 continue
-            break  # 이전 Route 가 없으면 break
+            self._dirty_routes.add(position)
+            if position > self._transfer_position:
+                heapq.heappush(self._dirty_heap, position)
+            else:
+                heapq.heappush(self._next_dirty_heap, position)
+
+    def _mark_all_dirty(self):
+        """
+        전체 Route 를 transfer 대상으로 표시 - Plan / 재고 초기 세팅 시
+        :return: void
+        """
+        self._mark_dirty(range(len(self._execution_routes)))
+
+    def get_event_count(self) -> int:
+        """
+        Factory 내 전체 Node 들의 상태 변경 누적 횟수 합계
+        :return: int
+        """
+        return sum(route.get_current().get_event_count()
+                   for route in self._factory.get_route_list().values())
+
+    def get_next_event_index(self, time_index: int):
+        """
+        Factory 내 전체 Node 들에서 진행 중인 Runtime 들 중 가장 먼저 완료될 시점의 time index
+        :param time_index: 현재 time index
+        :return: int, 진행 중인 Runtime 이 없을 경우 None
+        """
+        indices: List[int] = [index for index in
+                              (route.get_current().get_next_event_index(time_index)
+                               for route in self._factory.get_route_list().values())
+                              if index is not None]
+        next_move_index: int = self._factory.get_next_move_index(time_index)
+        if next_move_index is not None:
+            indices.append(next_move_index)
+        return min(indices) if indices else None
+
+    def fast_forward(self, ticks: int):
+        """
+        상태 변경이 없는 idle tick 들을 Factory 내 전체 Node 들에 대해 한 번에 진행
+        :param ticks: 건너뛸 tick 수
+        :return: void
+        """
+        if ticks <= 0:
+            return
+        for obj in self._factory.get_route_list().values():
+            route: Route = obj
+            route.get_current().fast_forward(ticks)
+
+    def init_schedule_timeline(self, start_date: datetime.datetime, end_date: datetime.datetime):
+        """
+        공장 및 각 Resource 의 일정 제약을 시뮬레이션 기간에 대한 비가용 구간 timeline 으로 compile
+        :param start_date: 시뮬레이션 시작 일시
+        :param end_date: 시뮬레이션 종료 일시
+        :return: void
+        """
+        self._factory.get_schedule_constraint().compile(start_date, end_date)
+        for resource in self._get_resources():
+            resource.init_timeline(start_date, end_date)
+
+    def get_next_schedule_boundary(self, date: datetime.datetime):
+        """
+        date 시점 이후 공장 일정 제약 혹은 Resource 일정 제약 상태가 바뀔 수 있는 가장 이른 일시
+        :param date: 기준 일시
+        :return: datetime.datetime, 이후 경계가 없을 경우 None
+        """
+        boundaries: list = [boundary for boundary in
+                            [self._factory.get_schedule_constraint().get_next_boundary(date)] +
+                            [resource.get_next_boundary(date) for resource in self._get_resources()]
+                            if boundary is not None]
+        return min(boundaries) if boundaries else None
+
+    def _get_resources(self):
+        """
+        Process Resource 들이 사용하는 Resource 목록 (중복 제외)
+        :return: list
+        """
+        resources: dict = {id(process_resource.get_resource()): process_resource.get_resource()
+                           for process in self._factory.processes.values()
+                           for process_resource in process.get_process_resources().values()}
+        return list(resources.values())
 
     # ================== #
     #   Work Order 관련   #
     # Moved from Factory #
     # ================== #
     def set_backward_step_plan(self, orders: dict, plan_start_date: datetime.datetime):
+        self._mark_all_dirty()
 
         for obj in self._factory.get_route_list().values():
             route: Route = obj
@@ -229,6 +312,7 @@ class FactoryManager(SingletonInstance):
             # 기존 방식: Inventory._stock dict 객체를 아예 덮어쓰면서 앞서 factory builder 에서 세팅된 내용이 없어졌는데
             #  - Inventory.set_backward_peg_items() 를 따로 정의하여 기존 문제점 방지
             inv.set_backward_peg_items(plan_start_date, after_peg_stock[peg_inv])
+        self._mark_all_dirty()
 
     def _init_peg_item(self, item: dict, key: tuple):
         info = Item()
@@ -300,6 +384,61 @@ class FactoryManager(SingletonInstance):
             route.set_next_route_attribute_dict(self._get_to_route_attribute_dict(route))
             self._route_graph.update({route: list(route.get_previous_routes().values())})
 
+        # run() / transfer() 시 사용할 Route 실행 순서 계산 및 검증
+        self._execution_routes = self._create_execution_routes()
+        self._init_dirty_routes()
+
+    def _init_dirty_routes(self):
+        """
+        Node 상태 변경 시 transfer 결과가 바뀔 수 있는 Route 들을 표시하도록 Node 에 listener 등록
+            - 현재 Node 가 바뀐 Route : 처리 완료 Item 변동
+            - 다음 Node 가 바뀐 Route (이전 Route 들) : Capacity, Queue 여유 변동
+        :return: void
+        """
+        positions: Dict[Route, int] = {route: position for position, route in enumerate(self._execution_routes)}
+        for route, position in positions.items():
+            targets: tuple = (position,) + tuple(positions[previous_route]
+                                                 for previous_route in route.get_previous_routes().values())
+            route.get_current().add_event_listener(lambda targets=targets: self._mark_dirty(targets))
+
+        self._schedule_routes = tuple(position for route, position in positions.items()
+                                      if any(isinstance(next_route.get_current(), Process)
+                                             for next_route in route.get_next_routes().values()))
+        self._dirty_routes = set()
+        self._dirty_heap = []
+        self._next_dirty_heap = []
+        self._transfer_position = -1
+        self._schedule_boundary = datetime.datetime.min
+        self._mark_all_dirty()
+
+    def _create_execution_routes(self) -> Tuple[Route, ...]:
+        """
+        마지막 Route 들로부터 이전 Route 방향으로의 위상 정렬 순서 계산 (Kahn 알고리즘)
+        각 Route 는 자신의 다음 Route 들이 모두 실행된 후에 실행되도록 배치
+        순환 연결이 있거나 마지막 Route 로부터 도달할 수 없는 Route 가 있으면 RouteException
+        :return: Tuple[Route, ...]
+        """
+        routes: list = list(self._factory.get_route_list().values())
+        remains: Dict[Route, int] = {route: len(route.get_next_routes()) for route in routes}
+
+        execution_routes: List[Route] = []
+        queue: deque = deque(self._last_routes)
+        while queue:
+            route: Route = queue.popleft()
+            execution_routes.append(route)
+            for previous_route in self._route_graph.get(route, []):
+                remains[previous_route] -= 1
+                if remains[previous_route] == 0:
+                    queue.append(previous_route)
+
+        if len(execution_routes) != len(routes):
+            invalid_routes: list = [route.id for route in routes if route not in execution_routes]
+            raise RouteException(
+                f"Route network has cycles or routes unreachable from the last routes : {invalid_routes}"
+            )
+
+        return tuple(execution_routes)
+
     @staticmethod
     def _get_to_route_attribute_dict(route: Route):
         """
@@ -368,24 +507,32 @@ class FactoryManager(SingletonInstance):
         forward 종료 후 Factory 인스턴스 내 각 Resource 인스턴스들이 가진 Work History 들을 취합하여 리스트로 반환
         :return:
         """
+        return list(self.iter_resource_history(plan_version, simulation_id))
 
-        convert_time_info: callable = lambda x: \
-            {key:
-                 DateTimeUtility.convert_date_to_str(val) if key in ["START_DT_HMS", "END_DT_HMS"] else
-                 DateTimeUtility.convert_timedelta_to_numeric(val, "HOUR") if key == "DUR" else     # Todo: Hard-Coded UOM
-                 val
-             for key, val in x.items()}
-        append_version_info: callable = lambda x: \
-            dict(zip(['PLAN_VER_ID', 'SIM_ID'] + list(x.keys()),
-                     [plan_version, simulation_id] + list(x.values())))
-
-        res_history: list = list()
+    def iter_resource_history(self, plan_version: str, simulation_id: str):
+        """
+        forward 종료 후 Factory 인스턴스 내 각 Resource 인스턴스들이 가진 Work History 를 한 행씩 변환하여 반환
+        전체 이력을 한 번에 리스트로 만들지 않으므로 이력 크기와 관계없이 변환 중인 행만 메모리에 유지
+        :return: generator of [PLAN_VER_ID, SIM_ID, CURR_LOC_ID, CURR_RESOURCE_ID, ...]
+        """
         for proc_id, proc in self._factory.processes.items():
             process: Process = proc
             for res_id, res in process.get_process_resources().items():
                 process_resource: ProcessResource = res
-                rows: list = list(map(lambda x: append_version_info(convert_time_info(x)),
-                                      process_resource.get_resource_history()))
-                res_history.extend(rows)
+                for history in process_resource.get_resource_history():
+                    yield [plan_version, simulation_id] + \
+                          [self._convert_resource_history_value(key, val) for key, val in history.items()]
 
-        return list(map(lambda x: list(x.values()), res_history))
+    @staticmethod
+    def _convert_resource_history_value(key: str, val):
+        """
+        Resource Work History 값 변환 : 시각은 문자열, 소요 시간은 시간(HOUR) 단위 숫자로
+        :param key: Work History 항목명
+        :param val: Work History 값
+        :return: 변환된 값
+        """
+        if key in ["START_DT_HMS", "END_DT_HMS"]:
+            return DateTimeUtility.convert_date_to_str(val)
+        if key == "DUR":
+            return DateTimeUtility.convert_timedelta_to_numeric(val, "HOUR")     # Todo: Hard-Coded UOM
+        return val
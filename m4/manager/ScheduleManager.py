@@ -1,5 +1,8 @@
 
+import bisect
 import datetime
+import heapq
+import math
 
 from ..dao.AbstractSession import AbstractSession
 from ..dao.CalendarDAO import CalendarDAO
@@ -30,12 +33,22 @@ class ScheduleManager(object):
         self._delta: int = 0
         # 전체 스텝
         self._horizon: int = 0
-        # 시간 배열
-        self._time_sequence: list = []
+        # 공장 달력 휴무 구간 [(LOWER, UPPER, TM_CONST_NM, TM_CONST_TYP), ...] - 서로 겹치지 않도록 정렬, 병합된 구간
+        self._off_day_intervals: list = []
+        # 휴무 구간 시작 시각 목록 - bisect 조회용
+        self._off_day_lowers: list = []
+        # 휴무 구간 시작 / 종료 시각 목록 - 다음 휴무 상태 경계 조회용
+        self._off_day_boundaries: list = []
         # 시간 배열 크기
         self._length: int = 0
         # 현재 스텝
         self._current: int = -1
+        # 현재 스텝의 time 정보 - current() 반복 호출 시 같은 dict 를 돌려주기 위한 캐시
+        self._current_time: dict = None
+        # event 방식 forward 에서 다음으로 처리할 시점(time index) heap
+        self._events: list = []
+        # event heap 에 등록된 time index 집합 - 같은 시점 중복 등록 방지
+        self._event_indexes: set = set()
 
     def init(self, plan_version_dict, simulation_dict, session: AbstractSession):
         """
@@ -62,9 +75,15 @@ class ScheduleManager(object):
         dao: CalendarDAO = CalendarDAO.instance()
         calendar_constraint = dao.map(dao.select_calendar_constraint(session, start_date=start_date_str, end_date=end_date_str, off_day_yn='Y'))
 
-        self._time_sequence = self._create_time_sequence(self._start_date, self._delta, self._horizon, calendar_constraint)
-        self._length = len(self._time_sequence)
+        # 시간 배열은 미리 만들지 않고 index 로부터 그때그때 계산 (메모리 사용량이 horizon 에 비례하지 않도록)
+        self._off_day_intervals = self._create_off_day_intervals(calendar_constraint)
+        self._off_day_lowers = [interval[0] for interval in self._off_day_intervals]
+        self._off_day_boundaries = sorted(set(bound for interval in self._off_day_intervals for bound in interval[:2]))
+        self._length = len(range(0, self._horizon + self._delta, self._delta))
         self._current = -1
+        self._current_time = None
+        self._events = []
+        self._event_indexes = set()
 
     @staticmethod
     def _create_timedelta(time_step, uom):
@@ -92,50 +111,103 @@ class ScheduleManager(object):
         return int(horizon.total_seconds())
 
     @staticmethod
-    def _find_constraint(date: datetime.datetime, date_constraint: list):
+    def _create_off_day_intervals(date_constraint: list):
         """
-        date 파라미터 조건에 맞는 date constraint [START_DATE, END_DATE}, [LOWER_BOUND, UPPER_BOUND} 범위의 constraint 조회
-        :param: date - 조회 조건 일시
+        date constraint 의 [START_DATE, END_DATE}, [LOWER_BOUND, UPPER_BOUND} 두 범위를 겹친 휴무 구간들을
+        서로 겹치지 않는 구간 목록으로 정렬, 병합
+        여러 constraint 가 겹치는 구간은 조회 순서상 앞선 constraint 의 명칭, 유형을 따름
         :param: date_constraint - date constraint
-        :return: dict
+        :return: list [(lower, upper, constraint_name, constraint_type), ...]
         """
+        intervals: list = []
         for const in date_constraint:
-            if const["START_DATE"] <= date < const["END_DATE"]:
-                if const["LOWER_BOUND"] <= date < const["UPPER_BOUND"]:
-                    return {"is_off_day": True, "constraint_name": const["TM_CONST_NM"], "constraint_type": const["TM_CONST_TYP"]}
+            lower: datetime.datetime = max(const["START_DATE"], const["LOWER_BOUND"])
+            upper: datetime.datetime = min(const["END_DATE"], const["UPPER_BOUND"])
+            if lower < upper:
+                intervals.append((lower, upper, const["TM_CONST_NM"], const["TM_CONST_TYP"]))
+
+        # 각 구간의 시작 / 종료 시각으로 나눈 기본 구간마다 가장 앞선 constraint 를 heap 으로 찾아 인접 구간끼리 병합
+        entries: list = sorted(((interval[0], interval[1], order, interval[2:])
+                                for order, interval in enumerate(intervals)),
+                               key=lambda x: x[0])
+        bounds: list = sorted(set(bound for interval in intervals for bound in interval[:2]))
+        merged: list = []
+        active: list = []
+        position: int = 0
+        for lower, upper in zip(bounds, bounds[1:]):
+            while position < len(entries) and entries[position][0] <= lower:
+                entry: tuple = entries[position]
+                heapq.heappush(active, (entry[2], entry[1], entry[3]))
+                position += 1
+            while active and active[0][1] <= lower:
+                heapq.heappop(active)
+            if not active:
+                continue
+            found: tuple = active[0][2]
+            if merged and merged[-1][1] == lower and merged[-1][2:] == found:
+                merged[-1] = (merged[-1][0], upper) + found
+            else:
+                merged.append((lower, upper) + found)
+        return merged
+
+    def _find_constraint(self, date: datetime.datetime):
+        """
+        date 파라미터 조건에 맞는 휴무 구간 constraint 조회 - 정렬된 휴무 구간에 대해 bisect, O(log n)
+        :param: date - 조회 조건 일시
+        :return: dict
+        """
+        position: int = bisect.bisect_right(self._off_day_lowers, date) - 1
+        if position < 0:
+            return {}
+        lower, upper, name, const_type = self._off_day_intervals[position]
+        if date < upper:
+            return {"is_off_day": True, "constraint_name": name, "constraint_type": const_type}
         return {}
 
-    def _create_time_sequence(self, start_date, delta, horizon, date_constraint):
+    def get_index(self, date: datetime.datetime):
         """
-        ScheduleManager time sequence를 생성
-        전체 일정(start_date, start_date + horizon) 범위에서 delta 간격으로 datetime 생성
-        date constraint의 공휴일, 주말 constraint 반영
-        :param: start_date - 시작 일시
-        :param: delta - step seconds
-        :param: horizon - 전체 seconds
-        :param: date_constraint - date constraint
-        :return: list
+        date 시각 이후(포함) 가장 이른 time index
+        :param date: 조회 조건 일시
+        :return: int
         """
-        time_sequence = []
-        # 0초를 기점으로 self._horizonSec 초까지 self._timestep 간격으로 더해가며 차례로 세팅
-        for idx, sec in enumerate(range(0, horizon + delta, delta)):
-            date: datetime.datetime = start_date + datetime.timedelta(seconds=sec)
+        return max(math.ceil((date - self._start_date).total_seconds() / self._delta), 0)
 
-            const = self._find_constraint(date, date_constraint)
-            time = {"index": idx, "date": date, "seconds": sec, "is_off_day": False}
-            time.update(const)
+    def get_next_off_day_boundary(self, index: int):
+        """
+        index 시점 이후 공장 달력 휴무 상태가 바뀔 수 있는 가장 이른 time index
+        :param index: 기준 time index
+        :return: int, time sequence 안에 경계가 없을 경우 None
+        """
+        date: datetime.datetime = self._start_date + datetime.timedelta(seconds=index * self._delta)
+        position: int = bisect.bisect_right(self._off_day_boundaries, date)
+        if position == len(self._off_day_boundaries):
+            return None
+        next_index: int = self.get_index(self._off_day_boundaries[position])
+        return next_index if next_index < self._length else None
 
-            # 각 Calendar 정보를 리스트에 순서대로 append 처리
-            time_sequence.append(time)
+    def get(self, index: int):
+        """
+        time sequence 의 index 위치의 time 정보를 계산
+        :param index: time index
+        :return: dict
+        """
+        sec: int = index * self._delta
+        date: datetime.datetime = self._start_date + datetime.timedelta(seconds=sec)
 
-        return time_sequence
+        time = {"index": index, "date": date, "seconds": sec, "is_off_day": False}
+        time.update(self._find_constraint(date))
+        return time
 
     def current(self):
         """
         time sequence의 현재 위치에서 time을 가져옴
         :return: dict
         """
-        return self._time_sequence[self._current] if -1 < self._current < self._length else None
+        if not -1 < self._current < self._length:
+            return None
+        if self._current_time is None or self._current_time["index"] != self._current:
+            self._current_time = self.get(self._current)
+        return self._current_time
 
     def next(self):
         """
@@ -153,12 +225,48 @@ class ScheduleManager(object):
         """
         return self._current + 1 < self._length
 
+    def jump(self, index: int):
+        """
+        time sequence의 index 위치로 이동하여 time을 가져옴
+        event 방식 forward 에서 상태 변경이 없는 구간을 건너뛸 때 사용
+        :param index: 이동할 time index
+        :return: dict
+        """
+        self._current = index
+        return self.current()
+
+    def push_event(self, index: int):
+        """
+        다음으로 처리해야 할 시점(time index)을 event heap 에 등록
+        현재 위치 이전이거나 time sequence 범위를 벗어나는 index 는 무시
+        :param index: time index
+        :return: void
+        """
+        if index is None or not self._current < index < self._length or index in self._event_indexes:
+            return
+        heapq.heappush(self._events, index)
+        self._event_indexes.add(index)
+
+    def pop_event(self):
+        """
+        event heap 에서 현재 위치 이후 가장 이른 시점(time index)을 꺼내옴
+        :return: int, 처리할 시점이 남아있지 않을 경우 None
+        """
+        while self._events:
+            index: int = heapq.heappop(self._events)
+            self._event_indexes.discard(index)
+            if index > self._current:
+                return index
+        return None
+
     def goto_first(self):
         """
         time sequence의 최초 위치로 이동
         :return: void
         """
         self._current = -1
+        self._events = []
+        self._event_indexes = set()
 
     def length(self):
         """
@@ -1,38 +1,183 @@
+import queue
+import threading
+from time import perf_counter
+
 from m4.common.SingletonInstance import SingletonInstance
 from m4.dao.HIstoryDAO import HistoryDAO
+from m4.dao.SnapshotDAO import SnapshotDAO
 from m4.manager.FactoryManager import FactoryManager
 from m4.dao.AbstractDataSource import AbstractDataSource
 from m4.dao.AbstractSession import AbstractSession
+from m4.util.LogHandler import LogHandler
 
 
 class SimulationMonitor(SingletonInstance):
+    """
+    Simulation Monitor Object
+    매 시점의 시뮬레이션 상황 snapshot 을 메모리 buffer 에 모아두었다가
+    batch 크기 단위로 background writer thread 에서 한 번에(executemany) 저장
+    snapshot 은 상태 변경이 있었던 시점, 또는 interval tick 마다만 기록
+    snapshot 저장은 m4.properties [Monitor] monitor.snapshot.enabled=True 일 때만 수행
+    (FS_SIM_SNAPSHOT 테이블 필요 - Oracle : resources/m4_oracle_schema.sql)
+    """
 
     def __init__(self):
+        # logger
+        self._logger = LogHandler.instance().get_logger()
+
         self._factory_manager: FactoryManager = None
         self._data_source: AbstractDataSource = None
+        self._plan_version_id: str = None
+        self._simulation_id: str = None
+
+        # snapshot 기록 조건
+        self._enabled: bool = False             # snapshot 저장 여부
+        self._interval: int = 0                 # 상태 변경이 없어도 기록할 tick 간격 (0 이면 상태 변경 시에만 기록)
+        self._batch_size: int = 1000            # 한 번에 저장할 snapshot 행 수
+        self._history_batch_size: int = 1000    # Resource Work History 저장 시 한 번에 저장할 행 수
+        self._last_event_count: int = None      # 마지막으로 기록한 시점의 FactoryManager event count
+        self._last_index: int = None            # 마지막으로 기록한 시점의 time index
 
-    def init(self, factory_manager: FactoryManager, data_source: AbstractDataSource):
+        # 저장 대기 중인 snapshot 행 buffer 및 background writer
+        self._buffer: list = []
+        self._queue: queue.Queue = None
+        self._writer: threading.Thread = None
+        self._error: Exception = None
+
+    def init(self, factory_manager: FactoryManager, data_source: AbstractDataSource,
+             plan_version_dict: dict = None, simulation_dict: dict = None,
+             interval: int = 0, batch_size: int = 1000, history_batch_size: int = 1000,
+             enabled: bool = False):
+        """
+        SimulationMonitor initialize
+        :param factory_manager: FactoryManager 인스턴스
+        :param data_source: snapshot 을 저장할 AbstractDataSource 인스턴스
+        :param plan_version_dict: 생산 일정 계획 버전 정보
+        :param simulation_dict: 시뮬레이션 정보
+        :param interval: 상태 변경이 없어도 snapshot 을 기록할 tick 간격 (0 이면 상태 변경 시에만 기록)
+        :param batch_size: 한 번에 저장할 snapshot 행 수
+        :param history_batch_size: Resource Work History 저장 시 한 번에 저장할 행 수
+        :param enabled: snapshot 저장 여부 (False 일 경우 snapshot() 은 아무것도 하지 않음)
+        :return: void
+        """
         self._factory_manager = factory_manager
         self._data_source = data_source
+        self._plan_version_id = (plan_version_dict or {}).get('PLAN_VER_ID')
+        self._simulation_id = (simulation_dict or {}).get('SIM_ID')
 
-    def snapshot(self):
-        session: AbstractSession = self._data_source.get_session()
+        self._enabled = enabled
+        self._interval = interval
+        self._batch_size = max(batch_size, 1)
+        self._history_batch_size = max(history_batch_size, 1)
+        self._last_event_count = None
+        self._last_index = None
+
+        self._buffer = []
+        self._queue = queue.Queue()
+        self._writer = None
+        self._error = None
+
+    def snapshot(self, time: dict = None):
+        """
+        현재 시점의 시뮬레이션 상황 snapshot 을 buffer 에 기록
+        직전 기록 이후 상태 변경이 없고 interval 이 지나지 않았으면 기록하지 않음
+        :param time: ScheduleManager 의 time 정보, None 이면 시뮬레이션 시작 전
+        :return: void
+        """
+        if not self._enabled:
+            return
+
+        index: int = -1 if time is None else time['index']
+        event_count: int = self._factory_manager.get_event_count()
 
-        print("\t\tSimulationMonitor.snapshot()")
+        is_changed: bool = event_count != self._last_event_count
+        is_interval: bool = self._interval > 0 and \
+            (self._last_index is None or index - self._last_index >= self._interval)
+        if not (is_changed or is_interval):
+            return
 
-        session.close()
+        self._last_event_count = event_count
+        self._last_index = index
+        self._buffer.append((self._plan_version_id, self._simulation_id,
+                             index, None if time is None else time['date'], event_count))
+
+        if len(self._buffer) >= self._batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        buffer 에 모인 snapshot 행들을 background writer thread 로 넘김
+        :return: void
+        """
+        if not self._buffer:
+            return
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write, name='SimulationMonitorWriter', daemon=True)
+            self._writer.start()
+        self._queue.put(self._buffer)
+        self._buffer = []
+
+    def close(self):
+        """
+        남은 snapshot 을 모두 저장하고 background writer thread 종료
+        writer thread 에서 발생한 오류는 로그로만 남김 (snapshot 저장 실패로 시뮬레이션 결과 저장이 중단되지 않도록)
+        :return: bool : snapshot 저장 성공 여부
+        """
+        self.flush()
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+        if self._error is not None:
+            self._logger.error(f"[SimulationMonitor] snapshot write skipped after error : {self._error}")
+            self._error = None
+            return False
+        return True
+
+    def _write(self):
+        """
+        background writer thread : queue 에서 snapshot batch 를 꺼내 batch 당 세션 1개로 저장
+        :return: void
+        """
+        while True:
+            rows: list = self._queue.get()
+            if rows is None:
+                break
+            if self._error is not None:
+                # 앞선 batch 저장이 실패한 경우 이후 batch 는 버림
+                continue
+            try:
+                session: AbstractSession = self._data_source.get_session()
+                try:
+                    SnapshotDAO.instance().execute(session=session, data_list=rows)
+                finally:
+                    session.close()
+            except Exception as e:
+                self._logger.error(f"[SimulationMonitor] snapshot write failed : {e}")
+                self._error = e
 
     def send_res_history(self, plan_version_dict: dict, simulation_dict: dict):
         """
-        Gantt Chart 에 표현될 Resource 별 Work History 이력을 담은 리스트 반환
-        :return:
+        Gantt Chart 에 표현될 Resource 별 Work History 이력을 저장
+        전체 이력을 리스트로 만들지 않고 Resource 별로 한 행씩 변환하면서
+        하나의 세션으로 history_batch_size 행 단위로 나누어 저장
+        :return: int : 저장한 행 수
         """
         plan_version: str = plan_version_dict.get('PLAN_VER_ID')
         simulation_id: str = simulation_dict.get('SIM_ID')
 
-        resource_history: list = self._factory_manager.get_resource_history(plan_version, simulation_id)
-        HistoryDAO.instance().execute(
-            session=self._data_source.get_session(),
-            data_list=resource_history
-        )
-        return resource_history
+        started: float = perf_counter()
+        session: AbstractSession = self._data_source.get_session()
+        try:
+            count: int = HistoryDAO.instance().execute(
+                session=session,
+                data_list=self._factory_manager.iter_resource_history(plan_version, simulation_id),
+                chunk_size=self._history_batch_size
+            )
+        finally:
+            session.close()
+
+        elapsed: float = perf_counter() - started
+        self._logger.info(f"[SimulationMonitor] resource history : {count} rows in {elapsed:.3f} sec "
+                          f"({count / elapsed if elapsed > 0 else 0:.1f} rows/sec)")
+        return count
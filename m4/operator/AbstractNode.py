@@ -1,6 +1,6 @@
 from abc import *
 import datetime
-from typing import List, Dict
+from typing import List, Dict, Callable
 
 from ..constraint.AbstractConstraint import AbstractConstraint
 from ..process.Item import Item
@@ -18,6 +18,53 @@ class AbstractNode(metaclass=ABCMeta):
     def __init__(self, node_type: str):
         self.node_type = node_type
 
+        # 노드 상태 변경(put, fetch, 도착, 작업 시작/완료) 누적 횟수 - event 방식 forward 의 idle tick 판단용
+        self._event_count: int = 0
+        # 노드 상태 변경 시 호출할 listener 목록 - FactoryManager 가 transfer 대상 Route 를 표시하는 용도
+        self._event_listeners: List[Callable[[], None]] = []
+
+    def add_event_listener(self, listener: Callable[[], None]):
+        """
+        노드 상태 변경 시 호출할 listener 등록
+        :param listener: 인자 없는 callable
+        :return: void
+        """
+        self._event_listeners.append(listener)
+
+    def _add_event(self):
+        """
+        노드 상태 변경 누적 횟수 증가 및 listener 호출
+        :return: void
+        """
+        self._event_count += 1
+        for listener in self._event_listeners:
+            listener()
+
+    def get_event_count(self) -> int:
+        """
+        노드 상태 변경 누적 횟수
+        tick 실행 전후 값이 같으면 해당 tick 동안 노드 상태 변경이 없었던 것으로 판단
+        :return: int
+        """
+        return self._event_count
+
+    @abstractmethod
+    def get_next_event_index(self, time_index: int):
+        """
+        현재 진행 중인 Runtime(이동, 작업) 들 중 가장 먼저 완료될 시점의 time index
+        :param time_index: 현재 time index
+        :return: int, 진행 중인 Runtime 이 없을 경우 None
+        """
+
+    @abstractmethod
+    def fast_forward(self, ticks: int):
+        """
+        상태 변경이 없는 idle tick 들을 한 번에 진행하는 처리
+        run() 을 ticks 번 호출한 것과 같은 Runtime 진행 상태를 만듦 (도중에 완료되는 Runtime 이 없음을 전제)
+        :param ticks: 건너뛸 tick 수
+        :return: void
+        """
+
     @abstractmethod
     def get_items(self, item_id: str, work_order_id: str) -> List[Item]:
         """
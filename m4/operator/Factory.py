@@ -3,6 +3,7 @@ import datetime
 from ..constraint.AbstractConstraint import AbstractConstraint
 from ..constraint.ScheduleConstraint import ScheduleConstraint
 from ..operator.Inventory import Inventory
+from ..operator.MoveTimer import MoveTimer
 from ..operator.Process import Process
 from ..operator.Route import Route
 # from ..process.Router import Router   # Will be Deprecated
@@ -29,6 +30,7 @@ class Factory(object):
         self._inventories: dict = {}  # Inventory 객체 리스트
         self.processes: dict = {}  # Process 객체 리스트
         self._routes: dict = {}  # Route 객체 리스트 = inventory 및 process 간 연결 관계 정의
+        self._move_timer: MoveTimer = MoveTimer()  # 공장 내 Inventory 들로 이동 중인 Item 들의 도착 시점 관리
 
         # Demand
         # self._demand_list: list = []
@@ -146,6 +148,28 @@ class Factory(object):
         """
         self._run_reverse(run_time=run_time, time_constraint=time_constraint)
 
+    def run_moves(self, time_index: int, date: datetime.datetime):
+        """
+        time_index 시점에 도착하는 이동 중인 Item 들을 도착 Inventory 에 입고
+        :param time_index:
+        :param date:
+        :return: void
+        """
+        for _, obj, runtime in self._move_timer.pop(time_index):
+            inventory: Inventory = obj
+            inventory.arrive(time_index, date, runtime)
+
+    def get_next_move_index(self, time_index: int):
+        """
+        Inventory 들로 이동 중인 Item 들 중 가장 먼저 도착할 시점의 time index
+        :param time_index: 현재 time index
+        :return: int, 이동 중인 Item 이 없을 경우 None
+        """
+        next_clock: int = self._move_timer.get_next_clock()
+        if next_clock is None:
+            return None
+        return max(next_clock, time_index + 1)
+
     def _run_reverse(self, run_time: dict, time_constraint: object = None):
         for route_step in sorted(self._route_sequence.keys()):
             for obj in self._route_sequence[route_step]:
@@ -239,6 +263,9 @@ class Factory(object):
         """
         return self._next_to_curr_location_dict[next_location]
 
+    def get_schedule_constraint(self) -> ScheduleConstraint:
+        return self._schedule_constraint
+
     def _get_current_schedules(self, run_time: datetime.datetime):
         """
 
@@ -320,6 +347,9 @@ class Factory(object):
         :return:
         """
         self._inventories = inventories
+        for obj in inventories.values():
+            inventory: Inventory = obj
+            inventory.set_move_timer(self._move_timer)
 
     def _init_info(self, info: dict):
         """
@@ -1,13 +1,12 @@
 import datetime
-from collections import defaultdict
-from itertools import chain
-from typing import List
+from typing import Dict, List
 
 from m4.util.LogHandler import LogHandler
 from m4.operator.AbstractNode import AbstractNode
 from m4.process.ProcessException import ProcessException
 from ..constraint.AbstractConstraint import AbstractConstraint
 from ..process.Item import Item
+from m4.operator.MoveTimer import MoveTimer
 from m4.operator.Runtime import Runtime
 from ..constraint.CapacityConstraint import CapacityConstraint
 
@@ -38,8 +37,13 @@ class Inventory(AbstractNode):
         self._constraints: CapacityConstraint = None
 
         # Item별로 재고
-        self._moves: list = []      # 이전 장소 -> 현재 인벤토리 이동 관리 리스트
-        self._stock: dict = {}      # { ItemID: [..., Item, ...] }
+        self._move_timer: MoveTimer = MoveTimer()   # 이전 장소 -> 현재 인벤토리 이동 관리 (Factory 공용 MoveTimer)
+        self._stock: Dict[str, Dict[int, Item]] = {}                    # { ItemID: {id(Item): Item} } - 입고 순서 유지
+        self._stock_index: Dict[str, Dict[str, Dict[int, Item]]] = {}   # { ItemID: { WorkOrderID: {id(Item): Item} } }
+
+        # Capacity Constraint 체크용 수량 합계 (재고 + 이동 중)
+        self._total_quantity: float = 0                 # 전체 수량 합계
+        self._item_quantities: Dict[str, float] = {}    # { ItemID: 수량 합계 }
 
     def __repr__(self):
         return f"<{self.__class__.__name__}({self.type}) {self.id} at {id(self):#018x}>"
@@ -53,13 +57,6 @@ class Inventory(AbstractNode):
         self._constraints = CapacityConstraint()
         self._constraints.init(info['MAX_QTY'], item_constraint_data)
 
-    def _get_moves_dict(self):
-        ret: dict = defaultdict(list)
-        for obj in self._moves:
-            item: Item = obj.get_item()
-            ret[item.item_id].append(item)
-        return ret
-
     def check_available(self, date: datetime.datetime, item_id: str, quantity: float, move_time: int):
         """
         check Available status
@@ -70,12 +67,8 @@ class Inventory(AbstractNode):
         :param : move_time
         :return : Inventory일 경우 가용 여부, Process일 경우 Resource ID
         """
-        moves_dict: dict = self._get_moves_dict()
-        items = defaultdict(list)
-        for key, val in chain(self._stock.items(), moves_dict.items()):
-            items[key].extend(val)
-
-        if self._constraints.check(item_id, items, quantity) is None:
+        if self._constraints.check(item_id, self._total_quantity,
+                                   self._item_quantities.get(item_id, 0), quantity) is None:
             return self.id, quantity
 
         return None
@@ -101,6 +94,7 @@ class Inventory(AbstractNode):
             return []
         stock_items.sort(key=lambda x: -x.get_quantity())
 
+        # 누적 합계를 따로 두지 않고 매번 (Item ID, Work Order ID) 재고에서 합산 - cut 에 의한 실수 오차 누적 방지
         stock_quantity: float = sum([obj.get_quantity() for obj in stock_items])
         fetch_items: list = []
         if stock_quantity < quantity:  # Todo: fetch 해야 할 수량이 모자랄 경우
@@ -115,7 +109,7 @@ class Inventory(AbstractNode):
                 return []
         elif stock_quantity == quantity:
             # 수량이 맞으므로 전부 그대로 fetch 하고 조건문 블록 뒤에서 _remove 처리
-            fetch_items = [self._pop(item_id, item) for item in stock_items]
+            fetch_items = [self._pop(item) for item in stock_items]
         else:   # 가져 갈 수량보다 재고 수량이 더 많을 경우
             remain_qty: float = quantity
             cut_items: list = []
@@ -128,7 +122,7 @@ class Inventory(AbstractNode):
                     item_qty: float = item.get_quantity()
                     if item_qty <= remain_qty:
                         # 그대로 fetch
-                        fetch_items.append(self._pop(item_id, item))
+                        fetch_items.append(self._pop(item))
                         remain_qty -= item_qty
                     else:
                         # Cut 필요
@@ -137,6 +131,11 @@ class Inventory(AbstractNode):
                         remain_qty = 0
                         break
 
+        if fetch_items:
+            self._add_event()
+            for item in fetch_items:
+                self._add_quantity(item_id, -item.get_quantity())
+
         self._logger.info(
             f"[Inventory {self.id}:{self.name}] : {item_id}:{work_order_id}"
             f" - fetched {quantity} from {len(fetch_items)} items")
@@ -151,6 +150,8 @@ class Inventory(AbstractNode):
         """
         # Item 위치 정보 업데이트
         item.set_location_id(self.id)
+        self._add_event()
+        self._add_quantity(item.item_id, item.get_quantity())
 
         # item archive 처리
         item.archive(time_index=time_index, date=date, action="INVENTORY PUT", location=self.id)  # Todo: Action Name ?
@@ -159,18 +160,17 @@ class Inventory(AbstractNode):
         if move_time != 0:
             runtime: Runtime = Runtime(item, time_index, date, move_time)
 
-            self._moves.append(runtime)
+            self._move_timer.schedule(runtime, self)
             return
 
         item.archive(time_index=time_index, date=date, action="STOCK IN", location=self.id)  # Todo: Action Name ?
-        items: list = self._stock.get(item.item_id, [])
-        items.append(item)
-        self._stock.update({item.item_id: items})
+        self._push(item)
 
     def run(self, time_index: int, date: datetime.datetime, is_off_day: bool, off_day_type: str,
             factory_const: AbstractConstraint = None):
         """
         FactorySimulator에서 run 발생 시 aging 처리 전파
+        이동 중인 Item 의 도착은 Factory 공용 MoveTimer 에서 도착 시점에 arrive() 로 처리하므로 별도 처리 없음
         Todo: 공장 달력상 휴무일일 시점에도 move 진행 ?
         :param factory_const:
         :param time_index:
@@ -178,35 +178,86 @@ class Inventory(AbstractNode):
         :param is_off_day:
         :param off_day_type:
         """
+        pass
 
-        arrived_items: list = []
-        for obj in self._moves:
-            runtime: Runtime = obj
-            runtime.run()
-            if runtime.is_end():
-                runtime.archive(time_index=time_index, date=date, action="STOCK IN",
-                                location=self.name)  # Todo: Action Name ?
+    def arrive(self, time_index: int, date: datetime.datetime, runtime: Runtime):
+        """
+        이동이 완료된 Item 을 재고로 입고하는 처리
+        :param time_index:
+        :param date:
+        :param runtime: 도착한 이동 Runtime
+        :return: void
+        """
+        runtime.archive(time_index=time_index, date=date, action="STOCK IN",
+                        location=self.name)  # Todo: Action Name ?
 
-                item: Item = runtime.get_item()
-                items: list = self._stock.get(item.item_id, [])
-                items.append(item)
-                self._stock.update({item.item_id: items})
+        self._push(runtime.get_item())
+        self._add_event()
 
-                arrived_items.append(runtime)
+    def set_move_timer(self, move_timer: MoveTimer):
+        """
+        Factory 공용 MoveTimer 설정
+        :param move_timer: MoveTimer 인스턴스
+        :return: void
+        """
+        self._move_timer = move_timer
 
-        for obj in arrived_items:
-            self._moves.remove(obj)
+    def get_next_event_index(self, time_index: int):
+        """
+        이동 중인 Item 들의 도착 시점은 Factory 공용 MoveTimer 에서 계산하므로 None
+        :param time_index: 현재 time index
+        :return: None
+        """
+        return None
 
-    def _pop(self, item_id: str, item: Item):
+    def fast_forward(self, ticks: int):
+        """
+        상태 변경이 없는 idle tick 들을 한 번에 진행하는 처리
+        Inventory 의 이동은 공장 달력과 관계없이 매 tick 진행되고 완료 시점을 time index 로 가지므로 별도 처리 없음
+        :param ticks: 건너뛸 tick 수
+        :return: void
+        """
+        pass
+
+    def _add_quantity(self, item_id: str, quantity: float):
+        """
+        Capacity Constraint 체크용 수량 합계(재고 + 이동 중) 갱신
+        :param item_id:
+        :param quantity: 증감 수량
+        :return: void
+        """
+        self._total_quantity += quantity
+        self._item_quantities[item_id] = self._item_quantities.get(item_id, 0) + quantity
+
+    def _push(self, item: Item):
+        """
+        stock 에 add 하는 처리 - (Item ID, Work Order ID) index 함께 갱신
+        :param item:
+        :return: void
+        """
+        key: int = id(item)
+        self._stock.setdefault(item.item_id, {})[key] = item
+        self._stock_index.setdefault(item.item_id, {}).setdefault(item.work_order_id, {})[key] = item
+
+    def _pop(self, item: Item):
         """
         stock 에서 remove 하는 처리
+        인스턴스 주소 값(id)으로 찾아 제거
         :param item:
-        :return:
+        :return: Item
         """
-        return self._stock[item_id].pop(self._stock[item_id].index(item))
+        key: int = id(item)
+        del self._stock[item.item_id][key]
+
+        work_orders: Dict[str, Dict[int, Item]] = self._stock_index[item.item_id]
+        del work_orders[item.work_order_id][key]
+        if not work_orders[item.work_order_id]:
+            # 비어있는 Work Order 는 index 에서 제외
+            del work_orders[item.work_order_id]
+        return item
 
     def get_item_dict(self):
-        return self._stock
+        return {item_id: list(items.values()) for item_id, items in self._stock.items()}
 
     def set_backward_peg_items(self, plan_start_date: datetime.datetime, backward_peg_items_dict: dict):
         """
@@ -222,7 +273,8 @@ class Inventory(AbstractNode):
 
         for item_id, item_infos in backward_peg_items_dict.items():
             for info in item_infos:
-                stock_items: list = self._stock.get(info['ITEM_ID'], [])
+                # 기존 stock list 를 순회하며 pop 하던 동작과 같은 순서로 처리되도록 pop 한 Item 은 stock_items 에서도 제거
+                stock_items: List[Item] = list(self._stock.get(info['ITEM_ID'], {}).values())
                 pegged_items: List[Item] = []
 
                 remain_qty: float = info['PEG_QTY']
@@ -236,7 +288,8 @@ class Inventory(AbstractNode):
                         item_qty: float = item.get_quantity()
                         if item_qty <= remain_qty:
                             # 그대로 fetch
-                            pegged_item: Item = self._pop(item_id, item)
+                            pegged_item: Item = self._pop(item)
+                            stock_items.remove(item)
                             pegged_item.init(
                                 item_id=info['ITEM_ID'],
                                 location_id=info['INV_ID'],
@@ -274,9 +327,8 @@ class Inventory(AbstractNode):
                             cut_items.append(item)
                             remain_qty = 0
                             break
-                self._stock.update(
-                    {info['ITEM_ID']: self._stock.get(info['ITEM_ID'], []) + pegged_items}
-                )
+                for pegged_item in pegged_items:
+                    self._push(pegged_item)
 
     def plan_input_quantity(self, quantity: float, item_id: str = ''):
         item_capa: float = self._constraints.get_item_capa_constraint(item_id)
@@ -296,8 +348,5 @@ class Inventory(AbstractNode):
         return self._constraints
 
     def get_items(self, item_id: str, work_order_id: str) -> List[Item]:
-        items: List[Item] = self._stock.get(item_id, [])
-        if not items:
-            return items
-        return [item for item in items
-                if item.work_order_id in [work_order_id]]
+        items: Dict[int, Item] = self._stock_index.get(item_id, {}).get(work_order_id, {})
+        return list(items.values())
@@ -0,0 +1,65 @@
+import heapq
+from typing import Dict, List, Tuple
+
+from m4.operator.Runtime import Runtime
+
+
+class MoveTimer(object):
+    """
+    Move Timer Object
+    이동 중인 Runtime 들을 도착(완료) clock 별 bucket 으로 관리하는 calendar queue
+    매 tick 이동 중인 Runtime 전체를 확인하는 대신 도착 시점이 된 bucket 만 꺼내서 처리
+        - Factory : 모든 Inventory 로의 이동을 하나의 MoveTimer 로 관리 (clock = time index)
+        - ProcessLot : Resource 가 진행된 tick 수를 clock 으로 사용하므로 ProcessLot 마다 별도 관리
+    """
+
+    def __init__(self):
+        """
+        생성자 :
+        """
+        self._buckets: Dict[int, list] = {}    # { 도착 clock : [..., (순번, 도착 Node, Runtime), ...] } - 등록 순서 유지
+        self._clocks: List[int] = []            # bucket 들의 도착 clock heap
+        self._sequence: int = 0                 # 등록 순번 - 여러 bucket 을 함께 꺼낼 때 등록 순서 유지용
+        self._count: int = 0                    # 이동 중인 Runtime 수
+
+    def __len__(self):
+        return self._count
+
+    def schedule(self, runtime: Runtime, node: object = None):
+        """
+        이동 Runtime 등록
+        :param runtime: 완료 clock 이 정해진 Runtime
+        :param node: 도착 Node (Factory 공용 MoveTimer 에서 도착 처리 대상 구분용)
+        :return: void
+        """
+        end: int = runtime.get_end()
+        bucket: list = self._buckets.get(end)
+        if bucket is None:
+            bucket = self._buckets[end] = []
+            heapq.heappush(self._clocks, end)
+        self._sequence += 1
+        bucket.append((self._sequence, node, runtime))
+        self._count += 1
+
+    def pop(self, clock: int) -> List[Tuple[int, object, Runtime]]:
+        """
+        clock 시점까지 도착한 Runtime 들을 꺼내는 처리
+        :param clock: 현재 clock
+        :return: [..., (순번, 도착 Node, Runtime), ...] - 등록 순서
+        """
+        arrivals: list = []
+        buckets: int = 0
+        while self._clocks and self._clocks[0] <= clock:
+            arrivals.extend(self._buckets.pop(heapq.heappop(self._clocks)))
+            buckets += 1
+        if buckets > 1:
+            arrivals.sort(key=lambda entry: entry[0])
+        self._count -= len(arrivals)
+        return arrivals
+
+    def get_next_clock(self):
+        """
+        가장 먼저 도착할 Runtime 의 clock
+        :return: int, 이동 중인 Runtime 이 없을 경우 None
+        """
+        return self._clocks[0] if self._clocks else None
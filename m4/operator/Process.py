@@ -31,6 +31,12 @@ class Process(AbstractNode):
 
         # 2-2. Private
         self._process_resources: Dict[str, ProcessResource] = {}              # Process Resource 인스턴스 목록
+        self._dispatch_resources: Tuple[ProcessResource, ...] = ()            # priority 순으로 정렬된 Process Resource 목록
+
+        # 할당 가능 여부 bitmap : bit i 는 _dispatch_resources[i] 의 일정 제약 / Queue 여유 상태
+        # (date, 상태 변경 누적 횟수) 가 바뀔 때(시점 변경, put / 도착 / 작업 시작 / 완료) 다시 계산
+        self._availability: int = 0
+        self._availability_signature: tuple = None
 
         #
         self._logger: logging.Logger = LogHandler.instance().get_logger()
@@ -45,8 +51,15 @@ class Process(AbstractNode):
     def add_process_resource(self, info: dict, resource: Resource, use_backward_size: bool):
         process_resource = ProcessResource()
         process_resource.init(info, resource, use_backward_size)
+        # Resource(ProcessLot) 상태 변경 시 Process 상태 변경 누적 횟수도 함께 증가
+        process_resource.set_event_listener(self._add_event)
         self._process_resources[info['RESC_ID']] = process_resource
 
+        # priority 가 같을 경우 등록 순서 유지 (stable sort)
+        self._dispatch_resources = tuple(sorted(self._process_resources.values(),
+                                                key=lambda x: x.get_priority()))
+        self._availability_signature = None
+
     def get_process_resources(self):
         """
 
@@ -75,27 +88,42 @@ class Process(AbstractNode):
         # Todo : 한 Resource 로만 배당되는 문제 있어 처리 필요 (여러 개가 가능하다면 한 쪽으로만 배당하지 않고 골고루 분배하도록) -> (3단계 - Policy)
         # Todo : Policy - 무작위 / EFFICIENCY / ...
 
-        # (1단계) 각 ProcessResource 별로 할당 가능 여부 확인 : ProcessResource.is_available()
+        # (1단계) 각 ProcessResource 별 일정 제약 / Queue 여유 확인 : 할당 가능 여부 bitmap
         # 1. Resource 가 일정 제약에 걸리는지 ?
-        # 2. _min_lot_size <= quantity <= _max_lot_size 만족하는지 ?
-        # 3. _process_lot.is_available() ?
+        # 2. _process_lot.is_available() ?
         #       - move 중인 Item 들과 Queue 에 쌓여 있는 Item 들의 갯수가 합쳐서 10개가 넘지 않는지?
-        _available_resources: List[Tuple[ProcessResource, float]] = []
-        for obj in self._process_resources.values():
-            resource: ProcessResource = obj
-            is_available, input_quantity = resource.is_available(date, item_id, product_quantity, move_time)
-            if is_available:
-                _available_resources.append((obj, input_quantity))
-
-        # (2단계) ._priority (우선순위) 정렬
-        if len(_available_resources) == 0:
+        availability: int = self._get_availability(date, item_id, product_quantity, move_time)
+        if availability == 0:
             # 할당 가능한 ProcessResource 가 없을 경우 None 반환
             return None
-        else:
-            # 할당 가능한 Processresource 들 중 priority 가 가장 작은(우선순위 최대인) 것의 id 문자열을 Return
-            _available_resources.sort(key=lambda x: x[0].get_priority())
-            _available_resource = _available_resources[0]
-            return _available_resource[0].resource_id, _available_resource[1]
+
+        # (2단계) priority 순으로 _min_lot_size <= quantity <= _max_lot_size 만족하는지 확인
+        # 할당 가능한 ProcessResource 들 중 priority 가 가장 작은(우선순위 최대인) 것의 id 문자열을 Return
+        for index, obj in enumerate(self._dispatch_resources):
+            if not availability >> index & 1:
+                continue
+            resource: ProcessResource = obj
+            is_lot_size, input_quantity = resource.check_lot_size(product_quantity)
+            if is_lot_size:
+                return resource.resource_id, input_quantity
+        return None
+
+    def _get_availability(self, date: datetime.datetime, item_id: str, product_quantity: float, move_time: int):
+        """
+        date 시점 각 ProcessResource 의 할당 가능 여부 bitmap
+        일정 제약 / Queue 여유는 할당 대상 Item, 수량과 관계없으므로 시점 또는 상태가 바뀐 경우에만 다시 계산
+        :return: int - bit i 는 priority 순 i 번째 ProcessResource 의 할당 가능 여부
+        """
+        signature: tuple = (date, self._event_count)
+        if signature != self._availability_signature:
+            availability: int = 0
+            for index, obj in enumerate(self._dispatch_resources):
+                resource: ProcessResource = obj
+                if resource.is_dispatchable(date, item_id, product_quantity, move_time):
+                    availability |= 1 << index
+            self._availability = availability
+            self._availability_signature = signature
+        return self._availability
 
     def fetch(self, time_index: int, date: datetime.datetime, item_id: str, work_order_id: str, quantity: float = 0):
         """
@@ -104,17 +132,17 @@ class Process(AbstractNode):
         :param : quantity
         :return : Item
         """
+        # Resource 들을 한 번만 순회 : 처리 완료 수량이 모자라더라도 Resource 수 이내에서 종료
         product_quantities: Dict[ProcessResource, float] = {}
         remain_quantity: float = quantity
-        while remain_quantity > 0:
-            for obj in self._process_resources.values():
-                resource: ProcessResource = obj
-                # product_quantity += resource.get_quantity(item_id, work_order_id)
-                wait_quantity: float = resource.get_wait_quantity(item_id=item_id, work_order_id=work_order_id)
-                product_quantities[resource] = min(remain_quantity, wait_quantity)
-                remain_quantity -= product_quantities[resource]
-                if remain_quantity <= 0:    # for Loop 내에서 종료될 경우 대비
-                    break
+        for obj in self._process_resources.values():
+            if remain_quantity <= 0:
+                break
+            resource: ProcessResource = obj
+            # product_quantity += resource.get_quantity(item_id, work_order_id)
+            wait_quantity: float = resource.get_wait_quantity(item_id=item_id, work_order_id=work_order_id)
+            product_quantities[resource] = min(remain_quantity, wait_quantity)
+            remain_quantity -= product_quantities[resource]
         product_quantity: float = sum(product_quantities.values())
 
         if quantity != 0:
@@ -160,6 +188,30 @@ class Process(AbstractNode):
             resource: ProcessResource = obj
             resource.run(time_index, date, is_off_day, off_day_type, factory_const)
 
+    def get_next_event_index(self, time_index: int):
+        """
+        각 ProcessResource 에서 진행 중인 Lot 들 중 가장 먼저 완료될 시점의 time index
+        :param time_index: 현재 time index
+        :return: int, 진행 중인 Lot 이 없을 경우 None
+        """
+        indices: List[int] = [index for index in
+                              (resource.get_next_event_index(time_index)
+                               for resource in self._process_resources.values())
+                              if index is not None]
+        return min(indices) if indices else None
+
+    def fast_forward(self, ticks: int):
+        """
+        상태 변경이 없는 idle tick 들을 한 번에 진행하는 처리
+        :param ticks: 건너뛸 tick 수
+        :return: void
+        """
+        if ticks <= 0:
+            return
+        for obj in self._process_resources.values():
+            resource: ProcessResource = obj
+            resource.fast_forward(ticks)
+
     def plan_input_quantity(self, quantity: float, item_id: str = ''):
         """
         Backward 에서 현재 Process에 대한 StepPlan 분할을 위한 메서드
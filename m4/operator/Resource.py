@@ -50,6 +50,31 @@ class Resource(object):
         """
         return self._constraints.check(date)
 
+    def init_timeline(self, start_date: datetime.datetime, end_date: datetime.datetime):
+        """
+        시뮬레이션 기간에 대한 비가용 구간 timeline 생성
+        :param start_date: 시뮬레이션 시작 일시
+        :param end_date: 시뮬레이션 종료 일시
+        :return: void
+        """
+        self._constraints.compile(start_date, end_date)
+
+    def get_next_available(self, date: datetime.datetime):
+        """
+        date 시점 이후(포함) 일정 제약에 걸리지 않는 가장 이른 일시
+        :param date:
+        :return: datetime.datetime
+        """
+        return self._constraints.get_next_available(date)
+
+    def get_next_boundary(self, date: datetime.datetime):
+        """
+        date 시점 이후 일정 제약 상태가 바뀔 수 있는 가장 이른 일시
+        :param date:
+        :return: datetime.datetime
+        """
+        return self._constraints.get_next_boundary(date)
+
     def get_status(self):
         return self._status
 
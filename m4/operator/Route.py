@@ -1,3 +1,4 @@
+import bisect
 import datetime
 from typing import List, Dict, Callable, Tuple
 
@@ -34,8 +35,11 @@ class Route(object):
         self._previous_route_dict: dict = {}
         self._next_route_dict: dict = {}
 
-        # 현재 Route StepPlan 목록
+        # 현재 Route StepPlan 목록 - LPST 순 정렬 유지 (LPST 가 같으면 등록 순), 완료된 Plan 은 lazy 삭제
         self._order_items: List[BackwardStepPlan] = []
+        self._order_item_keys: List[Tuple[datetime.datetime, int]] = []     # (LPST, 등록 순번) - bisect 용
+        self._order_item_sequence: int = 0
+        self._finished_plans: set = set()   # _order_items 에 남아있는 완료 Plan 의 id (lazy 삭제 대상)
         self._order_items_finished: List[BackwardStepPlan] = []
         self._shipped_items: dict = {}
 
@@ -101,19 +105,25 @@ class Route(object):
         time: datetime.datetime = run_time['date']
 
         # 현재 Route 에서 처리할 대상 BackwardStepPlan 리스트 (LPST 값이 현재 시점 이전인 Plan들만 추출)
-        plans: List[BackwardStepPlan] = sorted([obj for obj in self._order_items],
-                                               key=lambda x: x.lpst)
+        # _order_items 는 LPST 순으로 정렬된 상태가 유지되므로 정렬 없이 완료되지 않은 Plan 만 순회
+        plans: List[BackwardStepPlan] = self._order_items
 
         # 다음 Route 없을 경우 (최종 종착지, Inventory (PDINV) 일 것)
         # for Debugging : Ship 을 통해 처리 완료된 Work Order 목록을 파악하기 위한 메서드
         if not self._next_routes:
             for plan in plans:
+                if id(plan) in self._finished_plans:
+                    continue
                 self._ship(time_index, time, plan)
+            self._compact_order_items()
             return
 
         # 각 BackwardStepPlan 별 처리 ( Plan 의 LPST 순으로 탐색 - 긴급한 계획 먼저 )
         for plan in plans:
+            if id(plan) in self._finished_plans:
+                continue
             self._transfer_policy(time_index, time, plan)
+        self._compact_order_items()
 
     def _execute_backward_plan(self, time_index: int, time: datetime.datetime, plan: BackwardStepPlan):
         """
@@ -274,10 +284,37 @@ class Route(object):
     def _finish_plan(self, plan: BackwardStepPlan):
         """
         현재 Route 에 할당된 처리 완료된 생산 계획을 삭제 후 완료 목록에 append 하는 처리
+        _order_items 에서는 완료 표시만 하고 transfer 종료 시 한 번에 정리 (lazy 삭제)
+        :param plan:
+        :return:
+        """
+        self._finished_plans.add(id(plan))
+        self._order_items_finished.append(plan)
+
+    def _compact_order_items(self):
+        """
+        완료 표시된 Plan 이 _order_items 의 절반을 넘으면 정리
+        :return:
+        """
+        if len(self._finished_plans) * 2 <= len(self._order_items):
+            return
+        live: list = [(key, plan) for key, plan in zip(self._order_item_keys, self._order_items)
+                      if id(plan) not in self._finished_plans]
+        self._order_item_keys = [key for key, plan in live]
+        self._order_items = [plan for key, plan in live]
+        self._finished_plans = set()
+
+    def add_work_order(self, plan: BackwardStepPlan):
+        """
+        Plan 을 LPST 순서 위치에 추가 (LPST 가 같으면 먼저 추가된 Plan 이 앞)
         :param plan:
         :return:
         """
-        self._order_items_finished.append(self._order_items.pop(self._order_items.index(plan)))
+        key: Tuple[datetime.datetime, int] = (plan.lpst, self._order_item_sequence)
+        self._order_item_sequence += 1
+        position: int = bisect.bisect_right(self._order_item_keys, key)
+        self._order_item_keys.insert(position, key)
+        self._order_items.insert(position, plan)
 
     def set_next_route_attribute_dict(self, to_route_attribute_dict: dict):
         self._next_route_attribute_dict = to_route_attribute_dict
@@ -286,7 +323,11 @@ class Route(object):
         self._previous_route_attribute_dict = from_route_attribute_dict
 
     def set_work_orders(self, order_items: list):
-        self._order_items = order_items
+        self._order_items = []
+        self._order_item_keys = []
+        self._finished_plans = set()
+        for plan in order_items:
+            self.add_work_order(plan)
 
     def get_items(self, item_id: str, work_order_id) -> List[Item]:
         return self._current.get_items(item_id, work_order_id)
@@ -5,38 +5,54 @@ from m4.process.Item import Item
 
 
 class Runtime(object):
-
-    def __init__(self, item: Item, time_index: int, date: datetime.datetime, length: int = sys.maxsize):
+    """
+    Runtime Object
+    이동 / 작업 등 일정 시간 동안 진행되는 Item 의 진행 상태를 표현하는 클래스
+    진행 시점을 매 tick 증가시키는 대신 완료 시점(절대 clock)을 저장하고, 완료 여부는 현재 clock 과 비교하여 판단
+        - clock : Runtime 을 진행시키는 node 의 시점 (Inventory 는 time index, ProcessLot 은 작업이 진행된 tick 수)
+    """
+
+    def __init__(self, item: Item, time_index: int, date: datetime.datetime, length: int = sys.maxsize,
+                 clock: int = None):
+        """
+        생성자 :
+        :param item: 진행 대상 Item
+        :param time_index: 시작 time index
+        :param date: 시작 일시
+        :param length: 진행 tick 수
+        :param clock: 시작 clock (없을 경우 time_index)
+        """
         self.item: Item = item
         self.time_index: int = time_index
         self.date: datetime.datetime = date
 
-        self._length: int = length
-        self._current: int = 0
-
-    def run(self):
-        if self._current == self._length:
-            return
-        self._current += 1
+        self._start: int = time_index if clock is None else clock
+        self._end: int = self._start + length
 
-    def is_end(self):
-        return self._current == self._length
+    def is_end(self, clock: int):
+        return clock >= self._end
 
     def get_item(self):
         return self.item
 
-    def reset(self, time_index: int, date: datetime.datetime, length: int = sys.maxsize):
+    def reset(self, time_index: int, date: datetime.datetime, length: int = sys.maxsize, clock: int = None):
         self.time_index: int = time_index
         self.date: datetime.datetime = date
 
-        self._length: int = length
-        self._current: int = 0
+        self._start: int = time_index if clock is None else clock
+        self._end: int = self._start + length
 
-    def get_current(self):
-        return self._current
+    def get_current(self, clock: int):
+        return min(clock, self._end) - self._start
 
     def get_length(self):
-        return self._length
+        return self._end - self._start
+
+    def get_end(self):
+        return self._end
+
+    def get_remaining(self, clock: int):
+        return max(self._end - clock, 0)
 
     def archive(self, time_index: int, date: datetime.datetime, action: str, location: str):
         self.item.archive(time_index=time_index, date=date, action=action, location=location)
@@ -7,17 +7,19 @@ from m4.operator.Runtime import Runtime
 
 class Lot(Runtime):
 
-    def __init__(self, item: Item, time_index: int, date: datetime.datetime, status: str, length: int = sys.maxsize):
+    def __init__(self, item: Item, time_index: int, date: datetime.datetime, status: str, length: int = sys.maxsize,
+                 clock: int = None):
 
         #  Runtime 들이 가지는 공통 변수들
-        super().__init__(item, time_index, date, length)
+        super().__init__(item, time_index, date, length, clock)
 
         # Lot 만이 가지는 고유한 변수들
         self._status: str = status
 
-    def process(self, time_index: int, date: datetime.datetime, status: str, length: int = sys.maxsize):
+    def process(self, time_index: int, date: datetime.datetime, status: str, length: int = sys.maxsize,
+                clock: int = None):
 
-        super().reset(time_index, date, length)
+        super().reset(time_index, date, length, clock)
         self._status = status
 
     def get_status(self):
@@ -1,13 +1,14 @@
 
 import datetime
 import logging
-from collections import defaultdict
-from typing import List, Dict
+from typing import List, Dict, Tuple, Callable
 
+from ..MoveTimer import MoveTimer
 from ..process.Lot import Lot
 from ..process.ProcessQueue import ProcessQueue
 from m4.process.ProcessException import ProcessException
 from m4.process.Item import Item
+from m4.process.ItemEventLog import ItemEventLog
 from m4.util.LogHandler import LogHandler
 from ...util.DateTimeUtility import DateTimeUtility
 
@@ -31,16 +32,33 @@ class ProcessLot(object):
         self.name: str = ""
 
         # MOVE -> QUEUE -> (SETUP) -> PROCESS
-        self._moves: list = []                      # 현재 Process 위치로 오는 중인 Item 들의 시간 정보를 관리하는 dict
+        self._moves: MoveTimer = MoveTimer()        # 현재 Process 위치로 오는 중인 Lot 들의 도착 시점(clock) 관리
+        self._arrived: list = []                    # 이동이 끝났지만 Queue 가 가득 차 대기 중인 Lot 들 [..., (순번, Node, Lot), ...]
         self._queue: ProcessQueue = ProcessQueue()  # 이전 Route 로부터 도착한 Item 들의 QUEUE 대기열
         self._lot: Lot = None                       # 현재 처리중인 Item, Idle 일 경우 None
 
         # 다음 Router로 보낼 처리 완료 Item 들을 보관
-        self._waits: dict = defaultdict(list)             # { ItemCode : [..., Item, ...] }
+        self._waits: Dict[Tuple[str, str], Dict[int, Item]] = {}  # { (ItemID, WorkOrderID): {id(Item): Item} } - 완료 순서 유지
+
+        # 단계(MOVE / QUEUE / PROCESS) 별 (item_id, work_order_id) 누적 수량
+        # { (item_id, work_order_id): [수량, Item 수] } - 단계 이동 시마다 갱신, Item 수가 0 이 되면 key 삭제
+        # WAIT 단계는 fetch 시 Item 을 cut 하므로 누적하지 않고 _waits 에서 합산 (실수 오차 누적 방지)
+        self._move_quantities: Dict[Tuple[str, str], list] = {}
+        self._queue_quantities: Dict[Tuple[str, str], list] = {}
+        self._process_quantities: Dict[Tuple[str, str], list] = {}
 
         # Resource History 관리용
         self._history: List[Dict[str, ...]] = []
 
+        # 상태 변경(put, fetch, 도착, 작업 시작/완료) 누적 횟수 - event 방식 forward 의 idle tick 판단용
+        self._event_count: int = 0
+        # 상태 변경 시 호출할 listener - 소속 Process 의 상태 변경 전파용
+        self._event_listener: Callable[[], None] = None
+
+        # 작업이 진행된(run) tick 누적 횟수 - 이동 / 작업 중인 Lot 들은 이 clock 기준의 완료 시점을 가짐
+        # Resource 가 일정 제약에 걸려 진행되지 않는 tick 은 세지 않으므로 완료 시점을 다시 계산할 필요 없음
+        self._clock: int = 0
+
         #
         self._logger: logging.Logger = LogHandler.instance().get_logger()
 
@@ -56,15 +74,17 @@ class ProcessLot(object):
         self._queue.init(max_queue_size=info['MAX_QUEUE_SIZE'])
 
     def put(self, time_index: int, date: datetime.datetime, item: Item, move_time: int):
+        self._add_event()
         if move_time != 0:
-            lot: Lot = Lot(item, time_index, date, "MOVE", move_time)
-            self._moves.append(lot)
+            lot: Lot = Lot(item, time_index, date, "MOVE", move_time, self._clock)
+            self._moves.schedule(lot)
+            self._add_quantity(self._move_quantities, item, item.get_quantity(), 1)
             lot.archive(time_index=time_index, date=date, action="MOVE START", location=self.name)  # Todo: Action Name ?
 
             return lot
 
-        lot: Lot = Lot(item, time_index, date, "QUEUE")
-        putted: bool = self._queue.put(lot, time_index, date)
+        lot: Lot = Lot(item, time_index, date, "QUEUE", clock=self._clock)
+        putted: bool = self._put_queue(lot, time_index, date)
 
         if self._lot is None:
             lot = self._queue.get()
@@ -75,12 +95,12 @@ class ProcessLot(object):
 
             item = lot.get_item()
             if item.get_setup_time() > 0:
-                lot.process(time_index, date, "SETUP", item.get_setup_time())
+                lot.process(time_index, date, "SETUP", item.get_setup_time(), self._clock)
                 lot.archive(time_index=time_index, date=date, action=f"SETUP START", location=self.name)    # Todo : Action Name ?
                 self._append_history_step(date, item, 'SETUP')
-                self._lot = self._queue.fetch()
+                self._set_lot(self._fetch_queue())
             else:
-                lot.process(time_index, date, "PROCESS", item.get_process_time())
+                lot.process(time_index, date, "PROCESS", item.get_process_time(), self._clock)
                 lot.archive(time_index=time_index, date=date, action=f"PROCESS START",
                             location=self.name)  # Todo : Action Name ?
                 self._end_history_step(date)
@@ -90,28 +110,27 @@ class ProcessLot(object):
 
     def run(self, time_index: int, date: datetime.datetime, is_off_day: bool, off_day_type: str):
 
+        self._clock += 1
         if self._lot is not None:
             # Todo: 현재 시점이 Off Day 구간 내에 있는 경우,
             #  Divisible (Y/N/I) 타입에 따라 tick 가능 여부 판단 로직 필요
-            self._lot.run()
             self._restart_history_step(date)
 
-            if self._lot.is_end():
+            if self._lot.is_end(self._clock):
+                self._add_event()
                 item: Item = self._lot.get_item()
                 if self._lot.get_status() == "SETUP":
-                    self._lot.process(time_index, date, "PROCESS", item.get_process_time())
+                    self._lot.process(time_index, date, "PROCESS", item.get_process_time(), self._clock)
                     # Todo: Action Name ?
                     self._lot.archive(time_index=time_index, date=date,
                                       action="PROCESS START", location=self.name)
                     self._end_history_step(date)
                     self._append_history_step(date, item, 'PROCESS')
                 else:
-                    self._waits[item.item_id].append(item)
-                    self._lot = None
+                    self._waits.setdefault((item.item_id, item.work_order_id), {})[id(item)] = item
+                    self._set_lot(None)
                     self._end_history_step(date)
 
-        self._queue.run()
-
         self._run_moves(time_index=time_index, date=date)
         # if len(self.arrived_items) > 0:
         #     self.receive_arrived(time_index, date)  # Move 가 완료된 Lot 들을 Que 에 등록
@@ -121,19 +140,20 @@ class ProcessLot(object):
             if lot is None:
                 return
 
+            self._add_event()
             item = lot.get_item()
             if item.get_setup_time() > 0:
-                lot.process(time_index, date, "SETUP", item.get_setup_time())
+                lot.process(time_index, date, "SETUP", item.get_setup_time(), self._clock)
                 lot.archive(time_index=time_index, date=date, action=f"SETUP START", location=self.name)    # Todo: Action Name ?
                 self._append_history_step(date, item, 'SETUP')
 
             else:
-                lot.process(time_index, date, "PROCESS", item.get_process_time())
+                lot.process(time_index, date, "PROCESS", item.get_process_time(), self._clock)
                 lot.archive(time_index=time_index, date=date, action=f"PROCESS START", location=self.name)  # Todo: Action Name ?
                 self._end_history_step(date)
                 self._append_history_step(date, item, 'PROCESS')
 
-            self._lot = self._queue.fetch()
+            self._set_lot(self._fetch_queue())
 
     def not_run(self, date: datetime.datetime):
         self._end_history_step(date)
@@ -167,6 +187,9 @@ class ProcessLot(object):
             )
 
     def _append_history_step(self, date: datetime.datetime, item: Item, event_id: str):
+        if not ItemEventLog.instance().is_resource_traced():
+            # history 가 비어있으면 _end_history_step, _restart_history_step 도 동작하지 않음
+            return
         self._history.append(
             {'CURR_LOC_ID': self.process_id,
              'CURR_RESOURCE_ID': self.resource_id,
@@ -182,22 +205,118 @@ class ProcessLot(object):
         )
 
     def _run_moves(self, time_index: int, date: datetime.datetime):
-        arrived_lots: list = []
-        for obj in self._moves:
-            lot: Lot = obj
-            lot.run()
-            if lot.is_end():
-                putted: bool = self._queue.put(lot, time_index, date)
-                if putted:
-                    lot.archive(time_index=time_index, date=date, action="QUEUE IN", location=self.name)
-                    arrived_lots.append(lot)
-        for obj in arrived_lots:
-            self._moves.remove(obj)
+        """
+        현재 clock 에 도착한 Lot 들과 Queue 대기 중인 Lot 들을 이동 등록 순서대로 Queue 에 넣는 처리
+        :return: void
+        """
+        arrivals: list = self._moves.pop(self._clock)
+        if self._arrived:
+            arrivals = sorted(self._arrived + arrivals, key=lambda entry: entry[0])
+        if not arrivals:
+            return
+
+        self._arrived = []
+        for entry in arrivals:
+            lot: Lot = entry[2]
+            putted: bool = self._put_queue(lot, time_index, date)
+            if not putted:
+                self._arrived.append(entry)
+                continue
+            lot.archive(time_index=time_index, date=date, action="QUEUE IN", location=self.name)
+            item: Item = lot.get_item()
+            self._add_quantity(self._move_quantities, item, -item.get_quantity(), -1)
+            self._add_event()
+
+    def _put_queue(self, lot: Lot, time_index: int, date: datetime.datetime) -> bool:
+        """
+        Queue 에 Lot 을 넣고 QUEUE 단계 수량 갱신
+        :return: bool : Queue 에 넣었는지 여부 (Queue 가 가득 찬 경우 False)
+        """
+        putted: bool = self._queue.put(lot, time_index, date)
+        if putted:
+            item: Item = lot.get_item()
+            self._add_quantity(self._queue_quantities, item, item.get_quantity(), 1)
+        return putted
+
+    def _fetch_queue(self):
+        """
+        Queue 에서 Lot 을 꺼내고 QUEUE 단계 수량 갱신
+        :return: Lot, Queue 가 비어있을 경우 None
+        """
+        lot: Lot = self._queue.fetch()
+        if lot is not None:
+            item: Item = lot.get_item()
+            self._add_quantity(self._queue_quantities, item, -item.get_quantity(), -1)
+        return lot
+
+    def _set_lot(self, lot):
+        """
+        처리 중인 Lot 변경 및 PROCESS 단계 수량 갱신
+        :param lot: 새로 처리할 Lot, 처리 완료 시 None
+        :return: void
+        """
+        if self._lot is not None:
+            item: Item = self._lot.get_item()
+            self._add_quantity(self._process_quantities, item, -item.get_quantity(), -1)
+        if lot is not None:
+            item: Item = lot.get_item()
+            self._add_quantity(self._process_quantities, item, item.get_quantity(), 1)
+        self._lot = lot
+
+    @staticmethod
+    def _add_quantity(quantities: Dict[Tuple[str, str], list], item: Item, quantity: float, count: int):
+        """
+        단계 별 (item_id, work_order_id) 누적 수량 갱신
+        Item 수가 0 이 되면 key 를 삭제하여 실수 누적 오차가 남지 않도록 함
+        :param quantities: 단계 별 누적 수량 dict
+        :param item: 대상 Item
+        :param quantity: 증감 수량
+        :param count: 증감 Item 수
+        :return: void
+        """
+        key: Tuple[str, str] = (item.item_id, item.work_order_id)
+        entry: list = quantities.get(key)
+        if entry is None:
+            quantities[key] = [quantity, count]
+            return
+        entry[0] += quantity
+        entry[1] += count
+        if entry[1] == 0:
+            del quantities[key]
+
+    def fast_forward(self, ticks: int):
+        """
+        상태 변경이 없는 idle tick 들을 한 번에 진행하는 처리
+        run() 을 ticks 번 호출한 것과 같은 Runtime 진행 상태를 만듦 (도중에 완료되는 Lot 이 없음을 전제)
+        Lot 들은 완료 시점을 가지므로 clock 만 진행
+        :param ticks: 건너뛸 tick 수
+        :return: void
+        """
+        if ticks <= 0:
+            return
+        self._clock += ticks
+
+    def get_next_event_index(self, time_index: int):
+        """
+        처리 중인 Lot 및 이동 중인 Lot 들 중 가장 먼저 완료될 시점의 time index
+        이동이 끝났지만 Queue 가 가득 차 대기 중인 Lot 은 Queue 상태 변경 시 처리되므로 제외
+        :param time_index: 현재 time index
+        :return: int, 진행 중인 Lot 이 없을 경우 None
+        """
+        remains: List[int] = []
+        next_clock: int = self._moves.get_next_clock()
+        if next_clock is not None:
+            remains.append(next_clock - self._clock)
+        if self._lot is not None:
+            remains.append(self._lot.get_remaining(self._clock))
+        if not remains:
+            return None
+        return time_index + max(min(remains), 1)
 
     def is_available(self, date: datetime.datetime, item_id: str, quantity: float, move_time: int):
         # Todo : 이동 중인 Item 처리(?)
         is_available: bool = \
-            (self._queue.get_available_size() - len(self._moves) > 0)
+            (self._queue.get_available_size() - len(self._moves) - len(self._arrived) > 0)
         return is_available
 
     def fetch(self,
@@ -213,7 +332,8 @@ class ProcessLot(object):
         :return : Item
         """
 
-        wait_quantity: float = self.get_wait_quantity(item_id, work_order_id)
+        wait_items: List[Item] = self.get_wait_items(item_id, work_order_id)
+        wait_quantity: float = sum([item.get_quantity() for item in wait_items])
         if quantity != 0:
             if wait_quantity < quantity:
                 return []
@@ -224,31 +344,26 @@ class ProcessLot(object):
                     f" - wait quantity exceed fetch quantity"
                 )
 
-        wait_items: List[Item] = self.get_wait_items(item_id, work_order_id)
-        cut_items: list = []
+        # 완료 순서대로 한 번만 순회 : 수량 합계의 실수 오차로 remain_qty 가 남더라도 wait Item 수 이내에서 종료
         fetch_items: list = []
         remain_qty: float = quantity
-        while remain_qty > 0:
-            for obj in wait_items:
-                if remain_qty == 0:  # for Loop 안에서 수량 처리가 모두 끝날 경우 대비
-                    break
-
-                item: Item = obj
-                item_qty: float = item.get_quantity()
-                if item_qty <= remain_qty:
-                    # 그대로 fetch
-                    fetch_items.append(self._pop(item_id, item))
-                    remain_qty -= item_qty
-                else:
-                    # Cut 필요
-                    fetch_items.append(item.cut(time_index, date, self.resource_id, remain_qty))
-                    cut_items.append(item)
-                    remain_qty = 0
-                    break
+        for obj in wait_items:
+            if remain_qty <= 0:
+                break
+
+            item: Item = obj
+            item_qty: float = item.get_quantity()
+            if item_qty <= remain_qty:
+                # 그대로 fetch
+                fetch_items.append(self._pop(item))
+                remain_qty -= item_qty
+            else:
+                # Cut 필요
+                fetch_items.append(item.cut(time_index, date, self.resource_id, remain_qty))
+                remain_qty = 0
 
-        # items = []
-        # for item in wait_items:
-        #     items.append(self._pop(item_id, item))
+        if fetch_items:
+            self._add_event()
 
         self._logger.info(
             f"[Process Lot {self.process_id}:{self.resource_id}:{self.name}] : {item_id}:{work_order_id}"
@@ -256,14 +371,19 @@ class ProcessLot(object):
 
         return fetch_items
 
-    def _pop(self, item_id: str, item: Item):
+    def _pop(self, item: Item):
         """
-        stock 에서 remove 하는 처리
+        waits 에서 remove 하는 처리
+        인스턴스 주소 값(id)으로 찾아 제거
         :param item:
-        :return:
+        :return: Item
         """
-        # self._stock[item_id].remove(item)
-        return self._waits[item_id].pop(self._waits[item_id].index(item))
+        key: Tuple[str, str] = (item.item_id, item.work_order_id)
+        items: Dict[int, Item] = self._waits[key]
+        del items[id(item)]
+        if not items:
+            del self._waits[key]
+        return item
 
     def get_quantity(self, item_id: str, work_order_id: str):
         """
@@ -279,80 +399,58 @@ class ProcessLot(object):
             self.get_wait_quantity(item_id=item_id, work_order_id=work_order_id)
 
     def get_move_quantity(self, item_id: str, work_order_id: str) -> float:
-
-        move_items: list = [lot.get_item() for lot in self._moves]
-
-        items = []
-        for item in move_items:
-            if item.item_id != item_id or item.work_order_id != work_order_id:
-                continue
-            items.append(item)
-
-        return sum([
-            item.get_quantity() for item in items
-        ])
+        return self._get_stage_quantity(self._move_quantities, item_id, work_order_id)
 
     def get_queue_quantity(self, item_id: str, work_order_id: str) -> float:
-
-        queue_items: list = [lot.get_item() for lot in self._queue]
-
-        items = []
-        for item in queue_items:
-            if item.item_id != item_id or item.work_order_id != work_order_id:
-                continue
-            items.append(item)
-
-        return sum([
-            item.get_quantity() for item in items
-        ])
+        return self._get_stage_quantity(self._queue_quantities, item_id, work_order_id)
 
     def get_process_quantity(self, item_id: str, work_order_id: str) -> float:
-
-        process_items: list = [] if self._lot is None else [self._lot.get_item()]
-
-        items = []
-        for item in process_items:
-            if item.item_id != item_id or item.work_order_id != work_order_id:
-                continue
-            items.append(item)
-
-        return sum([
-            item.get_quantity() for item in items
-        ])
+        return self._get_stage_quantity(self._process_quantities, item_id, work_order_id)
 
     def get_wait_quantity(self, item_id: str, work_order_id: str) -> float:
+        items: Dict[int, Item] = self._waits.get((item_id, work_order_id), {})
+        return sum([item.get_quantity() for item in items.values()])
 
-        wait_items: list = self._waits.get(item_id, [])
-
-        items = []
-        for item in wait_items:
-            if item.work_order_id != work_order_id:
-                continue
-            items.append(item)
-
-        return sum([
-            item.get_quantity() for item in items
-        ])
+    @staticmethod
+    def _get_stage_quantity(quantities: Dict[Tuple[str, str], list], item_id: str, work_order_id: str) -> float:
+        """
+        단계 별 누적 수량 조회
+        :param quantities: 단계 별 누적 수량 dict
+        :param item_id: 수량 파악 대상 품목 id
+        :param work_order_id: 수량 파악 대상 주문 id
+        :return: float
+        """
+        entry: list = quantities.get((item_id, work_order_id))
+        return 0 if entry is None else entry[0]
 
     def get_wait_items(self, item_id: str, work_order_id: str) -> List[Item]:
         """
         get items
         :param : item_id
-        :param : quantity
-        :return : List[Item]
+        :param : work_order_id
+        :return : List[Item] - 완료 순서
         """
-        # Todo : 수정 필요
-        wait_items: list = self._waits.get(item_id, [])
-        items = []
-        for item in wait_items:
-            if item.work_order_id != work_order_id:
-                continue
-            items.append(item)
-        return items
+        items: Dict[int, Item] = self._waits.get((item_id, work_order_id), {})
+        return list(items.values())
 
     def get_history(self):
         return self._history
 
+    def set_event_listener(self, listener: Callable[[], None]):
+        self._event_listener = listener
+
+    def _add_event(self):
+        """
+        상태 변경 누적 횟수 증가 및 listener 호출
+        :return: void
+        """
+        self._event_count += 1
+        if self._event_listener is not None:
+            self._event_listener()
+
+    def get_event_count(self) -> int:
+        return self._event_count
+
     @property
     def status(self):
         if self._lot is None:
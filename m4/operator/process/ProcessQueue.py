@@ -23,10 +23,6 @@ class ProcessQueue(Deque[Runtime]):
         self.appendleft(lot)
         return True
 
-    def run(self):
-        for lot in self:
-            lot.run()
-
     def get(self):
         return self[-1] if self.length() > 0 else None
 
@@ -1,7 +1,7 @@
 import math
 import sys
 import datetime
-from typing import List
+from typing import List, Callable
 
 from m4.constraint.AbstractConstraint import AbstractConstraint
 from m4.operator.Resource import Resource
@@ -39,6 +39,7 @@ class ProcessResource(object):
         self._process_time: int = 0
         self._setup_time: int = 0
         self._use_backward_size: bool = True
+        self._is_running: bool = False      # 직전 run() 시점에 작업이 진행되었는지 여부 (일정 제약에 걸리지 않은 상태)
 
         self._process_lot: ProcessLot = ProcessLot()        # Resource 의 실제 작업을 수행하는 객체
 
@@ -91,14 +92,33 @@ class ProcessResource(object):
         #       - min / max Capa 에 들어오는지
         #       - unit_lot_size 의 배수인지
         # 3. 아이템
-        input_quantity: float = self.calculate_available_input_quantity(product_quantity)
-        _is_available: bool = \
-            self._resource.check(date=date) is None and \
-            self._min_lot_size <= input_quantity <= self._max_lot_size and \
-            product_quantity % self._unit_lot_size == 0 and \
+        is_lot_size, input_quantity = self.check_lot_size(product_quantity)
+        _is_available: bool = is_lot_size and self.is_dispatchable(date, item_id, product_quantity, move_time)
+        return _is_available, input_quantity
+
+    def is_dispatchable(self, date: datetime.datetime, item_id: str, product_quantity: float, move_time: int):
+        """
+        date 시점에 Resource 가 일정 제약에 걸리지 않고 Queue 에 여유가 있는지 여부
+        할당 수량과 관계없으므로 Process 에서 시점 / 상태 변경 시에만 다시 계산
+        :return: bool
+        """
+        return self._resource.check(date=date) is None and \
             self._process_lot.is_available(date=date, item_id=item_id,
                                            quantity=product_quantity, move_time=move_time)
-        return _is_available, input_quantity
+
+    def check_lot_size(self, product_quantity: float):
+        """
+        할당 가능 Lot Size 인지 확인
+            - min / max Capa 에 들어오는지
+            - unit_lot_size 의 배수인지
+        :param product_quantity: 산출 수량
+        :return: (할당 가능 여부, 투입 수량)
+        """
+        input_quantity: float = self.calculate_available_input_quantity(product_quantity)
+        is_lot_size: bool = \
+            self._min_lot_size <= input_quantity <= self._max_lot_size and \
+            product_quantity % self._unit_lot_size == 0
+        return is_lot_size, input_quantity
 
     def put(self, time_index: int, date: datetime.datetime, item: Item, move_time: int):
 
@@ -119,13 +139,42 @@ class ProcessResource(object):
         :return:
         """
         # Todo: Work Divisibility (Y/N/I Type) 반영
+        self._is_running = False
         if is_off_day or factory_const:     # 공장 일정 제약에 걸리는 경우
             self._process_lot.not_run(date)
         elif self._resource.check(date) is not None:    # Resource 일정 제약에 걸리는 경우
             self._process_lot.not_run(date)
         else:
+            self._is_running = True
             self._process_lot.run(time_index, date, is_off_day, off_day_type)
 
+    def fast_forward(self, ticks: int):
+        """
+        상태 변경이 없는 idle tick 들을 한 번에 진행하는 처리
+        건너뛰는 구간에는 일정 제약 경계가 없으므로 직전 run() 시점에 작업이 진행된 경우에만 진행
+        :param ticks: 건너뛸 tick 수
+        :return: void
+        """
+        if self._is_running:
+            self._process_lot.fast_forward(ticks)
+
+    def get_next_event_index(self, time_index: int):
+        """
+        처리 중인 Lot 및 이동 중인 Lot 들 중 가장 먼저 완료될 시점의 time index
+        일정 제약에 걸려 진행되지 않는 경우, 제약 경계 시점에 다시 계산되므로 None
+        :param time_index: 현재 time index
+        :return: int
+        """
+        if not self._is_running:
+            return None
+        return self._process_lot.get_next_event_index(time_index)
+
+    def get_event_count(self) -> int:
+        return self._process_lot.get_event_count()
+
+    def set_event_listener(self, listener: Callable[[], None]):
+        self._process_lot.set_event_listener(listener)
+
     def fetch(self, time_index: int, date: datetime.datetime, item_id: str, work_order_id: str, quantity: float):
         return self._process_lot.fetch(time_index=time_index,
                                        date=date,
@@ -179,6 +228,9 @@ class ProcessResource(object):
         return self._process_lot.get_wait_quantity(item_id=item_id,
                                                    work_order_id=work_order_id)
 
+    def get_resource(self) -> Resource:
+        return self._resource
+
     def get_min_lot_size(self):
         return self._min_lot_size
 
@@ -1,8 +1,22 @@
 import datetime
-import copy
+
+from m4.process.ItemEventLog import ItemEventLog
 
 
 class Item(object):
+    """
+    Item Object
+    인스턴스가 많이 생성되므로 __slots__ 로 속성을 고정하여 인스턴스별 __dict__ 를 두지 않음
+    == 비교는 인스턴스 주소 값(identity) 기준이며, 속성 값 비교가 필요한 경우 is_equivalent_to( ) 사용
+    """
+
+    __slots__ = ('item_id', 'location_id', '_quantity',
+                 'work_order_id', 'order_item_id', '_order_quantity', '_required_quantity', '_peg_quantity',
+                 '_due_date', '_setup_time', '_process_time', '_lpst', '_priority',
+                 '_src_quantity', '_history_row', '_merged_items')
+
+    # 속성 값 비교 시 제외되는 이력 관련 속성
+    _history_attributes: tuple = ('_history_row',)
 
     def __init__(self):
         # 기본 속성
@@ -26,23 +40,42 @@ class Item(object):
 
         # runtime 처리 속성
         # 이전 단계 수량 조합 (product, stock, wip)
+        self._src_quantity: tuple = None
 
         # 이력 관련 속성
-        self._history: list = []
+        self._history_row: int = -1                 # ItemEventLog 에 기록된 마지막 이력의 행 번호 (없을 경우 -1)
         self._merged_items: list = []
 
-    def __eq__(self, other) -> bool:
+    def _is_equivalent(self, other, exceptional_attributes: tuple) -> bool:
+        """
+        exceptional_attributes 를 제외한 속성 값들이 서로 일치하는지 비교
+        Merge 된 Item 목록은 각 Item 끼리 같은 기준으로 비교
+        :param other: Item
+        :param exceptional_attributes: 비교에서 제외할 속성 명칭
+        :return: bool
+        """
+        if not isinstance(other, self.__class__):
+            return False
+        for attr in self.__slots__:
+            if attr in exceptional_attributes:
+                continue
+            if attr == '_merged_items':
+                if len(self._merged_items) != len(other._merged_items) or \
+                        not all(item._is_equivalent(other_item, exceptional_attributes)
+                                for item, other_item in zip(self._merged_items, other._merged_items)):
+                    return False
+            elif getattr(self, attr) != getattr(other, attr):
+                return False
+        return True
+
+    def is_equivalent_to(self, other) -> bool:
         """
         인스턴스 주소 값이나 쌓인 history 가 달라도 나머지 속성들이 서로 일치하면 같은 것으로 간주
-        Inventory.set_backward_peg_items( ) 메서드에서 _stock 재고 Item 에 대한 처리를 구분하기 위함
+        (== 비교는 identity 기준이므로 재고 Item 의 속성 값 비교가 필요한 경우 사용)
         :param other: Item
         :return: bool
         """
-        eq: bool = \
-            isinstance(other, self.__class__) and \
-            {attr: val for attr, val in self.__dict__.items() if attr != '_history'} \
-            == {attr: val for attr, val in other.__dict__.items() if attr != '_history'}
-        return eq
+        return self._is_equivalent(other, self._history_attributes)
 
     def init(self,
              item_id: str, location_id: str, quantity: float,
@@ -71,22 +104,42 @@ class Item(object):
         self._priority = priority
 
     def cut(self, time_index: int, date: datetime.datetime, location: str, quantity: float):
-        new_item: Item = copy.deepcopy(self)
+        """
+        quantity 만큼 잘라낸 새 Item 을 생성
+        이력은 복사하지 않고 원래 Item 의 마지막 이력 행 번호를 이어받아 ItemEventLog 상에서 연결되므로
+        이력 길이와 관계없이 속성 값 복사 비용만 듦
+        :param time_index:
+        :param date:
+        :param location:
+        :param quantity: 잘라낼 수량
+        :return: Item
+        """
+        new_item: Item = self.__class__.__new__(self.__class__)
+        for attr in self.__slots__:
+            setattr(new_item, attr, getattr(self, attr))
+        new_item._merged_items = list(self._merged_items)
         new_item.set_quantity(quantity)
         new_item.archive(time_index, date, 'CUT', location)
         self.set_quantity(self._quantity - quantity)
         return new_item
 
     def archive(self, time_index: int, date: datetime.datetime, action: str, location: str):
-        history: dict = {
-            'TIME_INDEX': time_index,
-            'DATE': date,
-            'ACTION': action,
-            'LOCATION': location,
-            'WORK_ORDER': self.work_order_id,
-            'QTY': self._quantity
-        }
-        self._history.append(history)
+        """
+        이력을 ItemEventLog 에 기록하고 마지막 이력 행 번호 갱신
+        trace level 이 full 이 아닐 경우 기록하지 않음
+        """
+        event_log: ItemEventLog = ItemEventLog.instance()
+        if not event_log.is_item_traced():
+            return
+        self._history_row = event_log.append(
+            self._history_row, time_index, date, action, location, self.work_order_id, self._quantity)
+
+    def get_history(self) -> list:
+        """
+        cut 으로 연결된 원래 Item 들의 (cut 시점까지의) 이력을 포함한 전체 이력
+        :return: list
+        """
+        return ItemEventLog.instance().get_lineage(self._history_row)
 
     def is_peg_info_appended_to(self, other) -> bool:
         """
@@ -95,15 +148,14 @@ class Item(object):
         :param other: Item
         :return: bool
         """
-        exceptional_attributes: list = ['_history', 'order_item_id', 'work_order_id', '_lpst',
-                                        '_peg_quantity', '_required_quantity']
-        eq: bool = \
-            isinstance(other, self.__class__) and \
-            {attr: val for attr, val in self.__dict__.items() if attr not in exceptional_attributes} \
-            == {attr: val for attr, val in other.__dict__.items() if attr not in exceptional_attributes}
-        return eq
+        exceptional_attributes: tuple = self._history_attributes + \
+            ('order_item_id', 'work_order_id', '_lpst', '_peg_quantity', '_required_quantity')
+        return self._is_equivalent(other, exceptional_attributes)
 
     def append_merged_item(self, item):
+        if not ItemEventLog.instance().is_item_traced():
+            # Merge 계보는 Item 이력을 남길 때만 유지
+            return
         self._merged_items.append(item)
 
     def get_order_item_id(self):
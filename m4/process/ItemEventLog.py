@@ -0,0 +1,148 @@
+import datetime
+import math
+from array import array
+from typing import Dict, List
+
+from m4.common.SingletonInstance import SingletonInstance
+
+
+class ItemEventLog(SingletonInstance):
+    """
+    Item Event Log Object
+    Item 별 이력(MOVE START, QUEUE IN, PROCESS START, STOCK IN, CUT, ...)을
+    Item 마다 dict 로 쌓지 않고 한 곳에 column 단위 배열로 모아서 저장하는 클래스
+    문자열 값(ACTION, LOCATION, WORK_ORDER)은 문자열 table 에 한 번만 저장하고 code 로 기록
+    각 행은 같은 Item 의 직전 행 번호를 가지므로 Item 은 마지막 행 번호만으로 이력을 거슬러 조회 가능
+
+    이력 기록 수준(trace level)
+    - none : 이력을 남기지 않음
+    - resource : Resource 작업 이력(ProcessLot, Gantt Chart 용)만 남김
+    - full : Resource 작업 이력 + Item 별 이력(MERGED / CUT 계보 포함)
+    """
+
+    TRACE_NONE: str = 'none'
+    TRACE_RESOURCE: str = 'resource'
+    TRACE_FULL: str = 'full'
+    TRACE_LEVELS: tuple = (TRACE_NONE, TRACE_RESOURCE, TRACE_FULL)
+
+    # DATE column 기준 시각 - datetime 을 기준 시각으로부터의 초 단위 실수로 저장
+    EPOCH: datetime.datetime = datetime.datetime(1970, 1, 1)
+
+    def __init__(self):
+        # 이력 기록 수준
+        self._trace_level: str = self.TRACE_FULL
+
+        # column 별 배열
+        self._previous_rows: array = array('q')     # 같은 Item 의 직전 행 번호 (없을 경우 -1)
+        self._time_indices: array = array('q')
+        self._seconds: array = array('d')           # EPOCH 로부터의 초 (date 가 None 일 경우 nan)
+        self._actions: array = array('I')
+        self._locations: array = array('I')
+        self._work_orders: array = array('I')
+        self._quantities: array = array('d')
+
+        # 문자열 table
+        self._strings: List[str] = []
+        self._string_codes: Dict[str, int] = {}
+
+    def init(self, trace_level: str = TRACE_FULL):
+        """
+        저장된 이력 및 문자열 table 초기화, 이력 기록 수준 설정
+        :param trace_level: none / resource / full
+        :return: void
+        """
+        if trace_level not in self.TRACE_LEVELS:
+            raise ValueError(f"Unknown trace level : {trace_level} (expected one of {self.TRACE_LEVELS})")
+        self.__init__()
+        self._trace_level = trace_level
+
+    def is_item_traced(self) -> bool:
+        """
+        Item 별 이력(Item.archive, MERGED / CUT 계보)을 남기는지 여부
+        :return: bool
+        """
+        return self._trace_level == self.TRACE_FULL
+
+    def is_resource_traced(self) -> bool:
+        """
+        Resource 작업 이력(ProcessLot history)을 남기는지 여부
+        :return: bool
+        """
+        return self._trace_level != self.TRACE_NONE
+
+    def _intern(self, value: str) -> int:
+        """
+        문자열 table 에서 value 의 code 조회, 없을 경우 추가
+        :param value: 문자열
+        :return: int
+        """
+        code: int = self._string_codes.get(value)
+        if code is None:
+            code = len(self._strings)
+            self._strings.append(value)
+            self._string_codes[value] = code
+        return code
+
+    def append(self, previous_row: int, time_index: int, date: datetime.datetime,
+               action: str, location: str, work_order_id: str, quantity: float) -> int:
+        """
+        이력 한 행 추가
+        :param previous_row: 같은 Item 의 직전 행 번호 (없을 경우 -1)
+        :param time_index:
+        :param date:
+        :param action:
+        :param location:
+        :param work_order_id:
+        :param quantity:
+        :return: 추가된 행 번호
+        """
+        self._previous_rows.append(previous_row)
+        self._time_indices.append(time_index)
+        self._seconds.append(math.nan if date is None else (date - self.EPOCH).total_seconds())
+        self._actions.append(self._intern(action))
+        self._locations.append(self._intern(location))
+        self._work_orders.append(self._intern(work_order_id))
+        self._quantities.append(quantity)
+        return len(self._previous_rows) - 1
+
+    def get(self, row: int) -> dict:
+        """
+        row 번째 행의 이력 정보
+        :param row: 행 번호
+        :return: dict
+        """
+        seconds: float = self._seconds[row]
+        return {
+            'TIME_INDEX': self._time_indices[row],
+            'DATE': None if math.isnan(seconds) else self.EPOCH + datetime.timedelta(seconds=seconds),
+            'ACTION': self._strings[self._actions[row]],
+            'LOCATION': self._strings[self._locations[row]],
+            'WORK_ORDER': self._strings[self._work_orders[row]],
+            'QTY': self._quantities[row]
+        }
+
+    def get_lineage(self, last_row: int) -> List[dict]:
+        """
+        last_row 행부터 직전 행 번호를 따라 거슬러 올라간 이력 목록 (오래된 순)
+        :param last_row: Item 의 마지막 행 번호
+        :return: list
+        """
+        rows: List[int] = []
+        row: int = last_row
+        while row >= 0:
+            rows.append(row)
+            row = self._previous_rows[row]
+        return [self.get(row) for row in reversed(rows)]
+
+    def export(self):
+        """
+        전체 이력을 행 단위로 내보내기
+        :return: generator of (ROW, PREVIOUS_ROW, TIME_INDEX, DATE, ACTION, LOCATION, WORK_ORDER, QTY)
+        """
+        for row in range(len(self._previous_rows)):
+            history: dict = self.get(row)
+            yield (row, self._previous_rows[row], history['TIME_INDEX'], history['DATE'],
+                   history['ACTION'], history['LOCATION'], history['WORK_ORDER'], history['QTY'])
+
+    def __len__(self):
+        return len(self._previous_rows)
@@ -0,0 +1,13 @@
+-- Oracle schema (SCMV2) 추가 테이블
+-- 기존 생산 일정 계획 테이블 외에 시뮬레이터가 새로 사용하는 테이블만 포함
+
+-- 시뮬레이션 snapshot (m4.properties [Monitor] monitor.snapshot.enabled=True 일 때 SimulationMonitor 가 저장)
+CREATE TABLE SCMV2.FS_SIM_SNAPSHOT (
+    PLAN_VER_ID         VARCHAR2(50),
+    SIM_ID              VARCHAR2(50),
+    TIME_INDEX          NUMBER(10),
+    SNAPSHOT_DT_HMS     DATE,
+    EVENT_CNT           NUMBER(10)
+);
+
+CREATE INDEX SCMV2.FS_SIM_SNAPSHOT_IX1 ON SCMV2.FS_SIM_SNAPSHOT (PLAN_VER_ID, SIM_ID);
@@ -0,0 +1,220 @@
+-- SQLite Data Source schema
+-- DAO 들이 조회/저장하는 테이블 (Oracle SCMV2 schema 와 같은 테이블명 / column 명)
+-- 일자/시각은 Oracle 과 같이 'YYYYMMDDHH24MISS' 형식 문자열(TEXT)로 저장
+-- 내보내기(export) 파일에 아래에 없는 column 이 있을 경우 SQLiteLoader 가 column 을 추가
+
+-- 공통 코드
+CREATE TABLE IF NOT EXISTS CM_COMN_GRP_CD (
+    COMN_GRP_CD         TEXT NOT NULL,
+    COMN_GRP_CD_NM      TEXT,
+    USE_YN              TEXT,
+    PRIMARY KEY (COMN_GRP_CD)
+);
+
+CREATE TABLE IF NOT EXISTS CM_COMN_CD (
+    COMN_GRP_CD         TEXT NOT NULL,
+    COMN_CD             TEXT NOT NULL,
+    COMN_CD_NM          TEXT,
+    USE_YN              TEXT,
+    PRIMARY KEY (COMN_GRP_CD, COMN_CD)
+);
+
+CREATE TABLE IF NOT EXISTS CM_PLANT (
+    PLANT_ID            TEXT NOT NULL,
+    PLANT_NM            TEXT,
+    PRIMARY KEY (PLANT_ID)
+);
+
+CREATE TABLE IF NOT EXISTS CM_CALNDR (
+    YYYYMMDD            TEXT NOT NULL,
+    HLDAY_YN            TEXT,
+    OFF_DAY_YN          TEXT,
+    DESCR               TEXT,
+    PRIMARY KEY (YYYYMMDD)
+);
+
+CREATE TABLE IF NOT EXISTS MF_BOM_ROUTING (
+    ITEM_ID             TEXT,
+    NEXT_ITEM_ID        TEXT,
+    ITEM_MIX_CD         TEXT,
+    RATIO               NUMERIC
+);
+
+-- 생산 일정 계획 버전 / 시뮬레이션
+CREATE TABLE IF NOT EXISTS FS_PLAN_VER (
+    PLAN_VER_ID         TEXT NOT NULL,
+    START_DT_HMS        TEXT,
+    END_DT_HMS          TEXT,
+    UNIT_TM             NUMERIC,
+    UNIT_TM_TYP         TEXT,
+    PRIMARY KEY (PLAN_VER_ID)
+);
+
+CREATE TABLE IF NOT EXISTS FS_SIM (
+    SIM_ID              TEXT NOT NULL,
+    PLAN_VER_ID         TEXT,
+    FACTRY_SCHDL_ID     TEXT,
+    PRIMARY KEY (SIM_ID)
+);
+
+CREATE TABLE IF NOT EXISTS FS_WORK_ORDER (
+    PLAN_VER_ID         TEXT NOT NULL,
+    WORK_ORDER_ID       TEXT NOT NULL,
+    ORDER_ITEM_ID       TEXT,
+    PRIORITY            NUMERIC,
+    DTL_PRIORITY        NUMERIC,
+    ORDER_QTY           NUMERIC,
+    DUE_DT              TEXT,
+    PRIMARY KEY (PLAN_VER_ID, WORK_ORDER_ID)
+);
+
+-- Route
+CREATE TABLE IF NOT EXISTS FS_ROUTE (
+    SIM_ID              TEXT NOT NULL,
+    ITEM_ID             TEXT,
+    CURR_LOC_ID         TEXT,
+    CURR_LOC_TYP        TEXT,
+    NEXT_ITEM_ID        TEXT,
+    NEXT_LOC_ID         TEXT,
+    NEXT_LOC_TYP        TEXT,
+    ROUTE_CONN_CD       TEXT,
+    ITEM_MIX_CD         TEXT,
+    PRIORITY            NUMERIC,
+    RATIO               NUMERIC,
+    MOVE_TM             NUMERIC
+);
+CREATE INDEX IF NOT EXISTS FS_ROUTE_IX1 ON FS_ROUTE (SIM_ID, CURR_LOC_TYP, CURR_LOC_ID);
+CREATE INDEX IF NOT EXISTS FS_ROUTE_IX2 ON FS_ROUTE (SIM_ID, NEXT_LOC_TYP, NEXT_LOC_ID);
+
+-- Inventory
+CREATE TABLE IF NOT EXISTS FS_INV (
+    INV_ID              TEXT NOT NULL,
+    INV_NM              TEXT,
+    INV_TYP             TEXT,
+    PLANT_ID            TEXT,
+    MAX_QTY             NUMERIC,
+    PRIMARY KEY (INV_ID)
+);
+
+CREATE TABLE IF NOT EXISTS FS_INV_ITEM (
+    INV_ID              TEXT NOT NULL,
+    ITEM_ID             TEXT NOT NULL,
+    STOCK_QTY           NUMERIC
+);
+CREATE INDEX IF NOT EXISTS FS_INV_ITEM_IX1 ON FS_INV_ITEM (INV_ID);
+
+CREATE TABLE IF NOT EXISTS FS_INV_ITEM_CONST (
+    INV_ID              TEXT NOT NULL,
+    ITEM_ID             TEXT NOT NULL,
+    MAX_QTY             NUMERIC,
+    LOAD_RATE           NUMERIC
+);
+CREATE INDEX IF NOT EXISTS FS_INV_ITEM_CONST_IX1 ON FS_INV_ITEM_CONST (INV_ID);
+
+CREATE TABLE IF NOT EXISTS FS_WIP (
+    PROC_ID             TEXT NOT NULL,
+    ITEM_ID             TEXT,
+    STOCK_QTY           NUMERIC
+);
+
+-- Process / Resource
+CREATE TABLE IF NOT EXISTS FS_PROC (
+    PROC_ID             TEXT NOT NULL,
+    PROC_NM             TEXT,
+    PLANT_ID            TEXT,
+    PRIMARY KEY (PROC_ID)
+);
+
+CREATE TABLE IF NOT EXISTS FS_BOR (
+    PROC_ID             TEXT NOT NULL,
+    RESC_ID             TEXT NOT NULL,
+    BOR_NM              TEXT,
+    PRIORITY            NUMERIC,
+    PROC_TM             NUMERIC,
+    PRE_PROC_SETUP_TM   NUMERIC,
+    PROC_PRECSN         NUMERIC,
+    PROD_EFFCNCY        NUMERIC,
+    MIN_LOT_SIZE        NUMERIC,
+    MAX_LOT_SIZE        NUMERIC,
+    UNIT_LOT_SIZE       NUMERIC,
+    MAX_QUEUE_SIZE      NUMERIC,
+    PRIMARY KEY (PROC_ID, RESC_ID)
+);
+
+CREATE TABLE IF NOT EXISTS FS_RESC (
+    RESC_ID             TEXT NOT NULL,
+    RESC_NM             TEXT,
+    PLANT_ID            TEXT,
+    RESC_SCHDL_ID       TEXT,
+    PRIMARY KEY (RESC_ID)
+);
+
+-- 일정 제약
+CREATE TABLE IF NOT EXISTS FS_TM_CONST (
+    TM_CONST_ID         TEXT NOT NULL,
+    TM_CONST_NM         TEXT,
+    TM_CONST_TYP        TEXT,
+    PRD_TYP             TEXT,
+    START_DT_HMS        TEXT,
+    END_DT_HMS          TEXT,
+    PRIMARY KEY (TM_CONST_ID)
+);
+
+CREATE TABLE IF NOT EXISTS FS_RESC_SCHDL (
+    RESC_SCHDL_ID       TEXT NOT NULL,
+    RESC_SCHDL_NM       TEXT,
+    PRIMARY KEY (RESC_SCHDL_ID)
+);
+
+CREATE TABLE IF NOT EXISTS FS_RESC_SCHDL_CONST (
+    RESC_SCHDL_ID       TEXT NOT NULL,
+    TM_CONST_ID         TEXT NOT NULL,
+    PRIORITY            NUMERIC,
+    START_DT_HMS        TEXT,
+    END_DT_HMS          TEXT
+);
+
+CREATE TABLE IF NOT EXISTS FS_FACTRY_SCHDL (
+    FACTRY_SCHDL_ID     TEXT NOT NULL,
+    FACTRY_SCHDL_NM     TEXT,
+    PRIMARY KEY (FACTRY_SCHDL_ID)
+);
+
+CREATE TABLE IF NOT EXISTS FS_FACTRY_SCHDL_CONST (
+    FACTRY_SCHDL_ID     TEXT NOT NULL,
+    TM_CONST_ID         TEXT NOT NULL,
+    PRIORITY            NUMERIC,
+    START_DT_HMS        TEXT,
+    END_DT_HMS          TEXT
+);
+
+CREATE TABLE IF NOT EXISTS FS_FACTORY (
+    PLANT_ID            TEXT,
+    FACTRY_SCHDL_ID     TEXT
+);
+
+-- 시뮬레이션 결과
+CREATE TABLE IF NOT EXISTS FS_SCHDL_RSLT_TEST (
+    PLAN_VER_ID         TEXT,
+    SIM_ID              TEXT,
+    CURR_LOC_ID         TEXT,
+    CURR_RES_ID         TEXT,
+    NEXT_LOC_ID         TEXT,
+    LOT_ID              TEXT,
+    WORK_ORDER_ID       TEXT,
+    ORDER_ITEM_ID       TEXT,
+    ITEM_ID             TEXT,
+    PROD_QTY            NUMERIC,
+    EVENT_ID            TEXT,
+    START_DT_HMS        TEXT,
+    END_DT_HMS          TEXT,
+    DUR                 NUMERIC
+);
+
+CREATE TABLE IF NOT EXISTS FS_SIM_SNAPSHOT (
+    PLAN_VER_ID         TEXT,
+    SIM_ID              TEXT,
+    TIME_INDEX          INTEGER,
+    SNAPSHOT_DT_HMS     TEXT,
+    EVENT_CNT           INTEGER
+);
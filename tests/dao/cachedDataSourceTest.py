@@ -0,0 +1,137 @@
+import os
+import tempfile
+import unittest
+
+from m4.ApplicationConfiguration import ApplicationConfiguration
+from m4.dao.AbstractDataSource import AbstractDataSource
+from m4.dao.AbstractSession import AbstractSession
+from m4.dao.CachedDataSource import CachedDataSource
+from m4.dao.DataSourceError import DataSourceError
+from m4.util.LogHandler import LogHandler
+
+# Application Configuration
+ApplicationConfiguration.instance().init(properties_file='m4.properties')
+
+# Setup Log Handler
+LogHandler.instance().init(config=ApplicationConfiguration.instance())
+
+
+class FakeSession(AbstractSession):
+    """
+    조회 횟수를 세는 테스트용 세션
+    """
+
+    def __init__(self, data_source):
+        self._data_source = data_source
+
+    def get_connection(self):
+        return None
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+    def select(self, sql: str, params: dict, arraysize: int = None, prefetchrows: int = None):
+        self._data_source.select_count += 1
+        if 'count(*)' in sql:
+            return {"columns": ["TABLE_NAME", "ROW_COUNT"], "data": [('FS_ROUTE', self._data_source.row_count)]}
+        return {"columns": ["SQL", "VALUE"], "data": [(sql, self._data_source.value)]}
+
+    def execute(self, sql_template: str, data_list: list):
+        return True
+
+    def execute_procedure(self, procedure_name: str, params):
+        return True
+
+
+class FakeDataSource(AbstractDataSource):
+
+    def __init__(self, value: str = 'A', row_count: int = 1):
+        self.value: str = value
+        self.row_count: int = row_count
+        self.select_count: int = 0
+
+    def get_session(self):
+        return FakeSession(self)
+
+    def release_session(self, session: object):
+        pass
+
+    def close(self):
+        pass
+
+
+class CachedDataSourceTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.config: ApplicationConfiguration = ApplicationConfiguration()
+        self.config._add('Cache', [('cache.directory', self.directory.name)])
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def _select(self, data_source: CachedDataSource, sql: str = "select 1", **params):
+        session = data_source.get_session()
+        try:
+            return session.select(sql, params)
+        finally:
+            session.close()
+
+    def test_save_and_reload(self):
+        origin: FakeDataSource = FakeDataSource()
+        cached: CachedDataSource = CachedDataSource()
+        cached.init(self.config, 'PLAN', 'SIM', origin)
+        self._select(cached, id='X')
+        self.assertTrue(os.path.exists(cached.save()))
+
+        origin.select_count = 0
+        cached = CachedDataSource()
+        cached.init(self.config, 'PLAN', 'SIM', origin)
+        result: dict = self._select(cached, id='X')
+        self.assertEqual(result["data"], [("select 1", 'A')])
+        # fingerprint 조회(계획 버전, 시뮬레이션, 기준 정보 행 수) 외에는 원본 Data Source 를 조회하지 않음
+        self.assertEqual(origin.select_count, 3)
+
+    def test_offline(self):
+        cached: CachedDataSource = CachedDataSource()
+        cached.init(self.config, 'PLAN', 'SIM', FakeDataSource())
+        self._select(cached)
+        cached.save()
+
+        offline: CachedDataSource = CachedDataSource()
+        offline.init(self.config, 'PLAN', 'SIM')
+        self.assertEqual(self._select(offline)["data"], [("select 1", 'A')])
+        self.assertRaises(DataSourceError, self._select, offline, "select 2")
+
+    def test_fingerprint_and_invalidate(self):
+        cached: CachedDataSource = CachedDataSource()
+        cached.init(self.config, 'PLAN', 'SIM', FakeDataSource('A'))
+        self._select(cached)
+        path_a: str = cached.save()
+
+        # 계획 버전/시뮬레이션 정보가 바뀌면 다른 snapshot 파일 사용
+        cached.init(self.config, 'PLAN', 'SIM', FakeDataSource('B'))
+        self.assertEqual(self._select(cached)["data"], [("select 1", 'B')])
+        path_b: str = cached.save()
+        self.assertNotEqual(path_b, path_a)
+
+        # 기준 정보 테이블 행 수가 바뀌어도 다른 snapshot 파일 사용
+        origin: FakeDataSource = FakeDataSource('B', row_count=2)
+        cached.init(self.config, 'PLAN', 'SIM', origin)
+        self.assertNotIn(cached.get_path(), (path_a, path_b))
+        self._select(cached)
+        self.assertEqual(origin.select_count, 4)
+        cached.save()
+
+        self.assertEqual(cached.invalidate(), 3)
+        self.assertRaises(DataSourceError, CachedDataSource().init, self.config, 'PLAN', 'SIM')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import datetime
+import os
+import tempfile
+import unittest
+
+from m4.ApplicationConfiguration import ApplicationConfiguration
+from m4.dao.CalendarDAO import CalendarDAO
+from m4.dao.FileDataSource import FileDataSource
+from m4.dao.SnapshotDAO import SnapshotDAO
+from m4.dao.WorkOrderDAO import WorkOrderDAO
+
+TABLES: dict = {
+    'CM_CALNDR': "YYYYMMDD,HLDAY_YN,DESCR,OFF_DAY_YN\n"
+                 "20200404,N,,Y\n"
+                 "20200405,Y,Holiday,Y\n"
+                 "20200406,N,,N\n",
+    'FS_WORK_ORDER': "PLAN_VER_ID,WORK_ORDER_ID,ORDER_ITEM_ID,PRIORITY,DTL_PRIORITY,ORDER_QTY,DUE_DT\n"
+                     "P1,0001,ITEM_A,1,1,10,20200410\n"
+                     "P1,0002,ITEM_A,2,1,0,20200411\n",
+    'FS_ROUTE': "SIM_ID,CURR_LOC_ID,CURR_LOC_TYP,NEXT_LOC_ID,NEXT_LOC_TYP,NEXT_ITEM_ID,ROUTE_CONN_CD\n"
+                "S1,PROC1,PROC,INV1,INV,ITEM_A,PDINV\n"
+}
+
+
+class FileDataSourceTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        for table, contents in TABLES.items():
+            with open(os.path.join(self.directory.name, f"{table}.csv"), 'w', encoding='utf-8') as file:
+                file.write(contents)
+
+        config: ApplicationConfiguration = ApplicationConfiguration()
+        config._add('FileSource', [('file.directory', self.directory.name),
+                                   ('file.output.directory', os.path.join(self.directory.name, 'output'))])
+        self.data_source: FileDataSource = FileDataSource()
+        self.data_source.init(config)
+        self.session = self.data_source.get_session()
+
+    def tearDown(self) -> None:
+        self.data_source.close()
+        self.directory.cleanup()
+
+    def test_select_work_order(self):
+        dao: WorkOrderDAO = WorkOrderDAO.instance()
+        work_orders: list = dao.map(dao.select(self.session, plan_version_id='P1'))
+        self.assertEqual(len(work_orders), 1)
+        self.assertEqual(work_orders[0]['WORK_ORDER_ID'], '0001')
+        self.assertEqual(work_orders[0]['ORDER_QTY'], 10)
+        self.assertEqual(work_orders[0]['DUE_DT'], datetime.datetime(2020, 4, 10, 23, 59, 59))
+        self.assertEqual(work_orders[0]['LOC_ID'], 'INV1')
+
+    def test_select_calendar_constraint(self):
+        dao: CalendarDAO = CalendarDAO.instance()
+        constraints: list = dao.map(dao.select_calendar_constraint(
+            self.session, start_date='20200401000000', end_date='20200410000000', off_day_yn='Y'))
+        self.assertEqual([row['TM_CONST_NM'] for row in constraints], ['주말', 'Holiday'])
+        self.assertEqual(constraints[1]['LOWER_BOUND'], datetime.datetime(2020, 4, 5))
+        self.assertEqual(constraints[1]['UPPER_BOUND'], datetime.datetime(2020, 4, 6))
+
+    def test_insert_and_write(self):
+        SnapshotDAO.instance().execute(self.session, [('P1', 'S1', 0, datetime.datetime(2020, 4, 1), 3)])
+        self.data_source.close()
+        with open(os.path.join(self.directory.name, 'output', 'FS_SIM_SNAPSHOT.csv'), encoding='utf-8-sig') as file:
+            self.assertEqual(file.read().splitlines(),
+                             ['PLAN_VER_ID,SIM_ID,TIME_INDEX,SNAPSHOT_DT_HMS,EVENT_CNT', 'P1,S1,0,20200401000000,3'])
+
+
+if __name__ == '__main__':
+    unittest.main()
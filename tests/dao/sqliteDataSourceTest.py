@@ -0,0 +1,58 @@
+import datetime
+import os
+import tempfile
+import unittest
+
+from m4.ApplicationConfiguration import ApplicationConfiguration
+from m4.dao.HIstoryDAO import HistoryDAO
+from m4.dao.SQLiteDataSource import SQLiteDataSource
+from m4.dao.SQLiteLoader import SQLiteLoader
+from m4.dao.WorkOrderDAO import WorkOrderDAO
+
+TABLES: dict = {
+    'FS_WORK_ORDER': "PLAN_VER_ID,WORK_ORDER_ID,ORDER_ITEM_ID,PRIORITY,DTL_PRIORITY,ORDER_QTY,DUE_DT,REMARK\n"
+                     "P1,0001,ITEM_A,1,1,10,20200410,first\n"
+                     "P1,0002,ITEM_A,2,1,0,20200411,\n",
+    'FS_ROUTE': "SIM_ID,CURR_LOC_ID,CURR_LOC_TYP,NEXT_LOC_ID,NEXT_LOC_TYP,NEXT_ITEM_ID,ROUTE_CONN_CD\n"
+                "S1,PROC1,PROC,INV1,INV,ITEM_A,PDINV\n"
+}
+
+
+class SQLiteDataSourceTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        for table, contents in TABLES.items():
+            with open(os.path.join(self.directory.name, f"{table}.csv"), 'w', encoding='utf-8') as file:
+                file.write(contents)
+
+        self.data_source: SQLiteDataSource = SQLiteDataSource()
+        self.data_source.init(ApplicationConfiguration(), database=os.path.join(self.directory.name, 'm4.db'))
+        self.session = self.data_source.get_session()
+
+    def tearDown(self) -> None:
+        self.session.close()
+        self.directory.cleanup()
+
+    def test_load_and_select(self):
+        # 같은 계획 버전을 다시 불러오면 행을 교체 (스키마에 없는 REMARK column 은 추가)
+        SQLiteLoader.load_csv_directory(self.session, self.directory.name)
+        counts: dict = SQLiteLoader.load_csv_directory(self.session, self.directory.name)
+        self.assertEqual(counts, {'FS_ROUTE': 1, 'FS_WORK_ORDER': 2})
+
+        dao: WorkOrderDAO = WorkOrderDAO.instance()
+        work_orders: list = dao.map(dao.select(self.session, plan_version_id='P1'))
+        self.assertEqual(len(work_orders), 1)
+        self.assertEqual(work_orders[0]['WORK_ORDER_ID'], '0001')
+        self.assertEqual(work_orders[0]['DUE_DT'], datetime.datetime(2020, 4, 10, 23, 59, 59))
+
+    def test_history_write(self):
+        rows: list = [('P1', 'S1', 'PROC1', 'RES1', 'INV1', 'LOT1', '0001', 'ITEM_A', 'ITEM_A', 10.0, 'E1',
+                       '20200401000000', '20200401010000', 1.0)] * 5
+        self.assertEqual(HistoryDAO.instance().execute(self.session, rows, chunk_size=2), 5)
+        result: dict = self.session.select("SELECT COUNT(*) FROM FS_SCHDL_RSLT_TEST", {})
+        self.assertEqual(result["data"], [(5,)])
+
+
+if __name__ == '__main__':
+    unittest.main()
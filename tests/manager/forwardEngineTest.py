@@ -0,0 +1,215 @@
+
+import datetime
+import unittest
+
+from m4.ApplicationConfiguration import ApplicationConfiguration
+from m4.util.LogHandler import LogHandler
+from m4.dao.AbstractSession import AbstractSession
+from m4.backward.BackwardStepPlan import BackwardStepPlan
+from m4.constraint.ScheduleConstraint import ScheduleConstraint
+from m4.manager.FactoryManager import FactoryManager
+from m4.manager.ScheduleManager import ScheduleManager
+from m4.operator.Factory import Factory
+from m4.operator.Inventory import Inventory
+from m4.operator.Process import Process
+from m4.operator.Resource import Resource
+from m4.operator.Route import Route
+from m4.operator.RouteAttribute import RouteAttribute
+from m4.FactorySimulator import FactorySimulator
+
+# Application Configuration
+ApplicationConfiguration.instance().init(properties_file='m4.properties')
+
+# Setup Log Handler
+LogHandler.instance().init(config=ApplicationConfiguration.instance())
+
+START_DATE: datetime.datetime = datetime.datetime(2020, 4, 1)
+END_DATE: datetime.datetime = datetime.datetime(2020, 4, 8)
+
+
+class CalendarSession(AbstractSession):
+    """
+    CM_CALNDR 조회 결과만 돌려주는 테스트용 Session - 주말(토, 일) 휴무
+    """
+
+    def get_connection(self):
+        return None
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+    def select(self, sql_template, params=None):
+        columns: list = ['START_DATE', 'END_DATE', 'PRIORITY', 'TM_CONST_NM', 'TM_CONST_TYP', 'PRD_TYP',
+                         'LOWER_BOUND', 'UPPER_BOUND']
+        data: list = []
+        day: datetime.datetime = START_DATE
+        while day < END_DATE:
+            if day.weekday() >= 5:
+                data.append((START_DATE, END_DATE, 0, 'WEEKEND', 'NOML', 'DAY',
+                             day, day + datetime.timedelta(days=1)))
+            day += datetime.timedelta(days=1)
+        return {"columns": columns, "data": data}
+
+    def execute(self, sql_template, data_list):
+        return True
+
+    def execute_procedure(self, procedure_name, params):
+        return True
+
+
+class SnapshotMonitor(object):
+    """
+    snapshot 호출 횟수만 세는 테스트용 SimulationMonitor
+    """
+
+    def __init__(self):
+        self.count: int = 0
+
+    def snapshot(self, time: dict = None):
+        self.count += 1
+
+
+def build_factory():
+    """
+    RM -> P1(R1, R2) -> PD 구조의 테스트용 Factory 구성
+    R1 은 DAY 비가용 일정, R2 는 점심시간(DAILY) 비가용 일정을 가짐
+    :return: ScheduleManager, FactoryManager
+    """
+    plan_version_dict: dict = {'PLAN_VER_ID': 'TEST',
+                               'START_DT_HMS': START_DATE.strftime('%Y%m%d%H%M%S'),
+                               'END_DT_HMS': END_DATE.strftime('%Y%m%d%H%M%S'),
+                               'UNIT_TM': 1, 'UNIT_TM_TYP': 'HOUR'}
+    schedule_manager: ScheduleManager = ScheduleManager()
+    schedule_manager.init(plan_version_dict, {'SIM_ID': 'TEST'}, CalendarSession())
+
+    inventories: dict = {}
+    for inv_id, inv_type in [('RM', 'RMINV'), ('PD', 'PDINV')]:
+        inventory: Inventory = Inventory()
+        inventory.init({'INV_ID': inv_id, 'INV_NM': inv_id, 'PLANT_ID': 'TEST', 'INV_TYP': inv_type, 'MAX_QTY': 0}, [])
+        inventories[inv_id] = inventory
+
+    schedules: dict = {
+        'R1': [{'START_DATE': START_DATE, 'END_DATE': END_DATE, 'RESC_ID': 'R1', 'SCHDL_ID': 'SD', 'PRIORITY': 1,
+                'TM_CONST_ID': 'SD1', 'TM_CONST_NM': 'SD1', 'TM_CONST_TYP': 'SHDWN', 'PRD_TYP': 'DAY',
+                'LOWER_BOUND': START_DATE + datetime.timedelta(days=1, hours=5),
+                'UPPER_BOUND': START_DATE + datetime.timedelta(days=1, hours=20)}],
+        'R2': [{'START_DATE': START_DATE, 'END_DATE': END_DATE, 'RESC_ID': 'R2', 'SCHDL_ID': 'SD', 'PRIORITY': 1,
+                'TM_CONST_ID': 'LUNCH', 'TM_CONST_NM': 'LUNCH', 'TM_CONST_TYP': 'SHDWN', 'PRD_TYP': 'DAILY',
+                'LOWER_BOUND': datetime.datetime(2020, 1, 1, 12), 'UPPER_BOUND': datetime.datetime(2020, 1, 1, 13)}]
+    }
+    process: Process = Process()
+    process.init({'PROC_ID': 'P1', 'PROC_NM': 'P1'})
+    for priority, (resource_id, process_time) in enumerate([('R1', 10), ('R2', 8)], start=1):
+        resource: Resource = Resource()
+        resource.init({'RESC_ID': resource_id, 'RESC_NM': resource_id, 'PLANT_ID': 'TEST'}, schedules[resource_id], 1)
+        process.add_process_resource({'PROC_ID': 'P1', 'RESC_ID': resource_id, 'BOR_NM': resource_id,
+                                      'PRIORITY': priority, 'PROD_EFFCNCY': 1, 'PROC_PRECSN': 0,
+                                      'MIN_LOT_SIZE': 10, 'MAX_LOT_SIZE': 500, 'UNIT_LOT_SIZE': 10,
+                                      'PROC_TM': process_time, 'PRE_PROC_SETUP_TM': 2, 'MAX_QUEUE_SIZE': 2},
+                                     resource, True)
+
+    nodes: dict = {'RM': inventories['RM'], 'P1': process, 'PD': inventories['PD']}
+    node_types: dict = {'RM': 'INV', 'P1': 'PROC', 'PD': 'INV'}
+    edges: list = [('RM', 'P1', 'A', 'B', 2), ('P1', 'PD', 'B', 'B', 3)]
+    routes: dict = {}
+    for location_id, node in nodes.items():
+        previous_route_dict: dict = {}
+        next_route_dict: dict = {}
+        for from_id, to_id, from_item_id, to_item_id, move_time in edges:
+            attribute: RouteAttribute = RouteAttribute(from_item_id, to_item_id, from_id, to_id,
+                                                       node_types[from_id], node_types[to_id],
+                                                       'N', 'X', 1, 1, move_time)
+            if to_id == location_id:
+                previous_route_dict.setdefault(from_item_id, []).append(('B', attribute, nodes[from_id]))
+            if from_id == location_id:
+                next_route_dict.setdefault(from_item_id, []).append(('B', attribute, nodes[to_id]))
+        route: Route = Route()
+        route.init(location_id, node_types[location_id], node,
+                   {edge[0]: nodes[edge[0]] for edge in edges if edge[1] == location_id},
+                   {edge[1]: nodes[edge[1]] for edge in edges if edge[0] == location_id},
+                   previous_route_dict, next_route_dict, True)
+        routes[location_id] = route
+
+    factory_constraint: ScheduleConstraint = ScheduleConstraint()
+    factory_constraint.init([], 0)
+    factory: Factory = Factory()
+    factory.init({'PLANT_ID': 'TEST', 'PLANT_NM': 'TEST', 'LOC_ID': 'TEST'}, factory_constraint,
+                 inventories, {'P1': process}, [], routes)
+
+    factory_manager: FactoryManager = FactoryManager()
+    factory_manager.init(factory)
+
+    work_orders: list = []
+    plans: dict = {location_id: [] for location_id in nodes}
+    for k in range(12):
+        work_order_id: str = f"WO{k:02d}"
+        quantity: float = 50 + 30 * (k % 4)
+        due_date: datetime.datetime = START_DATE + datetime.timedelta(days=2 + k % 4)
+        work_orders.append({'WORK_ORDER_ID': work_order_id, 'DUE_DT': due_date, 'ORDER_QTY': quantity})
+        for location_id, item_id, to_location_id in [('RM', 'A', 'P1'), ('P1', 'B', 'PD'), ('PD', 'B', None)]:
+            plan: BackwardStepPlan = BackwardStepPlan()
+            plan.init(work_order_id, 'B', quantity, quantity, 0, item_id, location_id, to_location_id,
+                      due_date, due_date - datetime.timedelta(hours=10 + k))
+            plans[location_id].append(plan)
+    factory_manager.init_work_order(work_orders)
+    factory_manager.init_derivative_information()
+    factory_manager.set_backward_step_plan(plans, START_DATE)
+
+    return schedule_manager, factory_manager
+
+
+class ForwardEngineTestCase(unittest.TestCase):
+
+    def _forward(self, engine: str):
+        schedule_manager, factory_manager = build_factory()
+        monitor: SnapshotMonitor = SnapshotMonitor()
+
+        simulator: FactorySimulator = FactorySimulator()
+        simulator._schedule_manager = schedule_manager
+        if engine == 'event':
+            simulator._forward_event(factory_manager, monitor)
+        else:
+            simulator._forward_tick(factory_manager, monitor)
+
+        finished: dict = {route_id: [plan.work_order_id for plan in route._order_items_finished]
+                          for route_id, route in factory_manager.get_factory().get_route_list().items()}
+        return factory_manager.get_resource_history('TEST', 'TEST'), finished, monitor.count
+
+    def test_event_engine_parity(self):
+        """
+        event 방식 Forward 결과(Resource History, 완료 Plan)가 tick 방식과 동일한지 확인
+        :return: void
+        """
+        tick_history, tick_finished, tick_count = self._forward('tick')
+        event_history, event_finished, event_count = self._forward('event')
+
+        self.assertTrue(tick_history)
+        self.assertEqual(tick_history, event_history)
+        self.assertEqual(tick_finished, event_finished)
+        self.assertLess(event_count, tick_count)
+
+    def test_transfer_after_schedule_boundary(self):
+        """
+        Resource 일정 제약으로 할당하지 못한 Route 가 Node 상태 변경 없이도 일정 제약 경계 이후 다시 transfer 되는지 확인
+        2일차 12시 ~ 13시는 R1(DAY), R2(LUNCH) 모두 비가용
+        :return: void
+        """
+        schedule_manager, factory_manager = build_factory()
+        process: Process = factory_manager.get_factory().get_process('P1')
+        lunch: datetime.datetime = START_DATE + datetime.timedelta(days=1, hours=12)
+
+        factory_manager.transfer({'index': 36, 'date': lunch, 'is_off_day': False})
+        self.assertEqual(process.get_event_count(), 0)
+
+        factory_manager.transfer({'index': 37, 'date': lunch + datetime.timedelta(hours=1), 'is_off_day': False})
+        self.assertGreater(process.get_event_count(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import datetime
+import unittest
+
+from m4.ApplicationConfiguration import ApplicationConfiguration
+from m4.util.LogHandler import LogHandler
+from m4.operator.Inventory import Inventory
+from m4.process.Item import Item
+
+# Application Configuration
+ApplicationConfiguration.instance().init(properties_file='m4.properties')
+
+# Setup Log Handler
+LogHandler.instance().init(config=ApplicationConfiguration.instance())
+
+DATE: datetime.datetime = datetime.datetime(2020, 4, 17)
+
+
+class InventoryTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.inventory: Inventory = Inventory()
+        self.inventory.init({'INV_ID': 'IP', 'INV_NM': 'IP', 'PLANT_ID': 'TEST', 'INV_TYP': 'IPINV', 'MAX_QTY': 0}, [])
+
+    def _put(self, quantity: float) -> Item:
+        item: Item = Item()
+        item.init(item_id='A', location_id='IP', quantity=quantity, work_order_id='WO01', order_item_id='B')
+        self.inventory.put(0, DATE, item, 0, 'IP')
+        return item
+
+    def test_fetch_after_cut(self):
+        """
+        cut 이후 남은 재고 전체를 fetch 할 수 있는지 확인
+        누적 합계로 관리하면 0.8 + 4.3 + 3.8 - 0.3 = 8.599999999999998 이 되어 8.6 을 fetch 하지 못함
+        :return: void
+        """
+        for quantity in (0.8, 4.3, 3.8):
+            self._put(quantity)
+
+        fetched: list = self.inventory.fetch(1, DATE, 'A', 'WO01', 0.3)
+        self.assertEqual([item.get_quantity() for item in fetched], [0.3])
+
+        fetched = self.inventory.fetch(2, DATE, 'A', 'WO01', 8.6)
+        self.assertEqual(len(fetched), 3)
+        self.assertEqual(self.inventory.get_items('A', 'WO01'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
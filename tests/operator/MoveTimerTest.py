@@ -0,0 +1,68 @@
+import datetime
+import unittest
+
+from m4.operator.MoveTimer import MoveTimer
+from m4.operator.Runtime import Runtime
+from m4.process.Item import Item
+
+DATE: datetime.datetime = datetime.datetime(2020, 4, 17)
+
+
+class MoveTimerTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.timer: MoveTimer = MoveTimer()
+
+    def _schedule(self, start: int, length: int, node: str = None) -> Runtime:
+        runtime: Runtime = Runtime(Item(), start, DATE, length)
+        self.timer.schedule(runtime, node)
+        return runtime
+
+    def test_schedule_out_of_order(self):
+        late: Runtime = self._schedule(0, 5, 'INV1')
+        early: Runtime = self._schedule(1, 2, 'INV2')
+        self.assertEqual(len(self.timer), 2)
+        self.assertEqual(self.timer.get_next_clock(), 3)
+
+        # 도착 clock 이전에는 꺼내지 않음
+        self.assertEqual(self.timer.pop(2), [])
+        self.assertEqual([(node, runtime) for _, node, runtime in self.timer.pop(3)], [('INV2', early)])
+        self.assertEqual(self.timer.get_next_clock(), 5)
+        self.assertEqual([runtime for _, _, runtime in self.timer.pop(5)], [late])
+        self.assertEqual(len(self.timer), 0)
+        self.assertIsNone(self.timer.get_next_clock())
+
+    def test_pop_multiple_buckets_in_registration_order(self):
+        # 등록 순서 : a(도착 6) -> b(도착 4) -> c(도착 6) -> d(도착 5)
+        a: Runtime = self._schedule(0, 6)
+        b: Runtime = self._schedule(1, 3)
+        c: Runtime = self._schedule(2, 4)
+        d: Runtime = self._schedule(3, 2)
+
+        # 여러 bucket 을 한 번에 꺼내도 도착 clock 순이 아닌 등록 순서
+        self.assertEqual([runtime for _, _, runtime in self.timer.pop(6)], [a, b, c, d])
+        self.assertEqual(len(self.timer), 0)
+
+    def test_partial_pop(self):
+        self._schedule(0, 2)
+        self._schedule(0, 2)
+        self._schedule(0, 4)
+        last: Runtime = self._schedule(0, 7)
+
+        self.assertEqual(len(self.timer.pop(2)), 2)
+        self.assertEqual(len(self.timer), 2)
+        self.assertEqual(self.timer.get_next_clock(), 4)
+
+        self.assertEqual(len(self.timer.pop(5)), 1)
+        self.assertEqual(len(self.timer), 1)
+        self.assertEqual(self.timer.get_next_clock(), 7)
+
+        # 같은 clock 에 새로 등록된 Runtime 은 기존 bucket 뒤에 추가
+        added: Runtime = self._schedule(3, 4)
+        self.assertEqual(len(self.timer), 2)
+        self.assertEqual([runtime for _, _, runtime in self.timer.pop(7)], [last, added])
+        self.assertIsNone(self.timer.get_next_clock())
+
+
+if __name__ == '__main__':
+    unittest.main()
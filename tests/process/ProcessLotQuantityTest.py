@@ -0,0 +1,150 @@
+import datetime
+import unittest
+
+from m4.ApplicationConfiguration import ApplicationConfiguration
+from m4.operator.process.ProcessLot import ProcessLot
+from m4.process.Item import Item
+from m4.process.ItemEventLog import ItemEventLog
+from m4.util.LogHandler import LogHandler
+
+# Application Configuration
+ApplicationConfiguration.instance().init(properties_file='m4.properties')
+
+# Setup Log Handler
+LogHandler.instance().init(config=ApplicationConfiguration.instance())
+
+START_DATE: datetime.datetime = datetime.datetime(2020, 4, 17)
+
+
+class ProcessLotQuantityTestCase(unittest.TestCase):
+    """
+    ProcessLot 단계(MOVE / QUEUE / PROCESS / WAIT) 별 누적 수량이
+    실제 보관 중인 Item 들의 수량 합계와 일치하는지 확인
+    """
+
+    def setUp(self) -> None:
+        ItemEventLog.instance().init(ItemEventLog.TRACE_FULL)
+        self.process_lot: ProcessLot = ProcessLot()
+        self.process_lot.init({'PROC_ID': 'P1', 'RESC_ID': 'R1', 'BOR_NM': 'R1', 'MAX_QUEUE_SIZE': 10})
+        self.time_index: int = 0
+
+    @staticmethod
+    def _item(item_id: str, work_order_id: str, quantity: float, setup_time: int, process_time: int) -> Item:
+        item: Item = Item()
+        item.init(item_id, 'R1', quantity, work_order_id, 'END', setup_time=setup_time, process_time=process_time)
+        return item
+
+    def _date(self) -> datetime.datetime:
+        return START_DATE + datetime.timedelta(hours=self.time_index)
+
+    def _held_quantities(self) -> dict:
+        """
+        ProcessLot 내부 보관 Item 들을 직접 순회하여 계산한 단계 별 수량
+        :return: { (item_id, work_order_id): [move, queue, process, wait] }
+        """
+        process_lot: ProcessLot = self.process_lot
+        stages: list = [
+            [entry[2].get_item() for bucket in process_lot._moves._buckets.values() for entry in bucket] +
+            [entry[2].get_item() for entry in process_lot._arrived],
+            [lot.get_item() for lot in process_lot._queue],
+            [] if process_lot._lot is None else [process_lot._lot.get_item()],
+            [item for items in process_lot._waits.values() for item in items.values()]
+        ]
+        quantities: dict = {}
+        for index, items in enumerate(stages):
+            for item in items:
+                quantities.setdefault((item.item_id, item.work_order_id), [0, 0, 0, 0])[index] += item.get_quantity()
+        return quantities
+
+    def _assert_quantities(self, keys: list):
+        held: dict = self._held_quantities()
+        for item_id, work_order_id in keys:
+            expected: list = held.get((item_id, work_order_id), [0, 0, 0, 0])
+            actual: list = [self.process_lot.get_move_quantity(item_id, work_order_id),
+                            self.process_lot.get_queue_quantity(item_id, work_order_id),
+                            self.process_lot.get_process_quantity(item_id, work_order_id),
+                            self.process_lot.get_wait_quantity(item_id, work_order_id)]
+            self.assertEqual(actual, expected, (self.time_index, item_id, work_order_id))
+            self.assertEqual(self.process_lot.get_quantity(item_id, work_order_id), sum(expected))
+
+    def _put(self, item: Item, move_time: int):
+        self.process_lot.put(self.time_index, self._date(), item, move_time)
+
+    def _run(self):
+        self.time_index += 1
+        self.process_lot.run(self.time_index, self._date(), False, None)
+
+    def test_stage_quantities(self):
+        keys: list = [('A', 'WO1'), ('A', 'WO2'), ('B', 'WO1')]
+
+        # 대기 없이 put : SETUP 으로 바로 시작
+        self._put(self._item('A', 'WO1', 10, setup_time=1, process_time=2), move_time=0)
+        self._assert_quantities(keys)
+        self.assertEqual(self.process_lot.status, "SETUP")
+
+        # 처리 중일 때 put : QUEUE 대기 (setup 없음)
+        self._put(self._item('A', 'WO2', 5, setup_time=0, process_time=1), move_time=0)
+        self._assert_quantities(keys)
+
+        # 이동 시간이 있는 put : MOVE
+        self._put(self._item('B', 'WO1', 7, setup_time=2, process_time=1), move_time=2)
+        self._put(self._item('A', 'WO1', 3, setup_time=0, process_time=1), move_time=1)
+        self._assert_quantities(keys)
+
+        # 모든 Lot 의 이동 / SETUP / PROCESS 가 끝날 때까지 run
+        while self.process_lot.status != "IDLE" or self.process_lot._queue.length() > 0 or len(self.process_lot._moves):
+            self._run()
+            self._assert_quantities(keys)
+            self.assertLess(self.time_index, 50)
+
+        self.assertEqual(self.process_lot.get_wait_quantity('A', 'WO1'), 13)
+        self.assertEqual(self.process_lot.get_wait_quantity('A', 'WO2'), 5)
+        self.assertEqual(self.process_lot.get_wait_quantity('B', 'WO1'), 7)
+
+        # Cut 이 필요한 fetch
+        fetched: list = self.process_lot.fetch(self.time_index, self._date(), 'A', 'WO1', 4)
+        self.assertEqual(sum(item.get_quantity() for item in fetched), 4)
+        self._assert_quantities(keys)
+
+        # 남은 수량 전체 fetch
+        fetched = self.process_lot.fetch(self.time_index, self._date(), 'A', 'WO1', 9)
+        self.assertEqual(sum(item.get_quantity() for item in fetched), 9)
+        self._assert_quantities(keys)
+
+        fetched = self.process_lot.fetch(self.time_index, self._date(), 'B', 'WO1', 7)
+        self.assertEqual(len(fetched), 1)
+        self._assert_quantities(keys)
+
+        # 대기 수량이 모자라는 fetch 는 아무것도 가져오지 않음
+        self.assertEqual(self.process_lot.fetch(self.time_index, self._date(), 'A', 'WO2', 6), [])
+        self._assert_quantities(keys)
+        self.assertEqual(self.process_lot.get_quantity('A', 'WO1'), 0)
+        self.assertEqual(self.process_lot._waits.get(('A', 'WO1')), None)
+
+    def test_fractional_cut(self):
+        """
+        실수 수량 cut 이후에도 WAIT 수량이 남은 Item 들의 합계와 일치하여 남은 수량 전체를 fetch 할 수 있는지 확인
+        누적 합계로 관리하면 0.8 + 4.3 + 3.8 - 0.3 = 8.599999999999998 이 되어 8.6 을 fetch 하지 못함
+        :return: void
+        """
+        keys: list = [('A', 'WO1')]
+        for quantity in (0.8, 4.3, 3.8):
+            self._put(self._item('A', 'WO1', quantity, setup_time=0, process_time=1), move_time=0)
+        while self.process_lot.status != "IDLE" or self.process_lot._queue.length() > 0:
+            self._run()
+            self.assertLess(self.time_index, 50)
+        self._assert_quantities(keys)
+
+        fetched: list = self.process_lot.fetch(self.time_index, self._date(), 'A', 'WO1', 0.3)
+        self.assertEqual([item.get_quantity() for item in fetched], [0.3])
+        self._assert_quantities(keys)
+        self.assertEqual(self.process_lot.get_wait_quantity('A', 'WO1'), 8.6)
+
+        fetched = self.process_lot.fetch(self.time_index, self._date(), 'A', 'WO1', 8.6)
+        self.assertEqual(len(fetched), 3)
+        self._assert_quantities(keys)
+        self.assertEqual(self.process_lot._waits.get(('A', 'WO1')), None)
+
+
+if __name__ == '__main__':
+    unittest.main()